@@ -0,0 +1,80 @@
+"""
+Measures array items validation of `CompiledEventValidator` on long arrays, against
+a naive check of every element type in a python loop.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.array_items
+"""
+
+import time
+
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality.event.event import FieldType, get_field_type
+from itidigital.data_quality.event.validator import CompiledEventValidator
+
+_NUM_ELEMENTS = 100_000
+_REPEAT = 20
+
+
+def _schema(items: dict) -> dict:
+    """Raw schema with a single array field"""
+    return {
+        "$id": "http://example.com/example.json",
+        "type": "object",
+        "properties": {
+            "values": {"$id": "#/properties/values", "type": "array", "items": items}
+        }
+    }
+
+
+def _naive_is_valid(event: dict, expected_type: FieldType) -> bool:
+    """Checks every element one by one"""
+    if expected_type is FieldType.OBJECT:
+        return all(
+            type(value) is dict and value.keys() == {"id"} and get_field_type(value["id"]) is FieldType.INTEGER
+            for value in event["values"]
+        )
+
+    return all(get_field_type(value) is expected_type for value in event["values"])
+
+
+def _best_milliseconds(func) -> float:
+    """Fastest of `_REPEAT` calls, in milliseconds"""
+    best = float('inf')
+
+    for _ in range(_REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best * 1000
+
+
+def main() -> None:
+    cases = [
+        ('integers', {"type": "integer"}, list(range(_NUM_ELEMENTS)), FieldType.INTEGER),
+        ('strings', {"type": "string"}, [str(index) for index in range(_NUM_ELEMENTS)], FieldType.STRING),
+        (
+            'objects',
+            {"type": "object", "properties": {"id": {"$id": "id", "type": "integer"}}},
+            [{"id": index} for index in range(_NUM_ELEMENTS)],
+            FieldType.OBJECT
+        )
+    ]
+
+    for label, items, values, expected_type in cases:
+        validator = CompiledEventValidator(schema=SchemaBuilder(config=_schema(items)).construct())
+        event = {"values": values}
+
+        assert validator.is_valid(event)
+
+        print(
+            f"{_NUM_ELEMENTS:,} {label:<10} "
+            f"naive {_best_milliseconds(lambda: _naive_is_valid(event, expected_type)):>8.2f} ms   "
+            f"compiled {_best_milliseconds(lambda: validator.is_valid(event)):>8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares each builder `construct` against the previous reflective implementation,
+which looked up `get_<field>` getters by name for every constructed object.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.builders
+"""
+
+from benchmarks.timing import measure, report
+from itidigital.utils.schema.builder import SchemaBuilder, SchemaFieldBuilder, ObjectFieldBuilder
+from itidigital.data_quality.event.builder import EventBuilder, EventFieldBuilder
+
+_NUM_OBJECTS = 50_000
+_EVENT = {
+    "eid": "3e628a05-7a4a-4bf3-8770-084c11601a12",
+    "documentNumber": "42323235600",
+    "name": "Joseph",
+    "age": 32,
+    "address": {"street": "St. Blue", "number": 3, "mailAddress": True}
+}
+_SCHEMA_FIELD = {
+    "$id": "#/properties/eid",
+    "type": "string",
+    "title": "The eid schema",
+    "description": "An explanation about the purpose of this instance.",
+    "examples": ["3e628a05-7a4a-4bf3-8770-084c11601a12"]
+}
+_OBJECT_FIELD = {
+    "$id": "#/properties/address",
+    "type": "object",
+    "title": "The address schema",
+    "description": "An explanation about the purpose of this instance.",
+    "required": ["street"],
+    "properties": {"street": {**_SCHEMA_FIELD, "$id": "#/properties/address/properties/street"}}
+}
+_SCHEMA = {**_OBJECT_FIELD, "$schema": "http://json-schema.org/draft-07/schema", "$id": "http://example.com/example.json"}
+
+
+def _reflective_construct(builder):
+    """Constructs the builder product looking getters up by name, like builders used to"""
+    kwargs = {}
+
+    for field, definition in builder.product.__dataclass_fields__.items():
+        if definition.init:
+            method = getattr(builder, f'get_{field}')
+            kwargs[field] = method()
+
+    return builder.product(**kwargs)
+
+
+def main() -> None:
+    cases = [
+        (EventFieldBuilder, {"name": "name", "value": "Joseph"}),
+        (EventBuilder, _EVENT),
+        (SchemaFieldBuilder, _SCHEMA_FIELD),
+        (ObjectFieldBuilder, _OBJECT_FIELD),
+        (SchemaBuilder, _SCHEMA),
+    ]
+
+    for builder_class, config in cases:
+        builders = [builder_class(config=config) for _ in range(_NUM_OBJECTS)]
+
+        report(f'{builder_class.__name__} reflective', measure(_reflective_construct, builders), 'objects')
+        report(f'{builder_class.__name__} planned', measure(builder_class.construct, builders), 'objects')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compares `EventValidator` and `CompiledEventValidator` throughput on the
+`data_quality/schema.json` shape.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.event_validator
+"""
+
+import os
+
+from benchmarks.timing import measure, report
+from itidigital import variables
+from itidigital.utils.schema import helpers
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality.event.builder import EventBuilder
+from itidigital.data_quality.event.cache import ShapeCachedEventValidator
+from itidigital.data_quality.event.validator import (
+    EventValidator,
+    CompiledEventValidator,
+    FingerprintEventValidator,
+    ValidationMode
+)
+
+_SCHEMA_FILE_PATH = os.path.join(
+    variables.PROJECT_ROOT_PATH,
+    'itidigital/data_quality/schema.json'
+)
+_NUM_EVENTS = 20_000
+
+
+def _make_events(count: int) -> list:
+    """Builds valid events following the `data_quality/schema.json` shape"""
+    return [
+        {
+            "eid": f"3e628a05-7a4a-4bf3-8770-{index:012d}",
+            "documentNumber": str(42323235600 + index),
+            "name": "Joseph",
+            "age": index % 100,
+            "address": {
+                "street": "St. Blue",
+                "number": index,
+                "mailAddress": bool(index % 2)
+            }
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    raw_schema = helpers.load_schema(_SCHEMA_FILE_PATH)
+    schema = SchemaBuilder(config=raw_schema).construct()
+    optional_name_schema = SchemaBuilder(
+        config={**raw_schema, "required": [name for name in raw_schema["required"] if name != "name"]}
+    ).construct()
+    events = _make_events(_NUM_EVENTS)
+    invalid_events = [{**event, "age": str(event["age"]), "name": None} for event in events]
+
+    reference = EventValidator(schema=schema)
+    compiled = CompiledEventValidator(schema=schema)
+    compiled_schema_mode = CompiledEventValidator(schema=schema, mode=ValidationMode.SCHEMA)
+    compiled_optional_name = CompiledEventValidator(schema=optional_name_schema, mode=ValidationMode.SCHEMA)
+    fingerprint = FingerprintEventValidator(schemas=[schema])
+    shape_cached = ShapeCachedEventValidator(validator=reference)
+
+    report(
+        'EventValidator (reference)',
+        measure(lambda event: reference.is_valid(EventBuilder(config=event).construct()), events)
+    )
+    report(
+        'ShapeCachedEventValidator',
+        measure(shape_cached.is_valid, events)
+    )
+    report(
+        'CompiledEventValidator',
+        measure(compiled.is_valid, events)
+    )
+    report(
+        'CompiledEventValidator.validate',
+        measure(compiled.validate, events)
+    )
+    report(
+        'CompiledEventValidator.validate invalid',
+        measure(compiled.validate, invalid_events)
+    )
+    report(
+        'CompiledEventValidator.validate fail fast',
+        measure(lambda event: compiled.validate(event, fail_fast=True), invalid_events)
+    )
+    report(
+        'CompiledEventValidator (schema mode)',
+        measure(compiled_schema_mode.is_valid, events)
+    )
+    report(
+        'CompiledEventValidator (optional key)',
+        measure(compiled_optional_name.is_valid, events)
+    )
+    report(
+        'FingerprintEventValidator',
+        measure(fingerprint.is_valid, events)
+    )
+
+
+if __name__ == "__main__":
+    main()
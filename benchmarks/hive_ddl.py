@@ -0,0 +1,68 @@
+"""
+Measures DDL rendering of `HiveTable` for 10k tables with the process wide compiled
+template, against building a jinja environment and compiling `ddl.txt` for every
+table, like `ddl_statement` used to.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.hive_ddl
+"""
+
+import jinja2
+
+from benchmarks.timing import measure, report
+from itidigital.sql.athena.hive import table
+from itidigital.sql.athena.hive.table import HiveTable
+from itidigital.sql.athena.hive.properties import CreateDisposition, FileFormat, TableReference
+
+_NUM_TABLES = 10_000
+
+
+def _hive_table(index: int) -> HiveTable:
+    """Builds a table with a few plain and nested fields"""
+    return HiveTable(
+        create_disposition=CreateDisposition.IF_NOT_EXISTS,
+        table_reference=TableReference(database='itidigital', table_name=f'table_{index}'),
+        fields={
+            "eid": {"type": "string"},
+            "age": {"type": "integer"},
+            "address": {"type": "struct", "fields": {"street": {"type": "string"}, "number": {"type": "integer"}}},
+            "tags": {"type": "array", "items": {"type": "string"}}
+        },
+        is_external=True,
+        location=f's3://my-bucket/table_{index}/',
+        stored_as=FileFormat.PARQUET,
+        partition_by=['eid'],
+        table_properties={"classification": "parquet"}
+    )
+
+
+def _render_with_new_environment(hive_table: HiveTable) -> str:
+    """Renders the DDL compiling the template again"""
+    env = jinja2.Environment(loader=jinja2.FileSystemLoader(searchpath=table._TEMPLATE_PATH))
+
+    return env.get_template(name='ddl.txt').render(
+        table_type=hive_table.table_type,
+        creation_disposition=hive_table.create_disposition,
+        table_name=hive_table.table_name,
+        fields=hive_table.fields,
+        comment=hive_table.comment,
+        partition_by=hive_table.partition_by,
+        clustered_by=hive_table.clustered_by,
+        num_buckets=hive_table.num_buckets,
+        row_format=hive_table.row_format,
+        stored_as=hive_table.stored_as,
+        location=hive_table.location,
+        table_properties=hive_table.table_properties
+    )
+
+
+def main() -> None:
+    tables = [_hive_table(index) for index in range(_NUM_TABLES)]
+
+    report('environment + compile per table', measure(_render_with_new_environment, tables, repeat=1), 'tables')
+    report('shared compiled template', measure(lambda hive_table: hive_table.ddl_statement, tables), 'tables')
+
+
+if __name__ == "__main__":
+    main()
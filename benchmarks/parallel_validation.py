@@ -0,0 +1,58 @@
+"""
+Measures how `ParallelEventValidator` scales with the number of worker processes
+on a newline-delimited JSON file following the `data_quality/schema.json` shape.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.parallel_validation
+"""
+
+import os
+import json
+import time
+import tempfile
+
+from benchmarks.event_validator import _make_events
+from itidigital import variables
+from itidigital.utils.schema import helpers
+from itidigital.data_quality.parallel import ParallelEventValidator
+
+_SCHEMA_FILE_PATH = os.path.join(
+    variables.PROJECT_ROOT_PATH,
+    'itidigital/data_quality/schema.json'
+)
+_NUM_EVENTS = 500_000
+_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def main() -> None:
+    raw_schema = helpers.load_schema(_SCHEMA_FILE_PATH)
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, 'events.ndjson')
+
+        with open(input_path, 'w') as file:
+            for event in _make_events(_NUM_EVENTS):
+                file.write(json.dumps(event) + '\n')
+
+        baseline = None
+
+        for workers in worker_counts:
+            validator = ParallelEventValidator(
+                raw_schema=raw_schema,
+                max_workers=workers,
+                chunk_size=_CHUNK_SIZE
+            )
+
+            start = time.perf_counter()
+            with open(os.devnull, 'wb') as output:
+                validator.validate_file(input_path=input_path, valid_output=output, invalid_output=output)
+            per_second = _NUM_EVENTS / (time.perf_counter() - start)
+
+            baseline = baseline or per_second
+            print(f"{workers:>2} workers {per_second:>14,.0f} events/s {per_second / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
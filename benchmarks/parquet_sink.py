@@ -0,0 +1,73 @@
+"""
+Measures writing 100k validated events with `ParquetEventSink`, partitioned by name,
+against writing them as newline-delimited JSON, and compares output sizes.
+Requires `pyarrow`.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.parquet_sink
+"""
+
+import os
+import copy
+import tempfile
+
+from benchmarks.timing import measure, report
+from itidigital.sql.sink import ParquetEventSink
+from itidigital.utils import serialization
+from itidigital.utils.schema.builder import SchemaBuilder
+
+from tests.test_data import examples
+
+_NUM_EVENTS = 100_000
+
+
+def _events() -> list:
+    """Builds events with a few distinct names and varying ages"""
+    events = []
+
+    for index in range(_NUM_EVENTS):
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        event['name'] = f'name_{index % 8}'
+        event['age'] = index % 100
+        events.append(event)
+
+    return events
+
+
+def _directory_size(path: str) -> int:
+    """Sums the size of every file under a directory"""
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def main() -> None:
+    schema = SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+    events = _events()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        ndjson_path = os.path.join(output_dir, 'events.ndjson')
+
+        def write_ndjson(batch: list) -> None:
+            with open(ndjson_path, 'wb') as output:
+                for event in batch:
+                    output.write(serialization.dumps_bytes(event) + b'\n')
+
+        def write_parquet(batch: list) -> None:
+            with ParquetEventSink(
+                    schema=schema, base_path=os.path.join(output_dir, 'parquet'), partition_by=['name']
+            ) as sink:
+                sink.write_many(batch)
+
+        report('ndjson', measure(write_ndjson, [events], repeat=1) * _NUM_EVENTS)
+        report('parquet, snappy, 8 partitions', measure(write_parquet, [events], repeat=1) * _NUM_EVENTS)
+
+        print(f"ndjson size: {os.path.getsize(ndjson_path):,} bytes")
+        print(f"parquet size: {_directory_size(os.path.join(output_dir, 'parquet')):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares the per-event latency of sending events to SQS creating a client and
+resolving the queue URL on every call against the shared client and cached
+queue URL used by `send_event_to_queue`. SQS is mocked with moto.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.send_event_to_queue
+"""
+
+import io
+import json
+import contextlib
+
+import boto3
+from moto import mock_sqs
+
+from benchmarks.timing import measure
+import itidigital.data_quality.event_validator as event_validator
+
+_QUEUE_NAME = 'valid-events-queue'
+_NUM_EVENTS = 300
+_EVENT = {
+    "eid": "3e628a05-7a4a-4bf3-8770-084c11601a12",
+    "documentNumber": "42323235600",
+    "name": "Joseph",
+    "age": 32,
+    "address": {
+        "street": "St. Blue",
+        "number": 3,
+        "mailAddress": True
+    }
+}
+
+
+def _send_with_new_client(event: dict) -> None:
+    """Sends an event the way `send_event_to_queue` used to, with a client per call"""
+    sqs_client = boto3.client("sqs", region_name="us-east-1")
+    queue_url = sqs_client.get_queue_url(QueueName=_QUEUE_NAME)['QueueUrl']
+    sqs_client.send_message(QueueUrl=queue_url, MessageBody=json.dumps(event))
+
+
+def _send_with_cached_client(event: dict) -> None:
+    """Sends an event with the shared client and cached queue URL"""
+    event_validator.send_event_to_queue(event=event, queue_name=_QUEUE_NAME)
+
+
+def main() -> None:
+    events = [_EVENT] * _NUM_EVENTS
+
+    for label, func in [
+        ('new client + get_queue_url per event', _send_with_new_client),
+        ('shared client + cached queue URL', _send_with_cached_client),
+    ]:
+        with mock_sqs(), contextlib.redirect_stdout(io.StringIO()):
+            boto3.client('sqs', region_name='us-east-1').create_queue(QueueName=_QUEUE_NAME)
+            event_validator._SQS_CLIENT = None
+            event_validator._QUEUE_URLS.invalidate()
+
+            latency_ms = 1000 / measure(func, events, repeat=1)
+
+        print(f"{label:<40} {latency_ms:>10.3f} ms/event")
+
+
+if __name__ == "__main__":
+    main()
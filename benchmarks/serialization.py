@@ -0,0 +1,29 @@
+"""
+Compares the JSON backends of `itidigital.utils.serialization` decoding events from
+`bytes`, as they come from SQS and files, and encoding them to `str` message bodies.
+Only installed backends are measured.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.serialization
+"""
+
+from benchmarks.timing import measure, report
+from itidigital.utils import serialization
+
+from tests.test_data import examples
+
+_NUM_EVENTS = 20_000
+
+
+def main() -> None:
+    events = [examples.EXAMPLE_EVENT, examples.EXAMPLE_ARRAY_EVENT] * (_NUM_EVENTS // 2)
+    payloads = [serialization.get_backend('json').dumps_bytes(event) for event in events]
+
+    for backend in serialization.available_backends():
+        report(f'{backend.name} loads(bytes)', measure(backend.loads, payloads))
+        report(f'{backend.name} dumps', measure(backend.dumps, events))
+
+
+if __name__ == "__main__":
+    main()
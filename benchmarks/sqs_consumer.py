@@ -0,0 +1,76 @@
+"""
+Measures the end-to-end throughput of `AsyncEventConsumer`: receiving events from an
+input queue, validating them, sending them to the valid and invalid events queues and
+deleting them from the input queue. Every tenth event is invalid.
+
+SQS is mocked in process with moto, unless `SQS_ENDPOINT_URL` points to a running
+stand-in, like `moto_server -p 5000`. An in process mock serializes every call, so only
+an endpoint shows the effect of concurrent workers.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.sqs_consumer
+    $ SQS_ENDPOINT_URL=http://localhost:5000 poetry run python3 -m benchmarks.sqs_consumer
+"""
+
+import os
+import json
+import asyncio
+import contextlib
+
+from moto import mock_sqs
+
+from benchmarks.timing import report
+from itidigital.utils.aws import sqs
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality.consumer import AsyncEventConsumer
+from itidigital.data_quality.event.validator import CompiledEventValidator
+
+from tests.test_data import examples
+
+_NUM_EVENTS = 300
+_QUEUE_NAMES = ['input-queue', 'valid-events-queue', 'invalid-events-queue']
+
+
+def _fill_input_queue(sqs_client) -> None:
+    """Creates or purges the queues and sends the benchmark events to the input queue"""
+    for queue_name in _QUEUE_NAMES:
+        sqs_client.purge_queue(QueueUrl=sqs_client.create_queue(QueueName=queue_name)['QueueUrl'])
+
+    invalid_event = {**examples.EXAMPLE_EVENT, 'age': 'thirty two'}
+    entries = [
+        {'Id': str(index), 'MessageBody': json.dumps(invalid_event if index % 10 == 0 else examples.EXAMPLE_EVENT)}
+        for index in range(_NUM_EVENTS)
+    ]
+    sqs.send_message_batch(
+        sqs_client=sqs_client,
+        queue_url=sqs_client.get_queue_url(QueueName='input-queue')['QueueUrl'],
+        entries=entries
+    )
+
+
+def main() -> None:
+    endpoint_url = os.environ.get('SQS_ENDPOINT_URL')
+    validator = CompiledEventValidator(schema=SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct())
+
+    with contextlib.nullcontext() if endpoint_url else mock_sqs():
+        sqs_client = sqs.create_sqs_client(endpoint_url=endpoint_url)
+
+        for pollers, workers in [(1, 1), (2, 4)]:
+            _fill_input_queue(sqs_client)
+
+            consumer = AsyncEventConsumer(
+                sqs_client=sqs_client,
+                input_queue_name='input-queue',
+                validator=validator,
+                pollers=pollers,
+                workers=workers,
+                wait_time_seconds=0
+            )
+            stats = asyncio.run(consumer.run(stop_when_empty=True))
+
+            report(f'{pollers} pollers, {workers} workers', stats.throughput)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Module with helpers shared by benchmark scripts"""
+
+import time
+from typing import Callable, Iterable
+
+
+def measure(func: Callable, items: Iterable, repeat: int = 3) -> float:
+    """
+    Measures the best throughput of calling `func` once per item
+
+    Args:
+        func (Callable): function to be called with each item
+        items (Iterable): items to be passed to `func`
+        repeat (int): number of runs, the fastest one is kept
+
+    Returns:
+        float: items processed per second on the fastest run
+    """
+    items = list(items)
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        for item in items:
+            func(item)
+
+        best = min(best, time.perf_counter() - start)
+
+    return len(items) / best
+
+
+def report(label: str, per_second: float, unit: str = 'events') -> None:
+    """
+    Prints a benchmark result line
+
+    Args:
+        label (str): benchmark case name
+        per_second (float): measured throughput
+        unit (str): name of the processed items
+    """
+    print(f"{label:<40} {per_second:>14,.0f} {unit}/s")
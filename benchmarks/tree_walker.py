@@ -0,0 +1,72 @@
+"""
+Measures the iterative tree walkers on deeply nested and very wide payloads, from raw
+event down to hive fields. Payloads 1,000 levels deep used to raise `RecursionError`.
+
+Run it from project root:
+
+    $ poetry run python3 -m benchmarks.tree_walker
+"""
+
+from benchmarks.timing import measure, report
+from itidigital.data_quality.event.cache import shape_signature
+from itidigital.data_quality.event.builder import EventBuilder
+from itidigital.data_quality.event.validator import EventValidator
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.utils.schema.fingerprint import event_fingerprint
+from itidigital.sql.athena.tools.hive_table_creator import HiveTableCreator
+
+
+def _deep_event(depth: int) -> dict:
+    """Event with one object field per nesting level"""
+    event = {"leaf": "value"}
+
+    for level in range(depth):
+        event = {f"level_{level}": event}
+
+    return event
+
+
+def _wide_event(width: int) -> dict:
+    """Event with `width` regular fields on root level"""
+    return {f"field_{index}": index for index in range(width)}
+
+
+def _wide_nested_event(width: int) -> dict:
+    """Event with `width` object fields holding `width` regular fields each"""
+    return {f"object_{index}": _wide_event(width) for index in range(width)}
+
+
+def _hive_fields(raw_schema: dict) -> dict:
+    """Builds hive fields from a raw schema, as `HiveTableCreator.get_fields` does on a cache miss"""
+    creator = HiveTableCreator()
+    schema = SchemaBuilder(config=raw_schema).construct()
+
+    return creator._map_columns(columns=creator._convert_columns(schema))
+
+
+def main() -> None:
+    cases = [
+        ('deep (1,000 levels)', _deep_event(1_000), 1_001, 20),
+        ('wide (10,000 fields)', _wide_event(10_000), 10_000, 5),
+        ('wide nested (100 x 100)', _wide_nested_event(100), 10_100, 5)
+    ]
+
+    for label, raw_event, nodes, repeat in cases:
+        event = EventBuilder(config=raw_event).construct()
+        raw_schema = event.json_schema
+        validator = EventValidator(schema=SchemaBuilder(config=raw_schema).construct())
+        payloads = [raw_event] * repeat
+
+        report(f"{label} EventBuilder", nodes * measure(lambda item: EventBuilder(config=item).construct(), payloads), 'nodes')
+        report(f"{label} json_schema", nodes * measure(lambda _: event.json_schema, payloads), 'nodes')
+        report(f"{label} SchemaBuilder", nodes * measure(lambda _: SchemaBuilder(config=raw_schema).construct(), payloads), 'nodes')
+        report(f"{label} hive fields", nodes * measure(lambda _: _hive_fields(raw_schema), payloads), 'nodes')
+        report(f"{label} event_fingerprint", nodes * measure(event_fingerprint, payloads), 'nodes')
+        report(f"{label} shape_signature", nodes * measure(shape_signature, payloads), 'nodes')
+        report(f"{label} EventValidator", nodes * measure(lambda item: validator.is_valid(
+            EventBuilder(config=item).construct()
+        ), payloads), 'nodes')
+
+
+if __name__ == "__main__":
+    main()
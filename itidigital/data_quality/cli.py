@@ -0,0 +1,166 @@
+"""Command line interface for offline event validation"""
+
+import os
+import sys
+import time
+import argparse
+import contextlib
+from typing import BinaryIO, List, Optional
+
+from itidigital import variables
+from itidigital.utils.schema import helpers
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality import stream
+from itidigital.data_quality.parallel import ParallelEventValidator, is_splittable
+from itidigital.data_quality.event.exceptions import InvalidJsonArray
+from itidigital.data_quality.event.validator import CompiledEventValidator, ValidationMode
+
+_DEFAULT_SCHEMA_FILE_PATH = os.path.join(
+    variables.PROJECT_ROOT_PATH,
+    'itidigital/data_quality/schema.json'
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line arguments parser
+
+    Returns:
+        argparse.ArgumentParser: arguments parser
+    """
+    parser = argparse.ArgumentParser(prog='python -m itidigital.data_quality')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    validate = commands.add_parser(
+        'validate',
+        help='validates newline-delimited JSON or JSON array files, optionally gzipped'
+    )
+    validate.add_argument('--schema', default=_DEFAULT_SCHEMA_FILE_PATH, help='JSON schema file path')
+    validate.add_argument('--input', required=True, help='events file path, `.gz` for gzip or `-` for stdin')
+    validate.add_argument('--valid-output', help='file path for valid events, `.gz` for gzip')
+    validate.add_argument('--invalid-output', help='file path for invalid events, `.gz` for gzip')
+    validate.add_argument(
+        '--workers', type=int, default=1,
+        help='number of processes, only used by uncompressed newline-delimited JSON files, '
+             'other inputs are validated sequentially'
+    )
+    validate.add_argument(
+        '--mode', choices=[mode.value for mode in ValidationMode], default=ValidationMode.STRICT.value,
+        help='`strict` requires every schema key, `schema` only `required` keys and accepts nullable types'
+    )
+    validate.add_argument(
+        '--unordered', action='store_true',
+        help='writes events as soon as they are validated when using multiple workers'
+    )
+
+    return parser
+
+
+def _open(stack: contextlib.ExitStack, path: Optional[str], opener) -> Optional[BinaryIO]:
+    """
+    Opens a file and registers it to be closed, leaving standard streams open
+
+    Args:
+        stack (contextlib.ExitStack): stack that closes opened files
+        path (Optional[str]): file path, or `-` for standard streams
+        opener (Callable): function that opens `path`
+
+    Returns:
+        Optional[BinaryIO]: opened file, or None if no path is given
+    """
+    if not path:
+        return None
+
+    file = opener(path)
+
+    if path != '-':
+        stack.enter_context(file)
+
+    return file
+
+
+def validate(args: argparse.Namespace, stats: Optional[stream.StreamStats] = None) -> stream.StreamStats:
+    """
+    Streams events from input, validates them and writes them to the outputs
+
+    Args:
+        args (argparse.Namespace): `validate` command arguments
+        stats (Optional[stream.StreamStats]): counters to be updated, which keep the events
+            validated so far if input turns out to be malformed
+
+    Returns:
+        stream.StreamStats: validation counters
+
+    Raises:
+        InvalidJsonArray: if input is a JSON array that can not be decoded, after writing
+            the events before the malformed element
+    """
+    raw_schema = helpers.load_schema(args.schema)
+    mode = ValidationMode(args.mode)
+    stats = stats if stats is not None else stream.StreamStats()
+
+    with contextlib.ExitStack() as stack:
+        valid_output = _open(stack, args.valid_output, stream.open_output)
+        invalid_output = _open(stack, args.invalid_output, stream.open_output)
+
+        if args.workers > 1 and not is_splittable(args.input):
+            print(
+                "Only uncompressed newline-delimited JSON files can be validated on multiple "
+                "workers, validating sequentially",
+                file=sys.stderr
+            )
+
+        elif args.workers > 1:
+            validator = ParallelEventValidator(raw_schema=raw_schema, max_workers=args.workers, mode=mode)
+
+            return validator.validate_file(
+                input_path=args.input,
+                valid_output=valid_output,
+                invalid_output=invalid_output,
+                ordered=not args.unordered
+            )
+
+        validator = CompiledEventValidator(schema=SchemaBuilder(config=raw_schema).construct(), mode=mode)
+        input_file = _open(stack, args.input, stream.open_input)
+
+        results = stream.validate_records(
+            records=stream.iter_records(input_file),
+            validator=validator,
+            stats=stats
+        )
+        stream.write_records(
+            results=results,
+            valid_output=valid_output,
+            invalid_output=invalid_output
+        )
+
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line interface
+
+    Args:
+        argv (Optional[List[str]]): command line arguments, `sys.argv` if None
+
+    Returns:
+        int: exit code, 1 if input is malformed
+    """
+    args = _build_parser().parse_args(argv)
+    stats = stream.StreamStats(started_at=time.perf_counter())
+    exit_code = 0
+
+    try:
+        stats = validate(args, stats=stats)
+    except InvalidJsonArray as error:
+        print(f"Stopped reading input: {error}", file=sys.stderr)
+        exit_code = 1
+
+    print(
+        f"Validated {stats.total} events ({stats.valid} valid, {stats.invalid} invalid) "
+        f"in {stats.elapsed:.2f}s: {stats.throughput:,.0f} events/s",
+        file=sys.stderr
+    )
+
+    return exit_code
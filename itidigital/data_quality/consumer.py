@@ -0,0 +1,333 @@
+"""Module to consume events from a SQS queue on an asyncio pipeline"""
+
+import time
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional
+
+from itidigital.utils import serialization
+from itidigital.utils.aws import sqs
+from itidigital.data_quality.stream import StreamStats
+from itidigital.data_quality.router import EventRouter, error_attributes, route_event
+from itidigital.data_quality.event.result import ErrorKind, FieldError, ValidationResult, ValidationSummary
+from itidigital.data_quality.event.validator import CompiledEventValidator
+
+__all__ = [
+    'ConsumerStats',
+    'AsyncEventConsumer'
+]
+
+
+@dataclass
+class ConsumerStats(StreamStats):
+    """
+    Class to represent queue consumer counters
+
+    Args:
+        received (int): number of received messages
+        failed (int): number of messages left on the input queue, because they could not be sent
+        deleted (int): number of messages deleted from the input queue
+        errors (Counter): number of validation errors by `ErrorKind`
+    """
+    received: int = 0
+    failed: int = 0
+    deleted: int = 0
+    errors: Counter = field(default_factory=Counter)
+
+
+class _BatchResult(NamedTuple):
+    """
+    Class to represent the outcome of processing a batch of received messages
+
+    Args:
+        valid (int): number of valid events sent
+        invalid (int): number of invalid events sent, messages that are not JSON included
+        failed (int): number of messages that could not be sent
+        deleted (int): number of messages deleted from the input queue
+        errors (Counter): number of validation errors by `ErrorKind`
+    """
+    valid: int
+    invalid: int
+    failed: int
+    deleted: int
+    errors: Counter
+
+
+class AsyncEventConsumer:
+    """
+    Long running consumer that long-polls an input queue, validates its events and
+    routes them to the valid or invalid events queue.
+
+    Pollers receive up to 10 messages per call and put them on a bounded queue that
+    workers take from. When workers fall behind, pollers block on that queue and stop
+    receiving, so at most `(pollers + workers + max_pending_batches) * 10` messages are
+    in flight. boto3 calls are blocking, so they run on a thread pool sized for pollers
+    and workers, keeping the event loop free.
+
+    Each batch is deleted from the input queue with a single `delete_message_batch`
+    call once its events were sent. Messages that are not JSON are sent to the invalid
+    events queue as they are, with an `invalid_json` error. Messages that can not be
+    sent, and whole batches that fail to be processed, are left on the input queue, to
+    be received again or moved by its redrive policy.
+    """
+    def __init__(
+            self,
+            sqs_client,
+            input_queue_name: str,
+            validator: CompiledEventValidator,
+            valid_queue_name: str = 'valid-events-queue',
+            invalid_queue_name: str = 'invalid-events-queue',
+            pollers: int = 1,
+            workers: int = 4,
+            max_pending_batches: int = 8,
+            wait_time_seconds: int = 20,
+            queue_urls: Optional[sqs.QueueUrlCache] = None
+    ) -> None:
+        """
+        Initializes `AsyncEventConsumer` class
+
+        Args:
+            sqs_client: boto3 SQS client
+            input_queue_name (str): queue to consume events from
+            validator (CompiledEventValidator): validator to check events with
+            valid_queue_name (str): destination of valid events
+            invalid_queue_name (str): destination of invalid events
+            pollers (int): number of concurrent `receive_message` calls
+            workers (int): number of batches processed concurrently
+            max_pending_batches (int): received batches that may wait for a worker
+            wait_time_seconds (int): long polling time of `receive_message` calls
+            queue_urls (Optional[sqs.QueueUrlCache]): queue URL cache, a new one if None
+        """
+        if pollers < 1 or workers < 1 or max_pending_batches < 1:
+            raise ValueError("pollers, workers and max_pending_batches should be positive")
+
+        self._sqs_client = sqs_client
+        self._input_queue_name = input_queue_name
+        self._validator = validator
+        self._valid_queue_name = valid_queue_name
+        self._invalid_queue_name = invalid_queue_name
+        self._pollers = pollers
+        self._workers = workers
+        self._max_pending_batches = max_pending_batches
+        self._wait_time_seconds = wait_time_seconds
+        self._queue_urls = queue_urls if queue_urls is not None else sqs.QueueUrlCache()
+
+    async def run(
+            self,
+            max_messages: Optional[int] = None,
+            stop_when_empty: bool = False,
+            stop: Optional[asyncio.Event] = None
+    ) -> ConsumerStats:
+        """
+        Consumes the input queue until stopped, then waits for received batches to be processed
+
+        Args:
+            max_messages (Optional[int]): stops receiving after this many messages, a few
+                more may be received by concurrent pollers
+            stop_when_empty (bool): stops receiving when a poll gets no messages
+            stop (Optional[asyncio.Event]): stops receiving when set
+
+        Returns:
+            ConsumerStats: consumer counters
+        """
+        stats = ConsumerStats(started_at=time.perf_counter())
+        batches: asyncio.Queue = asyncio.Queue(maxsize=self._max_pending_batches)
+        stop = stop if stop is not None else asyncio.Event()
+
+        with ThreadPoolExecutor(
+                max_workers=self._pollers + self._workers,
+                thread_name_prefix='sqs-consumer'
+        ) as executor:
+            workers = [
+                asyncio.create_task(self._work(executor, batches, stats))
+                for _ in range(self._workers)
+            ]
+
+            pollers = [
+                asyncio.create_task(self._poll(executor, batches, stats, max_messages, stop_when_empty, stop))
+                for _ in range(self._pollers)
+            ]
+
+            try:
+                await asyncio.gather(*pollers)
+
+            finally:
+                # pollers left blocked on a full queue would keep it full, so they are stopped first
+                for poller in pollers:
+                    poller.cancel()
+
+                await asyncio.gather(*pollers, return_exceptions=True)
+
+                # workers outlive failed batches, so they take the pending ones and make room for each None
+                for _ in workers:
+                    await batches.put(None)
+
+                await asyncio.gather(*workers)
+
+        return stats
+
+    async def _poll(
+            self,
+            executor: ThreadPoolExecutor,
+            batches: asyncio.Queue,
+            stats: ConsumerStats,
+            max_messages: Optional[int],
+            stop_when_empty: bool,
+            stop: asyncio.Event
+    ) -> None:
+        """
+        Receives batches of messages and hands them to workers
+
+        Args:
+            executor (ThreadPoolExecutor): pool running blocking SQS calls
+            batches (asyncio.Queue): bounded queue of received batches
+            stats (ConsumerStats): counters to be updated
+            max_messages (Optional[int]): stops receiving after this many messages
+            stop_when_empty (bool): stops receiving when a poll gets no messages
+            stop (asyncio.Event): stops receiving when set
+        """
+        loop = asyncio.get_running_loop()
+
+        while not stop.is_set() and (max_messages is None or stats.received < max_messages):
+            messages = await loop.run_in_executor(executor, self._receive)
+
+            if not messages:
+                if stop_when_empty:
+                    return
+                continue
+
+            stats.received += len(messages)
+
+            # blocks while workers are behind, which stops this poller from receiving
+            await batches.put(messages)
+
+    async def _work(self, executor: ThreadPoolExecutor, batches: asyncio.Queue, stats: ConsumerStats) -> None:
+        """
+        Processes received batches until a None batch is found. A batch that fails, like
+        when an output queue does not exist, is counted as failed and left on the input queue
+
+        Args:
+            executor (ThreadPoolExecutor): pool running blocking SQS calls
+            batches (asyncio.Queue): bounded queue of received batches
+            stats (ConsumerStats): counters to be updated
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            messages = await batches.get()
+
+            if messages is None:
+                return
+
+            try:
+                result = await loop.run_in_executor(executor, self._process, messages)
+
+            except Exception:
+                # messages are not deleted, so the batch is received again or moved by the redrive policy
+                stats.failed += len(messages)
+                continue
+
+            stats.valid += result.valid
+            stats.invalid += result.invalid
+            stats.failed += result.failed
+            stats.deleted += result.deleted
+            stats.errors.update(result.errors)
+
+    def _receive(self) -> List[dict]:
+        """
+        Long-polls the input queue
+
+        Returns:
+            List[dict]: received messages, up to 10
+        """
+        return self._queue_urls.call(
+            sqs_client=self._sqs_client,
+            queue_name=self._input_queue_name,
+            operation=lambda queue_url: self._sqs_client.receive_message(
+                QueueUrl=queue_url,
+                MaxNumberOfMessages=sqs.MAX_BATCH_ENTRIES,
+                WaitTimeSeconds=self._wait_time_seconds
+            )
+        ).get('Messages', [])
+
+    def _process(self, messages: List[dict]) -> _BatchResult:
+        """
+        Validates and routes a batch of messages, then deletes the ones that were sent
+
+        Args:
+            messages (List[dict]): received messages
+
+        Returns:
+            _BatchResult: batch counters
+        """
+        router = EventRouter(sqs_client=self._sqs_client, queue_urls=self._queue_urls, max_delay=float('inf'))
+        kept = set()
+        routed = {}
+        summary = ValidationSummary()
+
+        for message in messages:
+            try:
+                raw_event = serialization.loads(message['Body'])
+
+            except ValueError:
+                # redelivering a message that is not JSON would never succeed
+                result = summary.add(ValidationResult(errors=[FieldError(kind=ErrorKind.INVALID_JSON, path=())]))
+                router.route_body(
+                    queue_name=self._invalid_queue_name,
+                    body=message['Body'],
+                    identifier=message['MessageId'],
+                    attributes=error_attributes(result)
+                )
+                routed[message['MessageId']] = False
+                continue
+
+            routed[message['MessageId']] = route_event(
+                router=router,
+                validator=self._validator,
+                identifier=message['MessageId'],
+                raw_event=raw_event,
+                valid_queue_name=self._valid_queue_name,
+                invalid_queue_name=self._invalid_queue_name,
+                summary=summary
+            )
+
+        kept.update(router.flush())
+        sent = [is_valid for identifier, is_valid in routed.items() if identifier not in kept]
+        deleted = self._delete([message for message in messages if message['MessageId'] not in kept])
+
+        return _BatchResult(
+            valid=sum(sent),
+            invalid=len(sent) - sum(sent),
+            failed=len(kept),
+            deleted=deleted,
+            errors=summary.errors
+        )
+
+    def _delete(self, messages: List[dict]) -> int:
+        """
+        Deletes processed messages from the input queue with a single call
+
+        Args:
+            messages (List[dict]): messages to be deleted, up to 10
+
+        Returns:
+            int: number of deleted messages
+        """
+        if not messages:
+            return 0
+
+        response = self._queue_urls.call(
+            sqs_client=self._sqs_client,
+            queue_name=self._input_queue_name,
+            operation=lambda queue_url: self._sqs_client.delete_message_batch(
+                QueueUrl=queue_url,
+                Entries=[
+                    {'Id': str(index), 'ReceiptHandle': message['ReceiptHandle']}
+                    for index, message in enumerate(messages)
+                ]
+            )
+        )
+
+        return len(messages) - len(response.get('Failed', []))
@@ -1,18 +1,20 @@
 """Module to implement all concrete builder classes related to event"""
 
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 
+from itidigital.utils import walker
 from itidigital.utils.builder.base import BaseBuilder
 from itidigital.data_quality.event.event import (
     Event,
     EventField,
     FieldType,
-    PythonTypeTranslator
+    get_field_type
 )
 
 
 class EventFieldBuilder(BaseBuilder):
     """Builder concrete class for `EventBuilder`"""
+    product = EventField
 
     def __init__(self, config: dict) -> None:
         """
@@ -35,21 +37,6 @@ class EventFieldBuilder(BaseBuilder):
         """
         self._config = config
 
-    def construct(self) -> EventField:
-        """
-        Constructs a `EventField` class instance
-
-        Returns:
-            EventField: a class instance of EventField based on given configuration
-        """
-        kwargs = {}
-
-        for field in EventField.__dataclass_fields__:
-            method = getattr(self, f'get_{field}')
-            kwargs[field] = method()
-
-        return EventField(**kwargs)
-
     def get_name(self) -> str:
         """
         Gets event field name attribute
@@ -66,11 +53,7 @@ class EventFieldBuilder(BaseBuilder):
         Returns:
             str: event field type attribute
         """
-        field_value = self._config.get('value')
-        
-        python_type = type(field_value).__name__.upper()
-
-        return PythonTypeTranslator[python_type].value
+        return get_field_type(self._config.get('value'))
 
     def get_value(self) -> Any:
         """
@@ -79,19 +62,17 @@ class EventFieldBuilder(BaseBuilder):
         Returns:
             str: event field value attribute
         """
-        field_type = self.get_type()
+        field_value = self._config.get('value')
 
-        if field_type == FieldType.OBJECT:
+        # same as `get_type() == FieldType.OBJECT`, without computing the type again
+        if type(field_value) is dict:
             field_value = self._get_value_for_object_fields()
 
-        else:
-            field_value = self._config.get('value')
-
         return field_value
 
     def _get_value_for_object_fields(self) -> List:
         """
-        Gets value for nested object fields
+        Gets value for nested object fields, walking all nesting levels iteratively
 
         Returns:
             List: all nested field values on object field
@@ -99,21 +80,42 @@ class EventFieldBuilder(BaseBuilder):
         values = []
 
         field_value = self._config.get('value')
-        for name, value in field_value.items():
-            config = {
-                "name": name,
-                "value": value
-            }
-            event_field = EventFieldBuilder(config).construct()
-            values.append(event_field)
+        walker.walk(
+            roots=[(values, name, value) for name, value in field_value.items()],
+            visit=self._visit_nested_value
+        )
 
         return values
 
+    @staticmethod
+    def _visit_nested_value(node: Tuple[List, str, Any]) -> Optional[List[Tuple[List, str, Any]]]:
+        """
+        Appends a nested event field to the values of its parent object field
+
+        Args:
+            node (Tuple[List, str, Any]): parent values, field name and raw field value
+
+        Returns:
+            Optional[List[Tuple[List, str, Any]]]: nodes of object field properties,
+                or None for regular fields
+        """
+        values, name, value = node
+
+        if type(value) is not dict:
+            values.append(EventField(name=name, value=value, type=get_field_type(value)))
+            return None
+
+        nested_values = []
+        values.append(EventField(name=name, value=nested_values, type=FieldType.OBJECT))
+
+        return [(nested_values, nested_name, nested_value) for nested_name, nested_value in value.items()]
+
 
 class EventBuilder(BaseBuilder):
     """
     Builder concrete class for `EventBuilder`
     """
+    product = Event
 
     def __init__(self, config: dict) -> None:
         """
@@ -124,21 +126,6 @@ class EventBuilder(BaseBuilder):
         """
         self._config = config
 
-    def construct(self) -> Event:
-        """
-        Constructs a `Event` class instance
-
-        Returns:
-            EventField: a class instance of Event based on given configuration
-        """
-        kwargs = {}
-
-        for field in Event.__dataclass_fields__:
-            method = getattr(self, f'get_{field}')
-            kwargs[field] = method()
-
-        return Event(**kwargs)
-
     def get_fields(self) -> List:
         """
         Gets all event fields
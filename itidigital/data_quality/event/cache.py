@@ -0,0 +1,222 @@
+"""Module to memoize event validation results by event shape"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+from itidigital.utils import walker
+from itidigital.data_quality.event.builder import EventBuilder
+from itidigital.data_quality.event.validator import EventValidator
+
+__all__ = [
+    'CacheStats',
+    'shape_signature',
+    'ShapeCachedEventValidator'
+]
+
+
+@dataclass
+class CacheStats:
+    """
+    Class to represent shape cache counters
+
+    Args:
+        hits (int): validations answered from cache
+        misses (int): validations that ran the wrapped validator
+        evictions (int): shapes dropped to respect the cache size
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def _flatten(parts: list) -> tuple:
+    """
+    Flattens signature parts, where the parts of nested values are nested lists
+
+    Args:
+        parts (list): signature parts
+
+    Returns:
+        tuple: flat signature
+    """
+    signature = []
+    stack = [iter(parts)]
+
+    while stack:
+        for part in stack[-1]:
+            if type(part) is list:
+                stack.append(iter(part))
+                break
+
+            signature.append(part)
+
+        else:
+            stack.pop()
+
+    return tuple(signature)
+
+
+def shape_signature(event: dict) -> Hashable:
+    """
+    Gets a cheap signature of a raw event shape, made of its keys, in order, and the
+    python types of their values, for nested objects and array elements too.
+
+    The signature is a flat tuple, so hashing and comparing it does not recurse on
+    deeply nested events. Objects are the `dict` type, their number of keys and the
+    name and signature of each key. Arrays are the `list` type and the set of their
+    element types, or for arrays of objects or arrays, the number and signatures of
+    their distinct elements, in order of first appearance.
+
+    Objects and arrays are walked by `walker.walk`, each one filling its own list of
+    parts. Arrays of objects or arrays are signed once their elements were walked,
+    innermost first, then all parts are flattened.
+
+    Args:
+        event (dict): raw event
+
+    Returns:
+        Hashable: event shape signature
+    """
+    parts = []
+    # parts and element parts of arrays that are signed element by element, in pre-order
+    arrays = []
+
+    def visit(node):
+        node_parts, value = node
+        is_object = type(value) is dict
+        nested = []
+
+        if is_object:
+            node_parts.extend((dict, len(value)))
+        else:
+            elements = []
+            arrays.append((node_parts, elements))
+
+        for name, child in (value.items() if is_object else enumerate(value)):
+            if is_object:
+                child_parts = node_parts
+                child_parts.append(name)
+            else:
+                child_parts = []
+                elements.append(child_parts)
+
+            child_type = type(child)
+
+            if child_type is dict:
+                nested_parts = []
+                child_parts.append(nested_parts)
+                nested.append((nested_parts, child))
+
+            elif child_type is list:
+                element_types = frozenset(map(type, child))
+
+                # only nested elements need to be signed one by one
+                if dict in element_types or list in element_types:
+                    nested_parts = []
+                    child_parts.append(nested_parts)
+                    nested.append((nested_parts, child))
+                else:
+                    child_parts.extend((list, element_types))
+
+            else:
+                child_parts.append(child_type)
+
+        return nested or None
+
+    walker.walk(roots=[(parts, event)], visit=visit)
+
+    for array_parts, elements in reversed(arrays):
+        distinct = dict.fromkeys(map(_flatten, elements))
+        array_parts.extend((list, len(distinct)))
+
+        for element in distinct:
+            array_parts.extend(element)
+
+    return _flatten(parts)
+
+
+class ShapeCachedEventValidator:
+    """
+    Bounded LRU cache in front of `EventValidator.is_valid`.
+
+    Events with the same shape always get the same validation result, so for a known
+    shape `EventBuilder` and `SchemaBuilder` are skipped entirely. Call `clear` after
+    changing the schema of the wrapped validator.
+    """
+    def __init__(self, validator: EventValidator, maxsize: int = 1024) -> None:
+        """
+        Initializes `ShapeCachedEventValidator` class
+
+        Args:
+            validator (EventValidator): validator to be called on cache misses
+            maxsize (int): maximum number of cached shapes
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize should be positive, but got {maxsize}")
+
+        self._validator = validator
+        self._maxsize = maxsize
+        self._results: OrderedDict = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def validator(self) -> EventValidator:
+        """Wrapped validator property"""
+        return self._validator
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of cached shapes property"""
+        return self._maxsize
+
+    @property
+    def stats(self) -> CacheStats:
+        """Cache counters property"""
+        return self._stats
+
+    def __len__(self) -> int:
+        """Number of cached shapes"""
+        return len(self._results)
+
+    def clear(self) -> None:
+        """Drops all cached shapes and resets counters"""
+        with self._lock:
+            self._results.clear()
+            self._stats = CacheStats()
+
+    def is_valid(self, event: dict) -> bool:
+        """
+        Validates if a given raw event conforms to the validator schema
+
+        Args:
+            event (dict): raw event to be checked
+
+        Returns:
+            bool: True if event matches the schema. Otherwise, False
+        """
+        signature = shape_signature(event)
+
+        with self._lock:
+            result = self._results.get(signature)
+
+            if result is not None:
+                self._results.move_to_end(signature)
+                self._stats.hits += 1
+                return result
+
+        result = self._validator.is_valid(
+            event=EventBuilder(config=event).construct()
+        )
+
+        with self._lock:
+            self._stats.misses += 1
+            self._results[signature] = result
+
+            if len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+                self._stats.evictions += 1
+
+        return result
@@ -0,0 +1,167 @@
+"""Module to compile event schemas into flat lists of validation checks"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Tuple, Union
+
+from itidigital.data_quality.event.event import FieldType
+from itidigital.utils.schema.event import ArrayField, EventSchema, ObjectField, SchemaField
+
+__all__ = [
+    'ItemsCheck',
+    'FieldCheck',
+    'compile_items',
+    'compile_schema'
+]
+
+
+@dataclass(frozen=True)
+class ItemsCheck:
+    """
+    Class to represent the compiled check of every element of an array
+
+    Args:
+        expected_type (FieldType): type that every element must have
+        keys (Optional[FrozenSet[str]]): expected keys when elements are objects
+        checks (Tuple[FieldCheck, ...]): compiled checks of element properties when elements are objects
+        items (Optional[ItemsCheck]): check of nested elements when elements are arrays
+        nullable (bool): whether elements may also be null
+        required_keys (Optional[FrozenSet[str]]): keys listed as required when elements are objects
+    """
+    expected_type: FieldType
+    keys: Optional[FrozenSet[str]] = None
+    checks: Tuple['FieldCheck', ...] = ()
+    items: Optional['ItemsCheck'] = None
+    nullable: bool = False
+    required_keys: Optional[FrozenSet[str]] = None
+
+
+@dataclass(frozen=True)
+class FieldCheck:
+    """
+    Class to represent a single compiled validation check
+
+    Args:
+        path (Tuple[str, ...]): keys from the event root down to the checked field
+        expected_type (FieldType): type that the field value must have
+        required (bool): whether the field is listed as required by its parent object
+        parent (int): index of the parent object check, or -1 for root level fields
+        keys (Optional[FrozenSet[str]]): expected keys when the field is an object
+        items (Optional[ItemsCheck]): check of array elements when the field is an array with items
+        nullable (bool): whether the field may also be null
+        required_keys (Optional[FrozenSet[str]]): keys listed as required when the field is an object
+    """
+    path: Tuple[str, ...]
+    expected_type: FieldType
+    required: bool
+    parent: int = -1
+    keys: Optional[FrozenSet[str]] = None
+    items: Optional[ItemsCheck] = None
+    nullable: bool = False
+    required_keys: Optional[FrozenSet[str]] = None
+
+    @property
+    def name(self) -> str:
+        """Name of the checked field"""
+        return self.path[-1]
+
+
+def _get_keys(field: ObjectField) -> FrozenSet[str]:
+    """
+    Gets the keys that an object field expects
+
+    Args:
+        field (ObjectField): object field to get keys from
+
+    Returns:
+        FrozenSet[str]: names of all object properties
+    """
+    return frozenset(prop.name for prop in field.properties)
+
+
+def _get_required_keys(field: ObjectField) -> FrozenSet[str]:
+    """
+    Gets the keys that an object field lists as required
+
+    Args:
+        field (ObjectField): object field to get required keys from
+
+    Returns:
+        FrozenSet[str]: names of required object properties
+    """
+    return frozenset(field.required or [])
+
+
+def compile_items(items: Optional[Union[SchemaField, ObjectField, ArrayField]]) -> Optional[ItemsCheck]:
+    """
+    Compiles the items schema of an array
+
+    Args:
+        items (Optional[Union[SchemaField, ObjectField, ArrayField]]): items schema
+
+    Returns:
+        Optional[ItemsCheck]: compiled check, or None when any element is accepted
+    """
+    if items is None:
+        return None
+
+    if items.type == FieldType.OBJECT:
+        return ItemsCheck(
+            expected_type=items.type,
+            keys=_get_keys(items),
+            checks=tuple(compile_schema(schema=items)),
+            nullable=items.nullable,
+            required_keys=_get_required_keys(items)
+        )
+
+    if items.type == FieldType.ARRAY:
+        return ItemsCheck(
+            expected_type=items.type,
+            items=compile_items(items=items.items),
+            nullable=items.nullable
+        )
+
+    return ItemsCheck(expected_type=items.type, nullable=items.nullable)
+
+
+def compile_schema(schema: Union[EventSchema, ObjectField]) -> List[FieldCheck]:
+    """
+    Compiles a schema into a flat list of checks, where every parent object
+    check comes before the checks of its properties. Array elements are checked
+    by the `items` of their array check.
+
+    Args:
+        schema (Union[EventSchema, ObjectField]): schema to be compiled
+
+    Returns:
+        List[FieldCheck]: compiled checks
+    """
+    checks = []
+    stack = [((), -1, schema)]
+
+    while stack:
+        path, parent, obj = stack.pop()
+        required = set(obj.required or [])
+        nested = []
+
+        for prop in obj.properties:
+            is_object = prop.type == FieldType.OBJECT
+
+            checks.append(
+                FieldCheck(
+                    path=(*path, prop.name),
+                    expected_type=prop.type,
+                    required=prop.name in required,
+                    parent=parent,
+                    keys=_get_keys(prop) if is_object else None,
+                    items=compile_items(items=prop.items) if isinstance(prop, ArrayField) else None,
+                    nullable=prop.nullable,
+                    required_keys=_get_required_keys(prop) if is_object else None
+                )
+            )
+
+            if is_object:
+                nested.append(((*path, prop.name), len(checks) - 1, prop))
+
+        stack.extend(reversed(nested))
+
+    return checks
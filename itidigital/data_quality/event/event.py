@@ -1,11 +1,16 @@
 import enum
-from typing import List, Any
+from functools import partial
+from typing import List, Any, FrozenSet, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from itidigital.utils import walker
+
 __all__ = [
     'FieldType',
     'EventField',
-    'Event'
+    'Event',
+    'get_field_type',
+    'get_python_types'
 ]
 
 
@@ -45,7 +50,102 @@ class PythonTypeTranslator(enum.Enum):
         return cls.UNKNOWN
 
 
-@dataclass
+_PYTHON_TYPES = {
+    python_type: PythonTypeTranslator[python_type.__name__.upper()].value
+    for python_type in (str, int, float, complex, list, tuple, range, set, dict, bool)
+}
+_PYTHON_TYPES[type(None)] = PythonTypeTranslator.NONE.value
+
+
+def get_field_type(value: Any) -> FieldType:
+    """
+    Gets the JSON schema type of a raw python value with a single lookup
+
+    Args:
+        value (Any): value to get the type from
+
+    Returns:
+        FieldType: JSON schema type of value
+    """
+    return _PYTHON_TYPES.get(type(value), FieldType.UNKNOWN)
+
+
+def get_python_types(field_type: FieldType) -> FrozenSet[type]:
+    """
+    Gets the raw python types of values that have a given JSON schema type
+
+    Args:
+        field_type (FieldType): JSON schema type
+
+    Returns:
+        FrozenSet[type]: python types of values with `field_type`
+    """
+    return frozenset(
+        python_type for python_type, json_type in _PYTHON_TYPES.items() if json_type is field_type
+    )
+
+
+def _visit_group(state: List[bool], values: List) -> Optional[List[List]]:
+    """
+    Checks that values at the same place of several array elements are alike
+
+    Args:
+        state (List[bool]): check outcome so far, set to False on the first difference
+        values (List): value of each element at the same place
+
+    Returns:
+        Optional[List[List]]: values of each object property, or the elements of all
+            arrays, or None if there is nothing else to check
+    """
+    # once a difference is found, the remaining values are skipped
+    if not state[0]:
+        return None
+
+    field_types = {_PYTHON_TYPES.get(python_type, FieldType.UNKNOWN) for python_type in set(map(type, values))}
+
+    if len(field_types) > 1:
+        state[0] = False
+        return None
+
+    field_type = field_types.pop()
+
+    if field_type == FieldType.OBJECT:
+        keys = values[0].keys()
+
+        if any(value.keys() != keys for value in values):
+            state[0] = False
+            return None
+
+        return [[value[key] for value in values] for key in keys]
+
+    if field_type == FieldType.ARRAY:
+        elements = [element for array in values for element in array]
+
+        return [elements] if elements else None
+
+    return None
+
+
+def _share_structure(values: List) -> bool:
+    """
+    Checks if array elements are alike: they have the same type, objects have the same
+    keys whose values are alike, and the elements of nested arrays are alike too, walking
+    all nesting levels iteratively. Empty nested arrays are alike to any other array.
+
+    Args:
+        values (List): array elements, at least one
+
+    Returns:
+        bool: True if every element would infer the same `items` schema. Otherwise, False
+    """
+    state = [True]
+
+    walker.walk(roots=[values], visit=partial(_visit_group, state))
+
+    return state[0]
+
+
+@dataclass(slots=True)
 class EventField:
     """
     Class to represent the data structure of an event field
@@ -133,7 +233,7 @@ class Event:
 
     def _get_properties_for_object_fields(self, field: EventField) -> dict:
         """
-        Get properties for object (nested) fields
+        Get properties for object (nested) fields, walking all nesting levels iteratively
 
         Args:
             field (EventField): object field to extract properties
@@ -141,19 +241,141 @@ class Event:
         Returns:
             dict: properties for object field
         """
-        object_properties = self._get_properties(
-            fields=field.value
+        properties = {}
+
+        walker.walk(
+            roots=[(properties, field)],
+            visit=self._visit_property
         )
 
-        object_properties["$id"] = field.name
-        object_properties["type"] = FieldType.OBJECT.value
+        return properties[field.name]
 
-        return object_properties
+    @staticmethod
+    def _visit_property(
+            node: Tuple[dict, Union[EventField, List]]
+    ) -> Optional[List[Tuple[dict, Union[EventField, List]]]]:
+        """
+        Adds the properties of a field to the properties of its parent object field, or
+        the `items` schema of array elements to the properties of their array field
+
+        Args:
+            node (Tuple[dict, Union[EventField, List]]): parent properties and field, array
+                properties and elements, or parent properties, name and the values that
+                elements of an array of objects hold for that property
+
+        Returns:
+            Optional[List[Tuple[dict, Union[EventField, List]]]]: nodes of object field
+                properties and array elements, or None for other fields
+        """
+        if len(node) == 3:
+            return Event._visit_item_property(*node)
+
+        properties, field = node
+
+        if not isinstance(field, EventField):
+            return Event._visit_items(properties, field)
+
+        if field.type == FieldType.ARRAY:
+            properties[field.name] = Event._get_field_properties(field=field)
+            values = list(field.value)
+
+            return [(properties[field.name], values)] if values else None
+
+        if field.type != FieldType.OBJECT:
+            properties[field.name] = Event._get_field_properties(field=field)
+            return None
+
+        object_properties = {
+            "properties": {},
+            "$id": field.name,
+            "type": FieldType.OBJECT.value
+        }
+        properties[field.name] = object_properties
+
+        return [(object_properties["properties"], nested_field) for nested_field in field.value]
 
     @staticmethod
-    def _get_properties_for_regular_fields(field: EventField) -> dict:
+    def _visit_item_property(properties: dict, name: str, values: List) -> Optional[List[tuple]]:
         """
-        Get properties for regular fields
+        Adds the properties of a property of object items, inferred from the values that
+        every element holds for it, which `_share_structure` found to be alike
+
+        Args:
+            properties (dict): item properties
+            name (str): property name
+            values (List): property value of each element
+
+        Returns:
+            Optional[List[tuple]]: nodes of nested object properties and array elements of
+                every element, or None for other properties
+        """
+        value = values[0]
+        field_type = get_field_type(value)
+
+        if field_type != FieldType.OBJECT:
+            properties[name] = Event._get_field_properties(field=EventField(name=name, value=value, type=field_type))
+
+            if field_type != FieldType.ARRAY:
+                return None
+
+            elements = [element for array in values for element in array]
+
+            return [(properties[name], elements)] if elements else None
+
+        object_properties = {
+            "properties": {},
+            "$id": name,
+            "type": FieldType.OBJECT.value
+        }
+        properties[name] = object_properties
+
+        return [(object_properties["properties"], key, [item[key] for item in values]) for key in value]
+
+    @staticmethod
+    def _visit_items(properties: dict, values: List) -> Optional[List[Tuple[dict, Union[EventField, List]]]]:
+        """
+        Infers the `items` schema of an array from all its elements. Element types are
+        collected at C speed, so long arrays of primitives are cheap to infer.
+
+        Args:
+            properties (dict): array properties, where `items` is set
+            values (List): array elements, at least one
+
+        Returns:
+            Optional[List[Tuple[dict, Union[EventField, List]]]]: nodes of nested array
+                elements or object item properties, or None for other items
+        """
+        field_types = {_PYTHON_TYPES.get(python_type, FieldType.UNKNOWN) for python_type in set(map(type, values))}
+
+        if len(field_types) > 1:
+            properties["items"] = {"type": FieldType.UNKNOWN.value}
+            return None
+
+        field_type = field_types.pop()
+
+        if field_type == FieldType.ARRAY:
+            items = properties["items"] = {"type": field_type.value}
+            nested_values = [value for nested_values in values for value in nested_values]
+
+            return [(items, nested_values)] if nested_values else None
+
+        if field_type == FieldType.OBJECT:
+            if not _share_structure(values):
+                properties["items"] = {"type": FieldType.UNKNOWN.value}
+                return None
+
+            properties["items"] = {"type": field_type.value, "properties": {}}
+
+            return [(properties["items"]["properties"], key, [value[key] for value in values]) for key in values[0]]
+
+        properties["items"] = {"type": field_type.value}
+
+        return None
+
+    @staticmethod
+    def _get_field_properties(field: EventField) -> dict:
+        """
+        Get the properties of a regular field, without array items
 
         Args:
             field (EventField): regular field to extract properties
@@ -168,3 +390,49 @@ class Event:
             "description": f"{field.name} field of type {field.type.value}",
             "examples": [field.value]
         }
+
+    @staticmethod
+    def _get_properties_for_regular_fields(field: EventField) -> dict:
+        """
+        Get properties for regular fields
+
+        Args:
+            field (EventField): regular field to extract properties
+
+        Returns:
+            dict: properties for regular field
+        """
+        properties = Event._get_field_properties(field=field)
+
+        if field.type == FieldType.ARRAY:
+            items = Event._get_items(values=list(field.value))
+
+            if items is not None:
+                properties["items"] = items
+
+        return properties
+
+    @staticmethod
+    def _get_items(values: List) -> Optional[dict]:
+        """
+        Infers the `items` schema of an array from its elements, walking nested arrays
+        and object items iteratively
+
+        Args:
+            values (List): array elements
+
+        Returns:
+            Optional[dict]: items schema, with `unknown` type if elements do not share
+                the same structure, or None for empty arrays
+        """
+        if not values:
+            return None
+
+        properties = {}
+
+        walker.walk(
+            roots=[(properties, values)],
+            visit=Event._visit_property
+        )
+
+        return properties["items"]
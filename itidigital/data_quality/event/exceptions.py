@@ -5,3 +5,22 @@ class InvalidSchemaObject(TypeError):
     """Exception for invalid schema object"""
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class DuplicateSchemaKey(ValueError):
+    """Exception for schemas that can not be told apart by a registry"""
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+class InvalidJsonArray(ValueError):
+    """Exception for JSON arrays of events that can not be decoded"""
+    def __init__(self, message: str, offset: int) -> None:
+        super().__init__(f"{message} at character {offset}")
+        self.offset = offset
+
+
+class EventNotSentError(RuntimeError):
+    """Exception for events that could not be sent to their destination queue"""
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
@@ -0,0 +1,380 @@
+"""Module to keep parsed schemas and their validators loaded across invocations"""
+
+import os
+import glob
+import time
+import hashlib
+import warnings
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Optional, Union
+
+from itidigital.utils.schema import helpers
+from itidigital.utils.schema.event import EventSchema
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.utils.schema.fingerprint import event_fingerprint, schema_fingerprint
+from itidigital.data_quality.event.validator import CompiledEventValidator
+from itidigital.data_quality.event.exceptions import DuplicateSchemaKey
+from itidigital.data_quality.event.result import ErrorKind, FieldError, ValidationResult
+
+__all__ = [
+    'SchemaEntry',
+    'RegistryStats',
+    'SchemaFileRegistry',
+    'SchemaRegistry'
+]
+
+
+@dataclass
+class SchemaEntry:
+    """
+    Class to represent a loaded schema file
+
+    Args:
+        path (str): schema file path
+        schema (EventSchema): parsed schema
+        validator (CompiledEventValidator): validator built from schema
+        mtime_ns (int): file modification time when it was loaded
+        digest (str): hash of file content when it was loaded
+        raw_schema (dict): JSON schema loaded as dictionary
+    """
+    path: str
+    schema: EventSchema
+    validator: CompiledEventValidator
+    mtime_ns: int
+    digest: str
+    raw_schema: dict = field(default_factory=dict)
+
+
+@dataclass
+class RegistryStats:
+    """
+    Class to represent registry usage counters
+
+    Args:
+        hits (int): lookups served without rebuilding the schema
+        reloads (int): lookups that (re)built the schema
+    """
+    hits: int = 0
+    reloads: int = 0
+
+
+class SchemaFileRegistry:
+    """
+    Registry that parses each schema file once and reuses the parsed schema and
+    its validator until the file changes.
+
+    A file is only read again when its modification time changes, and the schema
+    is only rebuilt when its content hash changes too.
+    """
+    def __init__(self, validator_factory: Callable[[EventSchema], object] = CompiledEventValidator) -> None:
+        """
+        Initializes `SchemaFileRegistry` class
+
+        Args:
+            validator_factory (Callable): builds a validator from a parsed schema
+        """
+        self._validator_factory = validator_factory
+        self._entries: Dict[str, SchemaEntry] = {}
+        self._stats = RegistryStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> RegistryStats:
+        """Registry usage counters property"""
+        return self._stats
+
+    def get(self, file_path: str) -> SchemaEntry:
+        """
+        Gets the loaded schema entry for a file, loading it when needed
+
+        Args:
+            file_path (str): schema file path
+
+        Returns:
+            SchemaEntry: loaded schema and validator
+        """
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        entry = self._entries.get(file_path)
+
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            self._stats.hits += 1
+            return entry
+
+        with self._lock:
+            return self._refresh(file_path=file_path, mtime_ns=mtime_ns)
+
+    def clear(self) -> None:
+        """Drops all loaded schemas and resets counters"""
+        with self._lock:
+            self._entries.clear()
+            self._stats = RegistryStats()
+
+    def _refresh(self, file_path: str, mtime_ns: int) -> SchemaEntry:
+        """
+        Reads the schema file and rebuilds the entry when its content has changed
+
+        Args:
+            file_path (str): schema file path
+            mtime_ns (int): current file modification time
+
+        Returns:
+            SchemaEntry: up-to-date schema entry
+        """
+        with open(file_path, 'rb') as schema_file:
+            content = schema_file.read()
+
+        digest = hashlib.sha256(content).hexdigest()
+        entry = self._entries.get(file_path)
+
+        if entry is not None and entry.digest == digest:
+            entry.mtime_ns = mtime_ns
+            self._stats.hits += 1
+            return entry
+
+        raw_schema = helpers.parse_schema(content)
+        schema = SchemaBuilder(config=raw_schema).construct()
+        entry = SchemaEntry(
+            path=file_path,
+            schema=schema,
+            validator=self._validator_factory(schema),
+            mtime_ns=mtime_ns,
+            digest=digest,
+            raw_schema=raw_schema
+        )
+
+        self._entries[file_path] = entry
+        self._stats.reloads += 1
+
+        return entry
+
+    def discard(self, file_path: str) -> None:
+        """
+        Drops the loaded schema of a file
+
+        Args:
+            file_path (str): schema file path
+        """
+        with self._lock:
+            self._entries.pop(file_path, None)
+
+
+class SchemaRegistry:
+    """
+    Registry of every schema file of a directory, dispatching each raw event to the
+    validator of its schema with a single dictionary lookup.
+
+    With a `discriminator`, events are dispatched by the value of that root field. Each
+    schema declares its value as the `const`, or single `enum` value, of the discriminator
+    property, falling back to the schema file name without extension. Otherwise, events
+    are dispatched by the set of their root keys, which requires them to carry every root
+    key of their schema. Only events whose root keys are shared by several schemas are
+    dispatched by structural fingerprint, which walks and hashes the whole event.
+
+    Schemas are compiled once and only rebuilt when their files change, on `refresh`,
+    on `reload` of a single file, or every `refresh_interval` seconds while dispatching.
+    """
+    def __init__(
+            self,
+            directory: str,
+            discriminator: Optional[str] = None,
+            validator_factory: Callable[[EventSchema], object] = CompiledEventValidator,
+            refresh_interval: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initializes `SchemaRegistry` class, loading every `*.json` file of a directory
+
+        Args:
+            directory (str): directory with JSON schema files
+            discriminator (Optional[str]): root field that tells schemas apart, fingerprints if None
+            validator_factory (Callable): builds a validator from a parsed schema
+            refresh_interval (Optional[float]): seconds between directory checks while
+                dispatching, never if None
+            clock (Callable[[], float]): monotonic clock used to schedule checks
+        """
+        self._directory = directory
+        self._discriminator = discriminator
+        self._files = SchemaFileRegistry(validator_factory=validator_factory)
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._entries: Dict[str, SchemaEntry] = {}
+        # schemas that share root keys are keyed by their fingerprint on a nested table
+        self._dispatch: Dict[Hashable, Union[SchemaEntry, Dict[str, SchemaEntry]]] = {}
+        self._lock = threading.Lock()
+        self._next_refresh = float('inf')
+
+        self.refresh()
+
+    @property
+    def discriminator(self) -> Optional[str]:
+        """Root field that tells schemas apart property"""
+        return self._discriminator
+
+    @property
+    def entries(self) -> Dict[str, SchemaEntry]:
+        """Loaded schemas by file path property"""
+        return self._entries
+
+    def __len__(self) -> int:
+        """Number of loaded schemas"""
+        return len(self._entries)
+
+    def refresh(self) -> None:
+        """Loads new schema files, reloads changed ones and drops removed ones"""
+        with self._lock:
+            paths = sorted(glob.glob(os.path.join(self._directory, '*.json')))
+
+            for removed in self._entries.keys() - set(paths):
+                self._files.discard(file_path=removed)
+
+            self._update({path: self._files.get(file_path=path) for path in paths})
+
+    def reload(self, file_path: str) -> SchemaEntry:
+        """
+        Reloads a single schema file, if it has changed
+
+        Args:
+            file_path (str): schema file path
+
+        Returns:
+            SchemaEntry: up-to-date schema entry
+        """
+        with self._lock:
+            entry = self._files.get(file_path=file_path)
+            self._update({**self._entries, file_path: entry})
+
+        return entry
+
+    def dispatch(self, event: dict) -> Optional[SchemaEntry]:
+        """
+        Finds the schema of a raw event
+
+        Args:
+            event (dict): raw event
+
+        Returns:
+            Optional[SchemaEntry]: schema entry, or None if no schema fits the event
+        """
+        if self._clock() >= self._next_refresh:
+            self._next_refresh = self._clock() + self._refresh_interval
+
+            try:
+                self.refresh()
+            except Exception as error:
+                # keeps dispatching to loaded schemas, e.g. while a file is half written or broken
+                warnings.warn(f"Schemas of {self._directory} were not refreshed: {error}")
+
+        if type(event) is not dict:
+            return None
+
+        if self._discriminator is None:
+            entry = self._dispatch.get(frozenset(event))
+
+            if type(entry) is not dict:
+                return entry
+
+            try:
+                return entry.get(event_fingerprint(event))
+            except RecursionError:
+                # events nested deeper than the maximum depth fit no schema
+                return None
+
+        try:
+            return self._dispatch.get(event.get(self._discriminator))
+        except TypeError:
+            # unhashable discriminator values, like objects, fit no schema
+            return None
+
+    def is_valid(self, event: dict) -> bool:
+        """
+        Validates if a given raw event conforms to its schema
+
+        Args:
+            event (dict): raw event to be checked
+
+        Returns:
+            bool: True if event has a schema and matches it. Otherwise, False
+        """
+        entry = self.dispatch(event=event)
+
+        return entry is not None and entry.validator.is_valid(event=event)
+
+    def validate(self, event: dict, fail_fast: bool = False) -> ValidationResult:
+        """
+        Validates a raw event against its schema
+
+        Args:
+            event (dict): raw event to be checked
+            fail_fast (bool): stops at the first error
+
+        Returns:
+            ValidationResult: validation errors, empty if event matches its schema
+        """
+        entry = self.dispatch(event=event)
+
+        if entry is None:
+            path = (self._discriminator,) if self._discriminator is not None else ()
+            return ValidationResult(errors=[FieldError(kind=ErrorKind.UNKNOWN_SCHEMA, path=path)])
+
+        return entry.validator.validate(event=event, fail_fast=fail_fast)
+
+    def _update(self, entries: Dict[str, SchemaEntry]) -> None:
+        """
+        Replaces loaded schemas and rebuilds the dispatch table
+
+        Args:
+            entries (Dict[str, SchemaEntry]): loaded schemas by file path
+        """
+        dispatch = {}
+
+        for path, entry in entries.items():
+            key = self._get_key(entry)
+            table = dispatch
+
+            if self._discriminator is None and key in dispatch:
+                # schemas that share root keys are told apart by fingerprint
+                if type(dispatch[key]) is not dict:
+                    other = dispatch[key]
+                    dispatch[key] = {schema_fingerprint(other.schema): other}
+
+                table = dispatch[key]
+                key = schema_fingerprint(entry.schema)
+
+            other = table.get(key)
+
+            if other is not None:
+                raise DuplicateSchemaKey(
+                    f"Schemas {other.path} and {path} can not be told apart by {self._discriminator or 'fingerprint'}"
+                )
+
+            table[key] = entry
+
+        # tables are replaced at once, so concurrent dispatches see either version
+        self._entries, self._dispatch = entries, dispatch
+
+        if self._refresh_interval is not None:
+            self._next_refresh = self._clock() + self._refresh_interval
+
+    def _get_key(self, entry: SchemaEntry) -> Hashable:
+        """
+        Gets the dispatch key of a schema
+
+        Args:
+            entry (SchemaEntry): loaded schema
+
+        Returns:
+            Hashable: discriminator value, or root property names
+        """
+        if self._discriminator is None:
+            return frozenset(prop.name for prop in entry.schema.properties)
+
+        prop = entry.raw_schema.get('properties', {}).get(self._discriminator, {})
+
+        if 'const' in prop:
+            return prop['const']
+
+        if len(prop.get('enum', [])) == 1:
+            return prop['enum'][0]
+
+        return os.path.splitext(os.path.basename(entry.path))[0]
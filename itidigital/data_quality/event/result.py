@@ -0,0 +1,117 @@
+"""Module to represent detailed event validation results"""
+
+import enum
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+__all__ = [
+    'ErrorKind',
+    'FieldError',
+    'ValidationResult',
+    'ValidationSummary'
+]
+
+
+class ErrorKind(enum.Enum):
+    """Enum class that represents all kinds of validation errors"""
+    NOT_AN_OBJECT = 'not_an_object'
+    MISSING_KEY = 'missing_key'
+    EXTRA_KEY = 'extra_key'
+    TYPE_MISMATCH = 'type_mismatch'
+    INVALID_ITEMS = 'invalid_items'
+    UNKNOWN_SCHEMA = 'unknown_schema'
+    INVALID_JSON = 'invalid_json'
+
+
+@dataclass(frozen=True, slots=True)
+class FieldError:
+    """
+    Class to represent a single validation error
+
+    Args:
+        kind (ErrorKind): error kind
+        path (Tuple[str, ...]): keys from the event root down to the failing field
+        expected (Optional[str]): expected type, for type and items errors
+        actual (Optional[str]): actual type, for type and items errors
+    """
+    kind: ErrorKind
+    path: Tuple[str, ...]
+    expected: Optional[str] = None
+    actual: Optional[str] = None
+
+    def __str__(self) -> str:
+        """Short error description, like `type_mismatch at address.number: expected integer, got string`"""
+        description = f"{self.kind.value} at {'.'.join(self.path) or '<root>'}"
+
+        if self.expected is not None:
+            description += f": expected {self.expected}, got {self.actual}"
+
+        return description
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """
+    Class to represent the result of validating a single event
+
+    Args:
+        errors (List[FieldError]): errors found, in schema order
+    """
+    errors: List[FieldError] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the event has no errors"""
+        return not self.errors
+
+    def __bool__(self) -> bool:
+        """Truthy for valid events, so results can be used where booleans were"""
+        return not self.errors
+
+
+@dataclass
+class ValidationSummary:
+    """
+    Class to represent counters of validation results aggregated across a batch
+
+    Args:
+        valid (int): number of valid events
+        invalid (int): number of invalid events
+        errors (Counter): number of errors by `ErrorKind`
+    """
+    valid: int = 0
+    invalid: int = 0
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        """Number of validated events"""
+        return self.valid + self.invalid
+
+    def __str__(self) -> str:
+        """Short summary, like `3 events (1 valid, 2 invalid): missing_key 2, extra_key 1`"""
+        description = f"{self.total} events ({self.valid} valid, {self.invalid} invalid)"
+
+        if self.errors:
+            description += ': ' + ', '.join(f"{kind.value} {count}" for kind, count in self.errors.most_common())
+
+        return description
+
+    def add(self, result: ValidationResult) -> ValidationResult:
+        """
+        Counts a validation result
+
+        Args:
+            result (ValidationResult): result to be counted
+
+        Returns:
+            ValidationResult: the same result, so calls can be chained
+        """
+        if result.errors:
+            self.invalid += 1
+            self.errors.update(error.kind for error in result.errors)
+        else:
+            self.valid += 1
+
+        return result
@@ -1,7 +1,316 @@
-from itidigital.data_quality.event.event import Event
+import enum
+import operator
+from itertools import repeat
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from itidigital.data_quality.event.event import Event, FieldType, get_field_type, get_python_types
 from itidigital.utils.schema.event import EventSchema
 from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.utils.schema.fingerprint import event_fingerprint, schema_fingerprint
+from itidigital.data_quality.event.compiler import FieldCheck, ItemsCheck, compile_schema
 from itidigital.data_quality.event.exceptions import InvalidSchemaObject
+from itidigital.data_quality.event.result import ErrorKind, FieldError, ValidationResult
+
+# (parent, name, expected_type, keys, required keys, nullable, items matcher) of each compiled check
+_Plan = Tuple[
+    Tuple[int, str, FieldType, Optional[FrozenSet[str]], Optional[FrozenSet[str]], bool, Optional[Callable]], ...
+]
+
+# stands for missing values
+_MISSING = object()
+
+# stands for skipped objects, so that their children are found missing too
+_SKIPPED: dict = {}
+
+_NONE_TYPES = frozenset({type(None)})
+
+
+class ValidationMode(enum.Enum):
+    """
+    Enum class that represents how compiled validators check events
+
+    STRICT: every schema key must be present and only `null` typed fields accept nulls,
+        like `EventValidator` does
+    SCHEMA: only `required` keys must be present and nullable fields, like
+        `["string", "null"]` ones, also accept nulls
+    """
+    STRICT = 'strict'
+    SCHEMA = 'schema'
+
+
+def _build_plan(checks: Sequence[FieldCheck], mode: ValidationMode) -> _Plan:
+    """
+    Flattens compiled checks into tuples, with their array items compiled into matchers
+
+    Args:
+        checks (Sequence[FieldCheck]): compiled checks
+        mode (ValidationMode): how items are checked
+
+    Returns:
+        _Plan: plan to be run by `_run_plan` or `_run_schema_plan`
+    """
+    return tuple(
+        (
+            check.parent,
+            check.name,
+            check.expected_type,
+            check.keys,
+            check.required_keys,
+            check.nullable,
+            _build_items_matcher(check.items, mode)
+        )
+        for check in checks
+    )
+
+
+def _build_items_matcher(items: Optional[ItemsCheck], mode: ValidationMode) -> Optional[Callable[[Iterable], bool]]:
+    """
+    Builds a function checking every element of an array. Element types are checked by
+    collecting them into a set at C speed, so arrays of primitives are checked without
+    a python loop, and only object or array elements are checked one by one.
+
+    Args:
+        items (Optional[ItemsCheck]): compiled items check
+        mode (ValidationMode): how elements are checked
+
+    Returns:
+        Optional[Callable[[Iterable], bool]]: items matcher, or None when any element is accepted
+    """
+    if items is None:
+        return None
+
+    python_types = get_python_types(items.expected_type)
+
+    if mode is ValidationMode.SCHEMA and items.nullable:
+        python_types = python_types | _NONE_TYPES
+
+    if items.expected_type == FieldType.OBJECT:
+        return _build_object_items_matcher(items, mode, python_types)
+
+    nested_matcher = _build_items_matcher(items.items, mode)
+
+    if nested_matcher is not None:
+        return lambda values: set(map(type, values)) <= python_types and all(
+            value is None or nested_matcher(value) for value in values
+        )
+
+    return lambda values: set(map(type, values)) <= python_types
+
+
+def _build_object_items_matcher(
+        items: ItemsCheck, mode: ValidationMode, python_types: FrozenSet[type]
+) -> Callable[[Iterable], bool]:
+    """
+    Builds a function checking every object element of an array
+
+    Args:
+        items (ItemsCheck): compiled items check of object elements
+        mode (ValidationMode): how elements are checked
+        python_types (FrozenSet[type]): accepted python types of elements
+
+    Returns:
+        Callable[[Iterable], bool]: items matcher
+    """
+    plan, keys, required_keys = _build_plan(items.checks, mode), items.keys, items.required_keys
+
+    if mode is ValidationMode.SCHEMA:
+        return lambda values: set(map(type, values)) <= python_types and all(
+            value is None or (required_keys <= value.keys() <= keys and _run_schema_plan(plan, value))
+            for value in values
+        )
+
+    if all(parent < 0 and nested_keys is None and items_matcher is None
+           for parent, _, _, nested_keys, _, _, items_matcher in plan):
+        # objects of primitives are checked one property at a time across all elements
+        columns = [(operator.itemgetter(name), get_python_types(expected_type)) for _, name, expected_type, *_ in plan]
+
+        return lambda values: (
+            set(map(type, values)) <= python_types
+            and all(map(operator.eq, repeat(keys), map(dict.keys, values)))
+            and all(set(map(type, map(getter, values))) <= types for getter, types in columns)
+        )
+
+    return lambda values: all(
+        type(value) is dict and value.keys() == keys and _run_plan(plan, value) for value in values
+    )
+
+
+def _is_relaxed(checks: Iterable[FieldCheck]) -> bool:
+    """
+    Checks if schema mode would accept more events than strict mode for some checks,
+    because they have optional keys or nullable types
+
+    Args:
+        checks (Iterable[FieldCheck]): compiled checks
+
+    Returns:
+        bool: True if any check, or check of array items, is relaxed. Otherwise, False
+    """
+    pending = [checks]
+
+    while pending:
+        for check in pending.pop():
+            if check.nullable or check.required_keys != check.keys:
+                return True
+
+            items = check.items
+
+            while items is not None:
+                if items.nullable or items.required_keys != items.keys:
+                    return True
+
+                pending.append(items.checks)
+                items = items.items
+
+    return False
+
+
+def _run_plan(plan: _Plan, event: dict) -> bool:
+    """
+    Checks a raw object, whose keys were already checked, against a plan in strict mode
+
+    Args:
+        plan (_Plan): plan built by `_build_plan`
+        event (dict): raw object to be checked
+
+    Returns:
+        bool: True if object matches the plan. Otherwise, False
+    """
+    values = [None] * len(plan)
+
+    for index, (parent, name, expected_type, keys, _, _, items_matcher) in enumerate(plan):
+        value = (event if parent < 0 else values[parent])[name]
+
+        if get_field_type(value) is not expected_type:
+            return False
+
+        if keys is not None and value.keys() != keys:
+            return False
+
+        if items_matcher is not None and not items_matcher(value):
+            return False
+
+        values[index] = value
+
+    return True
+
+
+def _run_schema_plan(plan: _Plan, event: dict) -> bool:
+    """
+    Checks a raw object, whose keys were already checked, against a plan in schema mode.
+    Missing optional values and nulls of nullable fields are skipped along with their
+    children, in the same single pass.
+
+    Args:
+        plan (_Plan): plan built by `_build_plan`
+        event (dict): raw object to be checked
+
+    Returns:
+        bool: True if object matches the plan. Otherwise, False
+    """
+    values = [None] * len(plan)
+
+    for index, (parent, name, expected_type, keys, required_keys, nullable, items_matcher) in enumerate(plan):
+        value = (event if parent < 0 else values[parent]).get(name, _MISSING)
+
+        if value is _MISSING or (value is None and nullable):
+            values[index] = _SKIPPED
+            continue
+
+        if get_field_type(value) is not expected_type:
+            return False
+
+        if keys is not None and not required_keys <= value.keys() <= keys:
+            return False
+
+        if items_matcher is not None and not items_matcher(value):
+            return False
+
+        values[index] = value
+
+    return True
+
+
+def _collect_key_errors(
+        path: Tuple[str, ...],
+        value: dict,
+        keys: FrozenSet[str],
+        required_keys: FrozenSet[str],
+        errors: List[FieldError]
+) -> None:
+    """
+    Collects missing and extra keys of a raw object
+
+    Args:
+        path (Tuple[str, ...]): object path
+        value (dict): raw object
+        keys (FrozenSet[str]): accepted keys
+        required_keys (FrozenSet[str]): keys that must be present
+        errors (List[FieldError]): errors to be appended to
+    """
+    if value.keys() == keys:
+        return
+
+    for key in sorted(required_keys - value.keys()):
+        errors.append(FieldError(kind=ErrorKind.MISSING_KEY, path=(*path, key)))
+
+    for key in sorted(value.keys() - keys):
+        errors.append(FieldError(kind=ErrorKind.EXTRA_KEY, path=(*path, key)))
+
+
+def _collect_plan_errors(
+        plan: _Plan,
+        details: Tuple[Tuple[Tuple[str, ...], Optional[str]], ...],
+        event: dict,
+        relaxed: bool,
+        fail_fast: bool,
+        errors: List[FieldError]
+) -> None:
+    """
+    Collects the errors of a raw object, whose keys were already checked, against a plan.
+    Same single pass as `_run_plan` and `_run_schema_plan`, except that it goes on after errors.
+
+    Args:
+        plan (_Plan): plan built by `_build_plan`
+        details (Tuple): path and expected items type of each plan check
+        event (dict): raw object to be checked
+        relaxed (bool): whether optional keys and nullable types are accepted
+        fail_fast (bool): stops at the first error
+        errors (List[FieldError]): errors to be appended to
+    """
+    values = [None] * len(plan)
+
+    for index, (parent, name, expected_type, keys, required_keys, nullable, items_matcher) in enumerate(plan):
+        # missing keys were already reported along with their parent object
+        value = (event if parent < 0 else values[parent]).get(name, _MISSING)
+
+        if value is _MISSING or (relaxed and nullable and value is None):
+            values[index] = _SKIPPED
+            continue
+
+        path, items_type = details[index]
+        actual_type = get_field_type(value)
+
+        if actual_type is not expected_type:
+            errors.append(
+                FieldError(kind=ErrorKind.TYPE_MISMATCH, path=path, expected=expected_type.value, actual=actual_type.value)
+            )
+            values[index] = _SKIPPED
+
+        else:
+            if keys is not None:
+                _collect_key_errors(path, value, keys, required_keys if relaxed else keys, errors)
+
+            if items_matcher is not None and not items_matcher(value):
+                actual_items = sorted({get_field_type(item).value for item in value})
+                errors.append(
+                    FieldError(kind=ErrorKind.INVALID_ITEMS, path=path, expected=items_type, actual='|'.join(actual_items))
+                )
+
+            values[index] = value
+
+        if errors and fail_fast:
+            return
 
 
 class EventValidator:
@@ -55,3 +364,200 @@ class EventValidator:
         ).construct()
 
         return event_schema == self._schema
+
+
+class CompiledEventValidator:
+    """
+    Event validator that checks raw events against a schema compiled once into
+    a flat list of checks, without building `Event` objects or inferring schemas.
+
+    In `ValidationMode.STRICT` mode it accepts the same events as `EventValidator`,
+    except that object keys may come in any order. In `ValidationMode.SCHEMA` mode
+    it enforces `required` keys and nullable types instead.
+    """
+    def __init__(self, schema: EventSchema, mode: ValidationMode = ValidationMode.STRICT):
+        """
+        Initializes `CompiledEventValidator` class
+
+        Args:
+            schema (EventSchema): schema to be used as reference to validate events
+            mode (ValidationMode): how events are checked against the schema
+        """
+        self._mode = mode
+        self.schema = schema
+
+    @property
+    def schema(self) -> EventSchema:
+        """Schema property"""
+        return self._schema
+
+    @schema.setter
+    def schema(self, new_schema: EventSchema) -> None:
+        """
+        Setter method for schema property. Compiles the new schema.
+
+        Args:
+            new_schema (EventSchema): new schema to be set as reference schema
+
+        Returns
+            None
+        """
+        if not isinstance(new_schema, EventSchema):
+            raise InvalidSchemaObject(
+                f"Schema should be of type EventSchema, but got {type(new_schema)}"
+            )
+
+        self._schema = new_schema
+        self._checks = compile_schema(schema=new_schema)
+        self._root_keys = frozenset(field.name for field in new_schema.properties)
+        self._root_required_keys = frozenset(new_schema.required or [])
+
+        # schemas without optional keys nor nullable types run as fast as in strict mode
+        self._relaxed = self._mode is ValidationMode.SCHEMA and (
+            self._root_required_keys != self._root_keys or _is_relaxed(self._checks)
+        )
+        self._plan = _build_plan(
+            self._checks, ValidationMode.SCHEMA if self._relaxed else ValidationMode.STRICT
+        )
+        self._details = tuple(
+            (check.path, check.items.expected_type.value if check.items is not None else None)
+            for check in self._checks
+        )
+
+    @property
+    def mode(self) -> ValidationMode:
+        """Validation mode property"""
+        return self._mode
+
+    @property
+    def checks(self) -> List[FieldCheck]:
+        """Compiled checks property"""
+        return self._checks
+
+    def is_valid(self, event: dict) -> bool:
+        """
+        Validates if a given raw event conforms to the compiled schema in a single pass
+
+        Args:
+            event (dict): raw event to be checked
+
+        Returns:
+            bool: True if event matches the compiled schema. Otherwise, False
+        """
+        if type(event) is not dict:
+            return False
+
+        if not self._relaxed:
+            return event.keys() == self._root_keys and _run_plan(self._plan, event)
+
+        return self._root_required_keys <= event.keys() <= self._root_keys and _run_schema_plan(self._plan, event)
+
+    def validate(self, event: dict, fail_fast: bool = False) -> ValidationResult:
+        """
+        Validates a raw event against the compiled schema, collecting every error in
+        the same single pass that `is_valid` does
+
+        Args:
+            event (dict): raw event to be checked
+            fail_fast (bool): stops at the first error
+
+        Returns:
+            ValidationResult: validation errors, empty if event matches the compiled schema
+        """
+        result = ValidationResult()
+
+        if type(event) is not dict:
+            result.errors.append(
+                FieldError(
+                    kind=ErrorKind.NOT_AN_OBJECT,
+                    path=(),
+                    expected=FieldType.OBJECT.value,
+                    actual=get_field_type(event).value
+                )
+            )
+            return result
+
+        _collect_key_errors(
+            (), event, self._root_keys, self._root_required_keys if self._relaxed else self._root_keys, result.errors
+        )
+
+        if not (result.errors and fail_fast):
+            _collect_plan_errors(self._plan, self._details, event, self._relaxed, fail_fast, result.errors)
+
+        if fail_fast:
+            del result.errors[1:]
+
+        return result
+
+
+class FingerprintEventValidator:
+    """
+    Event validator that accepts any of several schemas, by looking up the
+    structural fingerprint of each raw event among the accepted schema fingerprints.
+
+    Like `CompiledEventValidator`, object keys may come in any order. Array items
+    are not part of fingerprints, so array elements are not checked.
+    """
+    def __init__(self, schemas: Iterable[EventSchema] = ()):
+        """
+        Initializes `FingerprintEventValidator` class
+
+        Args:
+            schemas (Iterable[EventSchema]): accepted schemas
+        """
+        self._schemas: Dict[str, EventSchema] = {}
+
+        for schema in schemas:
+            self.add(schema=schema)
+
+    @property
+    def schemas(self) -> Dict[str, EventSchema]:
+        """Accepted schemas by fingerprint property"""
+        return self._schemas
+
+    def add(self, schema: EventSchema) -> str:
+        """
+        Accepts a new schema
+
+        Args:
+            schema (EventSchema): schema to be accepted
+
+        Returns:
+            str: schema fingerprint
+        """
+        if not isinstance(schema, EventSchema):
+            raise InvalidSchemaObject(
+                f"Schema should be of type EventSchema, but got {type(schema)}"
+            )
+
+        fingerprint = schema_fingerprint(schema)
+        self._schemas[fingerprint] = schema
+
+        return fingerprint
+
+    def match(self, event: dict) -> Optional[EventSchema]:
+        """
+        Finds the accepted schema that a raw event matches
+
+        Args:
+            event (dict): raw event
+
+        Returns:
+            Optional[EventSchema]: matched schema, or None if no schema matches
+        """
+        if type(event) is not dict:
+            return None
+
+        return self._schemas.get(event_fingerprint(event))
+
+    def is_valid(self, event: dict) -> bool:
+        """
+        Validates if a given raw event matches any accepted schema
+
+        Args:
+            event (dict): raw event to be checked
+
+        Returns:
+            bool: True if event matches an accepted schema. Otherwise, False
+        """
+        return self.match(event=event) is not None
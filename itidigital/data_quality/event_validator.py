@@ -1,20 +1,76 @@
 import os
-import json
-import boto3
+import base64
+import binascii
+import threading
+from typing import Iterator, Optional, Tuple, Union
 
 from itidigital import variables
-from itidigital.utils.schema import helpers
-from itidigital.utils.schema.builder import SchemaBuilder
-from itidigital.data_quality.event.builder import EventBuilder
-from itidigital.data_quality.event.validator import EventValidator
+from itidigital.utils import serialization
+from itidigital.utils.aws import sqs
+from itidigital.data_quality.router import EventRouter, route_event
+from itidigital.data_quality.event.result import ValidationSummary
+from itidigital.data_quality.event.exceptions import EventNotSentError
+from itidigital.data_quality.event.registry import SchemaFileRegistry, SchemaRegistry
 
 _SQS_CLIENT = None
+_SQS_CLIENT_LOCK = threading.Lock()
+_QUEUE_URLS = sqs.QueueUrlCache()
 _VALID_EVENTS_QUEUE_NAME = 'valid-events-queue'
+_INVALID_EVENTS_QUEUE_NAME = 'invalid-events-queue'
 _SCHEMA_FILE_PATH = os.path.join(
         variables.PROJECT_ROOT_PATH,
         'itidigital/data_quality/schema.json'
 )
+_SCHEMA_REGISTRY = SchemaFileRegistry()
 
+# with a schema directory, events of several types and versions are dispatched to their schemas
+_SCHEMA_DIRECTORY = os.environ.get('SCHEMA_DIRECTORY')
+_SCHEMA_DISCRIMINATOR = os.environ.get('SCHEMA_DISCRIMINATOR')
+_SCHEMA_REFRESH_INTERVAL = float(os.environ.get('SCHEMA_REFRESH_INTERVAL', 60))
+_SCHEMAS: Optional[SchemaRegistry] = None
+_SCHEMAS_LOCK = threading.Lock()
+
+
+def get_sqs_client():
+    """
+    Gets the SQS client shared by the whole process, creating it on first use
+
+    Returns:
+        SQS client
+    """
+    global _SQS_CLIENT
+
+    if _SQS_CLIENT is None:
+        with _SQS_CLIENT_LOCK:
+            if _SQS_CLIENT is None:
+                _SQS_CLIENT = sqs.create_sqs_client(region_name="us-east-1")
+
+    return _SQS_CLIENT
+
+
+def _get_validator():
+    """
+    Gets the validator of incoming events, which is the registry of every schema of
+    `SCHEMA_DIRECTORY` when it is set, or the validator of the default schema file
+
+    Returns:
+        Union[SchemaRegistry, CompiledEventValidator]: validator with `is_valid` and `validate`
+    """
+    global _SCHEMAS
+
+    if _SCHEMA_DIRECTORY is None:
+        return _SCHEMA_REGISTRY.get(file_path=_SCHEMA_FILE_PATH).validator
+
+    if _SCHEMAS is None:
+        with _SCHEMAS_LOCK:
+            if _SCHEMAS is None:
+                _SCHEMAS = SchemaRegistry(
+                    directory=_SCHEMA_DIRECTORY,
+                    discriminator=_SCHEMA_DISCRIMINATOR,
+                    refresh_interval=_SCHEMA_REFRESH_INTERVAL
+                )
+
+    return _SCHEMAS
 
 
 def send_event_to_queue(event, queue_name):
@@ -24,15 +80,14 @@ def send_event_to_queue(event, queue_name):
     :param queue_name: Nome da fila (str)
     :return: None
     """
-    
-    sqs_client = boto3.client("sqs", region_name="us-east-1")
-    response = sqs_client.get_queue_url(
-        QueueName=queue_name
-    )
-    queue_url = response['QueueUrl']
-    response = sqs_client.send_message(
-        QueueUrl=queue_url,
-        MessageBody=json.dumps(event)
+    sqs_client = get_sqs_client()
+    response = _QUEUE_URLS.call(
+        sqs_client=sqs_client,
+        queue_name=queue_name,
+        operation=lambda queue_url: sqs_client.send_message(
+            QueueUrl=queue_url,
+            MessageBody=serialization.dumps(event)
+        )
     )
     print(f"Response status code: [{response['ResponseMetadata']['HTTPStatusCode']}]")
 
@@ -44,17 +99,106 @@ def handler(raw_event):
     Você pode criar funções/classes à vontade
     Utilize a função send_event_to_queue para envio do evento para a fila,
         não é necessário alterá-la
+
+    Raises EventNotSentError when SQS rejects the event, so that it is retried.
     """
-    raw_schema = helpers.load_schema(file_path=_SCHEMA_FILE_PATH)
+    validator = _get_validator()
+    router = EventRouter(sqs_client=get_sqs_client(), queue_urls=_QUEUE_URLS)
 
-    event = EventBuilder(config=raw_event).construct()
-    schema = SchemaBuilder(config=raw_schema).construct()
-    validator = EventValidator(schema=schema)
+    route_event(
+        router=router,
+        validator=validator,
+        identifier='0',
+        raw_event=raw_event,
+        valid_queue_name=_VALID_EVENTS_QUEUE_NAME,
+        invalid_queue_name=_INVALID_EVENTS_QUEUE_NAME
+    )
 
-    is_valid_event = validator.is_valid(event=event)
+    if router.flush():
+        raise EventNotSentError("Event could not be sent to its destination queue")
 
-    if is_valid_event:
-        send_event_to_queue(
-            event=raw_event,
-            queue_name=_VALID_EVENTS_QUEUE_NAME
-        )
+
+def _decode_record(record: dict) -> Tuple[str, Optional[dict]]:
+    """
+    Decodes a SQS or Kinesis lambda record into its identifier and raw event
+
+    Args:
+        record (dict): lambda event record
+
+    Returns:
+        Tuple[str, Optional[dict]]: record identifier and raw event, or None if it can not be decoded
+    """
+    try:
+        if 'kinesis' in record:
+            identifier = record['kinesis']['sequenceNumber']
+            payload = base64.b64decode(record['kinesis']['data'])
+        else:
+            identifier = record['messageId']
+            payload = record['body']
+
+        return identifier, serialization.loads(payload)
+
+    except (KeyError, binascii.Error, ValueError):
+        return record.get('messageId') or record.get('kinesis', {}).get('sequenceNumber'), None
+
+
+def _iter_batch(events: Union[list, dict]) -> Iterator[Tuple[str, Optional[dict]]]:
+    """
+    Iterates over a batch of events
+
+    Args:
+        events (Union[list, dict]): list of raw events, or SQS / Kinesis lambda event with `Records`
+
+    Returns:
+        Iterator[Tuple[str, Optional[dict]]]: identifier and raw event of each message
+    """
+    if isinstance(events, dict):
+        for record in events.get('Records', []):
+            yield _decode_record(record)
+
+    else:
+        for index, raw_event in enumerate(events):
+            yield str(index), raw_event
+
+
+def handle_batch(events: Union[list, dict]) -> dict:
+    """
+    Validates a batch of events and routes valid ones to the valid events queue and
+    invalid ones, along with their validation errors, to the invalid events queue.
+    Each queue gets up to 10 events per `send_message_batch` call.
+
+    Messages that can not be decoded or sent are reported back, so that only them are retried.
+    The number of valid and invalid events, and of errors by kind, is printed once per batch.
+
+    Args:
+        events (Union[list, dict]): list of raw events, or SQS / Kinesis lambda event with `Records`
+
+    Returns:
+        dict: partial batch response, like `{"batchItemFailures": [{"itemIdentifier": "..."}]}`
+    """
+    validator = _get_validator()
+    failures = []
+    summary = ValidationSummary()
+
+    router = EventRouter(sqs_client=get_sqs_client(), queue_urls=_QUEUE_URLS)
+
+    for identifier, raw_event in _iter_batch(events):
+        if raw_event is None:
+            failures.append(identifier)
+        else:
+            route_event(
+                router=router,
+                validator=validator,
+                identifier=identifier,
+                raw_event=raw_event,
+                valid_queue_name=_VALID_EVENTS_QUEUE_NAME,
+                invalid_queue_name=_INVALID_EVENTS_QUEUE_NAME,
+                summary=summary
+            )
+
+    failures.extend(router.flush())
+    print(f"Validated {summary}")
+
+    return {
+        "batchItemFailures": [{"itemIdentifier": identifier} for identifier in failures]
+    }
@@ -10,6 +10,9 @@ def main(raw_event: dict):
     _SQS_CLIENT.create_queue(
         QueueName='valid-events-queue'
     )
+    _SQS_CLIENT.create_queue(
+        QueueName='invalid-events-queue'
+    )
     event_validator._SQS_CLIENT = _SQS_CLIENT
     event_validator.handler(raw_event)
 
@@ -0,0 +1,243 @@
+"""Module to validate large newline-delimited JSON files on multiple processes"""
+
+import os
+import time
+import shutil
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality import stream
+from itidigital.data_quality.event.validator import CompiledEventValidator, ValidationMode
+
+__all__ = [
+    'is_splittable',
+    'split_file',
+    'ParallelEventValidator'
+]
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Validator of each worker process, compiled once by `_init_worker`
+_WORKER_VALIDATOR: Optional[CompiledEventValidator] = None
+
+
+def is_splittable(path: str) -> bool:
+    """
+    Checks if whether a file can be split into byte ranges, which only holds for
+    uncompressed newline-delimited JSON files
+
+    Args:
+        path (str): file path, `.gz` suffix for gzip files or `-` for standard input
+
+    Returns:
+        bool: True if file can be validated in parallel. Otherwise, False
+    """
+    if path == '-' or path.endswith('.gz'):
+        return False
+
+    with open(path, 'rb') as file:
+        # a JSON array is a single document, its elements can not be told apart by newlines
+        return not stream.is_json_array(file)
+
+
+def split_file(path: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into byte ranges of about `chunk_size` bytes, every range
+    ending right after a newline so no line is split between ranges
+
+    Args:
+        path (str): file path
+        chunk_size (int): approximate size of each range
+
+    Returns:
+        List[Tuple[int, int]]: `(start, end)` byte offsets of each range
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+
+    with open(path, 'rb') as file:
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()
+            end = min(file.tell(), size)
+
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _init_worker(raw_schema: dict, mode: ValidationMode = ValidationMode.STRICT) -> None:
+    """
+    Compiles the schema once when a worker process starts
+
+    Args:
+        raw_schema (dict): JSON schema loaded as dictionary
+        mode (ValidationMode): how events are checked against the schema
+    """
+    global _WORKER_VALIDATOR
+
+    schema = SchemaBuilder(config=raw_schema).construct()
+    _WORKER_VALIDATOR = CompiledEventValidator(schema=schema, mode=mode)
+
+
+def _iter_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    """
+    Reads the lines of a byte range
+
+    Args:
+        path (str): file path
+        start (int): first byte offset, at the beginning of a line
+        end (int): byte offset where the range stops, at the beginning of a line
+
+    Returns:
+        Iterator[bytes]: lines of the range
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        position = start
+
+        while position < end:
+            line = file.readline()
+
+            if not line:
+                return
+
+            position += len(line)
+            yield line
+
+
+def _validate_range(path: str, start: int, end: int, output_dir: str) -> Tuple[str, str, int, int]:
+    """
+    Validates the events of a byte range on a worker process, writing valid and
+    invalid events to part files
+
+    Args:
+        path (str): input file path
+        start (int): first byte offset of the range
+        end (int): last byte offset of the range
+        output_dir (str): directory for part files
+
+    Returns:
+        Tuple[str, str, int, int]: valid and invalid part file paths, and their counts
+    """
+    valid_path = os.path.join(output_dir, f'{start:020d}.valid')
+    invalid_path = os.path.join(output_dir, f'{start:020d}.invalid')
+    stats = stream.StreamStats()
+
+    with open(valid_path, 'wb') as valid_output, open(invalid_path, 'wb') as invalid_output:
+        results = stream.validate_records(
+            records=stream.iter_ndjson(_iter_range(path, start, end)),
+            validator=_WORKER_VALIDATOR,
+            stats=stats
+        )
+        stream.write_records(
+            results=results,
+            valid_output=valid_output,
+            invalid_output=invalid_output
+        )
+
+    return valid_path, invalid_path, stats.valid, stats.invalid
+
+
+class ParallelEventValidator:
+    """
+    Validates uncompressed newline-delimited JSON files on a pool of processes.
+
+    The input is split into byte ranges aligned to newlines. Every worker compiles
+    the schema once at startup, so tasks only carry file offsets.
+    """
+    def __init__(
+            self,
+            raw_schema: dict,
+            max_workers: Optional[int] = None,
+            chunk_size: int = _DEFAULT_CHUNK_SIZE,
+            mode: ValidationMode = ValidationMode.STRICT
+    ) -> None:
+        """
+        Initializes `ParallelEventValidator` class
+
+        Args:
+            raw_schema (dict): JSON schema loaded as dictionary
+            max_workers (Optional[int]): number of worker processes, CPU count if None
+            chunk_size (int): approximate number of bytes validated per task
+            mode (ValidationMode): how events are checked against the schema
+        """
+        self._raw_schema = raw_schema
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._mode = mode
+
+    def validate_file(
+            self,
+            input_path: str,
+            valid_output: Optional[BinaryIO] = None,
+            invalid_output: Optional[BinaryIO] = None,
+            ordered: bool = True
+    ) -> stream.StreamStats:
+        """
+        Validates a file and writes valid and invalid events to separate outputs
+
+        Args:
+            input_path (str): uncompressed newline-delimited JSON file path
+            valid_output (Optional[BinaryIO]): stream for valid events, discarded if None
+            invalid_output (Optional[BinaryIO]): stream for invalid events, discarded if None
+            ordered (bool): keeps input order on outputs. Otherwise, ranges are written
+                as soon as they are validated
+
+        Returns:
+            stream.StreamStats: validation counters
+        """
+        if not is_splittable(input_path):
+            raise ValueError(
+                "Only uncompressed newline-delimited JSON files can be split, validate "
+                "gzip files, JSON arrays and standard input sequentially instead"
+            )
+
+        stats = stream.StreamStats(started_at=time.perf_counter())
+        ranges = split_file(path=input_path, chunk_size=self._chunk_size)
+
+        with tempfile.TemporaryDirectory() as output_dir, ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_init_worker,
+                initargs=(self._raw_schema, self._mode)
+        ) as executor:
+            futures = [
+                executor.submit(_validate_range, input_path, start, end, output_dir)
+                for start, end in ranges
+            ]
+
+            for future in (futures if ordered else as_completed(futures)):
+                self._merge(future, stats, valid_output, invalid_output)
+
+        return stats
+
+    @staticmethod
+    def _merge(
+            future: Future,
+            stats: stream.StreamStats,
+            valid_output: Optional[BinaryIO],
+            invalid_output: Optional[BinaryIO]
+    ) -> None:
+        """
+        Appends the part files of a validated range to the outputs
+
+        Args:
+            future (Future): `_validate_range` task
+            stats (stream.StreamStats): counters to be updated
+            valid_output (Optional[BinaryIO]): stream for valid events
+            invalid_output (Optional[BinaryIO]): stream for invalid events
+        """
+        valid_path, invalid_path, valid, invalid = future.result()
+        stats.valid += valid
+        stats.invalid += invalid
+
+        for part_path, output in [(valid_path, valid_output), (invalid_path, invalid_output)]:
+            if output is not None:
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, output)
+
+            os.remove(part_path)
@@ -0,0 +1,309 @@
+"""Module to route validated events to their destination queues in batches"""
+
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from itidigital.utils import serialization
+from itidigital.utils.aws import sqs
+from itidigital.data_quality.event.result import ValidationResult, ValidationSummary
+
+__all__ = [
+    'error_attributes',
+    'route_event',
+    'EventRouter'
+]
+
+# errors described on the `errors` attribute, the count attribute has the full number
+_MAX_DESCRIBED_ERRORS = 10
+
+
+def error_attributes(result: ValidationResult) -> Dict[str, dict]:
+    """
+    Summarizes the errors of a validation result as SQS message attributes
+
+    Args:
+        result (ValidationResult): result of an invalid event
+
+    Returns:
+        Dict[str, dict]: `error_count`, `error_kinds` and `errors` message attributes
+    """
+    kinds = sorted({error.kind.value for error in result.errors})
+    descriptions = '; '.join(str(error) for error in result.errors[:_MAX_DESCRIBED_ERRORS])
+
+    return {
+        'error_count': {'DataType': 'Number', 'StringValue': str(len(result.errors))},
+        'error_kinds': {'DataType': 'String', 'StringValue': ','.join(kinds) or 'unknown'},
+        'errors': {'DataType': 'String', 'StringValue': descriptions or 'unknown'}
+    }
+
+
+@dataclass
+class _QueueBuffer:
+    """
+    Class to represent the entries waiting to be sent to a queue
+
+    Args:
+        started_at (float): clock value when the first entry was buffered
+        entries (List[dict]): `send_message_batch` entries, with their index as `Id`
+        identifiers (List[str]): caller identifier of each entry
+        size (int): total payload size of entries
+    """
+    started_at: float
+    entries: List[dict] = field(default_factory=list)
+    identifiers: List[str] = field(default_factory=list)
+    size: int = 0
+
+
+class EventRouter:
+    """
+    Buffers events per destination queue and sends each buffer with a single
+    `send_message_batch` call once it is full, by entry count or payload size, or
+    once its oldest event waited `max_delay` seconds.
+
+    Waiting time is checked whenever an event is routed. Long running callers that may
+    go idle should call `flush_expired` periodically, and every caller should `flush`
+    when done, which the context manager does on exit.
+    """
+    def __init__(
+            self,
+            sqs_client,
+            queue_urls: Optional[sqs.QueueUrlCache] = None,
+            max_entries: int = sqs.MAX_BATCH_ENTRIES,
+            max_bytes: int = sqs.MAX_BATCH_BYTES,
+            max_delay: float = 1.0,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initializes `EventRouter` class
+
+        Args:
+            sqs_client: boto3 SQS client
+            queue_urls (Optional[sqs.QueueUrlCache]): queue URL cache, a new one if None
+            max_entries (int): maximum number of entries per batch
+            max_bytes (int): maximum total payload size per batch
+            max_delay (float): seconds that an event may wait on a buffer
+            clock (Callable[[], float]): monotonic clock used to expire buffers
+        """
+        if not 1 <= max_entries <= sqs.MAX_BATCH_ENTRIES:
+            raise ValueError(f"max_entries should be between 1 and {sqs.MAX_BATCH_ENTRIES}, but got {max_entries}")
+
+        self._sqs_client = sqs_client
+        self._queue_urls = queue_urls if queue_urls is not None else sqs.QueueUrlCache()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._clock = clock
+        self._buffers: Dict[str, _QueueBuffer] = {}
+        self._failures: List[str] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'EventRouter':
+        """Starts routing"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Sends every buffered event"""
+        self.flush()
+
+    @property
+    def failures(self) -> List[str]:
+        """Identifiers of events that SQS rejected since the last `flush`"""
+        return self._failures
+
+    def pending(self, queue_name: Optional[str] = None) -> int:
+        """
+        Gets the number of buffered events
+
+        Args:
+            queue_name (Optional[str]): queue name, all queues if None
+
+        Returns:
+            int: number of events waiting to be sent
+        """
+        if queue_name is not None:
+            buffer = self._buffers.get(queue_name)
+            return len(buffer.entries) if buffer is not None else 0
+
+        return sum(len(buffer.entries) for buffer in self._buffers.values())
+
+    def route(self, queue_name: str, event: dict, identifier: str, attributes: Optional[dict] = None) -> None:
+        """
+        Buffers an event for a queue, sending the buffers that got ready
+
+        Args:
+            queue_name (str): destination queue name
+            event (dict): raw event, sent as JSON
+            identifier (str): caller identifier, reported back if the event is rejected
+            attributes (Optional[dict]): SQS message attributes
+        """
+        self.route_body(
+            queue_name=queue_name,
+            body=serialization.dumps(event),
+            identifier=identifier,
+            attributes=attributes
+        )
+
+    def route_body(self, queue_name: str, body: str, identifier: str, attributes: Optional[dict] = None) -> None:
+        """
+        Buffers a message body for a queue as it is, like the body of a message that is not
+        JSON, sending the buffers that got ready
+
+        Args:
+            queue_name (str): destination queue name
+            body (str): message body
+            identifier (str): caller identifier, reported back if the message is rejected
+            attributes (Optional[dict]): SQS message attributes
+        """
+        entry = {'MessageBody': body}
+
+        if attributes:
+            entry['MessageAttributes'] = attributes
+
+        size = sqs.entry_size(entry)
+        ready = []
+
+        with self._lock:
+            now = self._clock()
+            buffer = self._buffers.get(queue_name)
+
+            if buffer is not None and (
+                    len(buffer.entries) == self._max_entries or buffer.size + size > self._max_bytes
+            ):
+                ready.append((queue_name, self._buffers.pop(queue_name)))
+                buffer = None
+
+            if buffer is None:
+                buffer = self._buffers[queue_name] = _QueueBuffer(started_at=now)
+
+            entry['Id'] = str(len(buffer.entries))
+            buffer.entries.append(entry)
+            buffer.identifiers.append(identifier)
+            buffer.size += size
+
+            if len(buffer.entries) == self._max_entries:
+                ready.append((queue_name, self._buffers.pop(queue_name)))
+
+            ready.extend(self._pop_expired(now))
+
+        self._send(ready)
+
+    def flush_expired(self) -> None:
+        """Sends the buffers whose oldest event waited `max_delay` seconds"""
+        with self._lock:
+            ready = self._pop_expired(self._clock())
+
+        self._send(ready)
+
+    def flush(self) -> List[str]:
+        """
+        Sends every buffered event
+
+        Returns:
+            List[str]: identifiers of events that SQS rejected since the last `flush`
+        """
+        with self._lock:
+            ready = list(self._buffers.items())
+            self._buffers.clear()
+
+        self._send(ready)
+
+        with self._lock:
+            failures, self._failures = self._failures, []
+
+        return failures
+
+    def _pop_expired(self, now: float) -> List[tuple]:
+        """
+        Removes the buffers whose oldest event waited `max_delay` seconds
+
+        Args:
+            now (float): current clock value
+
+        Returns:
+            List[tuple]: queue name and buffer of each expired buffer
+        """
+        expired = [
+            queue_name
+            for queue_name, buffer in self._buffers.items()
+            if now - buffer.started_at >= self._max_delay
+        ]
+
+        return [(queue_name, self._buffers.pop(queue_name)) for queue_name in expired]
+
+    def _send(self, ready: List[tuple]) -> None:
+        """
+        Sends buffers, one `send_message_batch` call each, keeping track of rejected events.
+        Buffers are already removed, so every event of a call that raised is rejected.
+
+        Args:
+            ready (List[tuple]): queue name and buffer of each buffer to be sent
+        """
+        for queue_name, buffer in ready:
+            try:
+                failed = self._queue_urls.call(
+                    sqs_client=self._sqs_client,
+                    queue_name=queue_name,
+                    operation=lambda queue_url: sqs.send_message_batch(
+                        sqs_client=self._sqs_client,
+                        queue_url=queue_url,
+                        entries=buffer.entries
+                    )
+                )
+            except ClientError:
+                failed = buffer.entries
+
+            if failed:
+                with self._lock:
+                    self._failures.extend(buffer.identifiers[int(entry['Id'])] for entry in failed)
+
+
+def route_event(
+        router: EventRouter,
+        validator,
+        identifier: str,
+        raw_event: dict,
+        valid_queue_name: str,
+        invalid_queue_name: str,
+        summary: Optional[ValidationSummary] = None
+) -> bool:
+    """
+    Routes a raw event to the valid events queue, or to the invalid events queue
+    with its validation errors as message attributes
+
+    Args:
+        router (EventRouter): router buffering the events
+        validator (CompiledEventValidator): validator to check the event with
+        identifier (str): event identifier, reported back if the event is rejected
+        raw_event (dict): raw event
+        valid_queue_name (str): destination of valid events
+        invalid_queue_name (str): destination of invalid events
+        summary (Optional[ValidationSummary]): counters of validation results to be updated
+
+    Returns:
+        bool: True if event is valid. Otherwise, False
+    """
+    # valid events, the common case, take the boolean fast path and are walked once. Only
+    # invalid ones, where `is_valid` stopped at the first error, are walked again for details
+    if validator.is_valid(event=raw_event):
+        if summary is not None:
+            summary.valid += 1
+
+        router.route(queue_name=valid_queue_name, event=raw_event, identifier=identifier)
+        return True
+
+    result = validator.validate(event=raw_event, fail_fast=False)
+
+    if summary is not None:
+        summary.add(result)
+
+    router.route(
+        queue_name=invalid_queue_name,
+        event=raw_event,
+        identifier=identifier,
+        attributes=error_attributes(result)
+    )
+    return False
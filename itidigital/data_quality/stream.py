@@ -0,0 +1,299 @@
+"""Module to validate large event files as a streaming generator pipeline"""
+
+import io
+import sys
+import gzip
+import json
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from itidigital.utils import serialization
+from itidigital.data_quality.event.exceptions import InvalidJsonArray
+from itidigital.data_quality.event.validator import CompiledEventValidator
+
+__all__ = [
+    'Record',
+    'StreamStats',
+    'open_input',
+    'open_output',
+    'iter_ndjson',
+    'iter_json_array',
+    'is_json_array',
+    'iter_records',
+    'validate_records',
+    'write_records'
+]
+
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = b' \t\r\n'
+
+
+class Record(NamedTuple):
+    """
+    Class to represent a single event read from a stream
+
+    Args:
+        raw (bytes): event as found on input, without line terminator
+        event (Optional[dict]): decoded event, or None if `raw` is not a JSON object
+    """
+    raw: bytes
+    event: Optional[dict]
+
+
+@dataclass
+class StreamStats:
+    """
+    Class to represent streaming validation counters
+
+    Args:
+        valid (int): number of valid events
+        invalid (int): number of invalid or malformed events
+        started_at (float): `time.perf_counter` value when validation started
+    """
+    valid: int = 0
+    invalid: int = 0
+    started_at: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of processed events"""
+        return self.valid + self.invalid
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since validation started"""
+        return time.perf_counter() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Processed events per second"""
+        elapsed = self.elapsed
+        return self.total / elapsed if elapsed > 0 else 0.0
+
+
+def open_input(path: str) -> BinaryIO:
+    """
+    Opens an input file for binary reading, decompressing gzip files on the fly
+
+    Args:
+        path (str): file path, `.gz` suffix for gzip files or `-` for standard input
+
+    Returns:
+        BinaryIO: readable binary stream
+    """
+    if path == '-':
+        return sys.stdin.buffer
+
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+
+    return open(path, 'rb')
+
+
+def open_output(path: str) -> BinaryIO:
+    """
+    Opens an output file for binary writing, compressing `.gz` files on the fly
+
+    Args:
+        path (str): file path, `.gz` suffix for gzip files or `-` for standard output
+
+    Returns:
+        BinaryIO: writable binary stream
+    """
+    if path == '-':
+        return sys.stdout.buffer
+
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wb')
+
+    return open(path, 'wb')
+
+
+def _decode(raw: bytes) -> Optional[dict]:
+    """
+    Decodes a raw JSON object
+
+    Args:
+        raw (bytes): JSON document
+
+    Returns:
+        Optional[dict]: decoded object, or None if `raw` is not a JSON object
+    """
+    try:
+        event = serialization.loads(raw)
+    except ValueError:
+        return None
+
+    return event if isinstance(event, dict) else None
+
+
+def iter_ndjson(stream: BinaryIO) -> Iterator[Record]:
+    """
+    Reads newline-delimited JSON events one line at a time
+
+    Args:
+        stream (BinaryIO): readable binary stream
+
+    Returns:
+        Iterator[Record]: one record per non-blank line
+    """
+    for line in stream:
+        raw = line.strip(_WHITESPACE)
+
+        if raw:
+            yield Record(raw=raw, event=_decode(raw))
+
+
+def iter_json_array(stream: BinaryIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[Record]:
+    """
+    Reads the elements of a top-level JSON array incrementally, keeping at most one
+    element and one chunk in memory
+
+    Args:
+        stream (BinaryIO): readable binary stream
+        chunk_size (int): number of characters read at once
+
+    Returns:
+        Iterator[Record]: one record per array element
+
+    Raises:
+        InvalidJsonArray: if stream does not hold a JSON array, or an element can not be
+            decoded, with the character offset where decoding stopped
+    """
+    decoder = json.JSONDecoder()
+    text = io.TextIOWrapper(stream, encoding='utf-8')
+    buffer, position, eof, started = '', 0, False, False
+    # characters dropped from the buffer, so offsets are relative to the whole stream
+    consumed = 0
+
+    try:
+        while True:
+            while position < len(buffer) and (buffer[position].isspace() or buffer[position] == ','):
+                position += 1
+
+            if position < len(buffer) and not started:
+                if buffer[position] != '[':
+                    raise InvalidJsonArray("Expected a JSON array", consumed + position)
+                started, position = True, position + 1
+                continue
+
+            if position < len(buffer) and buffer[position] == ']':
+                return
+
+            if position < len(buffer):
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except ValueError:
+                    end = None
+
+                # a value ending on buffer end could be a truncated number or literal
+                if end is not None and (end < len(buffer) or eof):
+                    raw = buffer[position:end]
+                    yield Record(raw=raw.encode('utf-8'), event=value if isinstance(value, dict) else None)
+                    position = end
+                    continue
+
+                if eof:
+                    raise InvalidJsonArray(
+                        f"Invalid JSON array element {buffer[position:position + 80]!r}", consumed + position
+                    )
+
+            if eof:
+                if started:
+                    raise InvalidJsonArray("Unterminated JSON array", consumed + position)
+                return
+
+            chunk = text.read(chunk_size)
+            eof = not chunk
+            consumed += position
+            buffer = buffer[position:] + chunk
+            position = 0
+
+    finally:
+        # leaves `stream` open for the caller
+        text.detach()
+
+
+def is_json_array(stream: BinaryIO) -> bool:
+    """
+    Checks if whether a stream holds a JSON array, peeking at its first non-blank byte
+    without consuming it
+
+    Args:
+        stream (BinaryIO): readable binary stream with a `peek` method
+
+    Returns:
+        bool: True if stream starts with `[`. Otherwise, False
+    """
+    return stream.peek(_CHUNK_SIZE).lstrip(_WHITESPACE).startswith(b'[')
+
+
+def iter_records(stream: BinaryIO) -> Iterator[Record]:
+    """
+    Reads events from a stream holding either a JSON array or newline-delimited JSON
+
+    Args:
+        stream (BinaryIO): readable binary stream
+
+    Returns:
+        Iterator[Record]: events found on stream
+    """
+    stream = stream if hasattr(stream, 'peek') else io.BufferedReader(stream)
+
+    if is_json_array(stream):
+        return iter_json_array(stream)
+
+    return iter_ndjson(stream)
+
+
+def validate_records(
+        records: Iterable[Record],
+        validator: CompiledEventValidator,
+        stats: Optional[StreamStats] = None
+) -> Iterator[Tuple[bool, Record]]:
+    """
+    Validates records lazily
+
+    Args:
+        records (Iterable[Record]): records to be validated
+        validator (CompiledEventValidator): validator to check events with
+        stats (Optional[StreamStats]): counters to be updated
+
+    Returns:
+        Iterator[Tuple[bool, Record]]: validation result and record
+    """
+    stats = stats if stats is not None else StreamStats()
+    stats.started_at = stats.started_at or time.perf_counter()
+    is_valid = validator.is_valid
+
+    for record in records:
+        valid = record.event is not None and is_valid(record.event)
+
+        if valid:
+            stats.valid += 1
+        else:
+            stats.invalid += 1
+
+        yield valid, record
+
+
+def write_records(
+        results: Iterable[Tuple[bool, Record]],
+        valid_output: Optional[BinaryIO] = None,
+        invalid_output: Optional[BinaryIO] = None
+) -> None:
+    """
+    Writes valid and invalid records as newline-delimited JSON to separate outputs
+
+    Args:
+        results (Iterable[Tuple[bool, Record]]): validation results
+        valid_output (Optional[BinaryIO]): stream for valid events, discarded if None
+        invalid_output (Optional[BinaryIO]): stream for invalid events, discarded if None
+    """
+    for valid, record in results:
+        output = valid_output if valid else invalid_output
+
+        if output is not None:
+            output.write(record.raw)
+            output.write(b'\n')
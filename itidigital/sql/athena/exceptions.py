@@ -8,3 +8,9 @@ class InvalidRowFormatError(Exception):
     """Exception for invalid row formats"""
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class InvalidPartitionError(Exception):
+    """Exception for invalid partition columns or partition projections"""
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
@@ -0,0 +1,221 @@
+"""Module to represent typed hive partition columns and their Athena partition projection"""
+
+from dataclasses import dataclass
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from itidigital.sql.athena.exceptions import InvalidPartitionError
+
+__all__ = [
+    'EnumProjection',
+    'IntegerProjection',
+    'DateProjection',
+    'InjectedProjection',
+    'Projection',
+    'PartitionColumn',
+    'projection_properties'
+]
+
+_STRING_TYPES = frozenset({'string', 'varchar', 'char'})
+_INTEGER_TYPES = frozenset({'tinyint', 'smallint', 'int', 'integer', 'bigint'})
+_DATE_TYPES = frozenset({'date', 'timestamp'})
+_INTERVAL_UNITS = frozenset({
+    'YEARS', 'MONTHS', 'WEEKS', 'DAYS', 'HOURS', 'MINUTES', 'SECONDS', 'MILLISECONDS'
+})
+
+
+@dataclass(frozen=True)
+class EnumProjection:
+    """
+    Projection of a partition column with a known set of values
+
+    Args:
+        values (Sequence[str]): every value of the column
+    """
+    values: Sequence[str]
+
+    column_types: ClassVar[FrozenSet[str]] = _STRING_TYPES | _INTEGER_TYPES
+
+    def properties(self) -> Dict[str, str]:
+        """Projection properties, without the `projection.<column>.` prefix"""
+        if not self.values:
+            raise InvalidPartitionError("enum projection should have at least one value")
+
+        if any(',' in str(value) for value in self.values):
+            raise InvalidPartitionError("enum projection values should not contain commas")
+
+        return {'type': 'enum', 'values': ','.join(str(value) for value in self.values)}
+
+
+@dataclass(frozen=True)
+class IntegerProjection:
+    """
+    Projection of a partition column with a range of integers, like hours of the day
+
+    Args:
+        range (Tuple[int, int]): first and last values, both included
+        interval (Optional[int]): step between values, 1 if None
+        digits (Optional[int]): number of digits that values are zero padded to
+    """
+    range: Tuple[int, int]
+    interval: Optional[int] = None
+    digits: Optional[int] = None
+
+    column_types: ClassVar[FrozenSet[str]] = _STRING_TYPES | _INTEGER_TYPES
+
+    def properties(self) -> Dict[str, str]:
+        """Projection properties, without the `projection.<column>.` prefix"""
+        first, last = self.range
+
+        if first > last:
+            raise InvalidPartitionError(f"integer projection range should be ascending, but got {self.range}")
+
+        properties = {'type': 'integer', 'range': f'{first},{last}'}
+
+        for name, value in [('interval', self.interval), ('digits', self.digits)]:
+            if value is not None:
+                if value < 1:
+                    raise InvalidPartitionError(f"integer projection {name} should be positive, but got {value}")
+
+                properties[name] = str(value)
+
+        return properties
+
+
+@dataclass(frozen=True)
+class DateProjection:
+    """
+    Projection of a partition column with a range of dates or times
+
+    Args:
+        range (Tuple[str, str]): first and last values, formatted with `format` or relative
+            to now, like `NOW-3YEARS`
+        format (str): Java date format of values, like `yyyy-MM-dd`
+        interval (Optional[int]): step between values, in `interval_unit`
+        interval_unit (Optional[str]): unit of `interval`, like `DAYS` or `HOURS`
+    """
+    range: Tuple[str, str]
+    format: str
+    interval: Optional[int] = None
+    interval_unit: Optional[str] = None
+
+    column_types: ClassVar[FrozenSet[str]] = _STRING_TYPES | _DATE_TYPES
+
+    def properties(self) -> Dict[str, str]:
+        """Projection properties, without the `projection.<column>.` prefix"""
+        if len(self.range) != 2 or not all(self.range):
+            raise InvalidPartitionError(
+                f"date projection range should have a first and last value, but got {self.range}"
+            )
+
+        if not self.format:
+            raise InvalidPartitionError("date projection should have a format")
+
+        properties = {'type': 'date', 'range': ','.join(self.range), 'format': self.format}
+
+        if self.interval is not None:
+            if self.interval < 1:
+                raise InvalidPartitionError(f"date projection interval should be positive, but got {self.interval}")
+
+            properties['interval'] = str(self.interval)
+
+        if self.interval_unit is not None:
+            if self.interval_unit not in _INTERVAL_UNITS:
+                raise InvalidPartitionError(
+                    f"date projection interval unit should be one of {sorted(_INTERVAL_UNITS)}, "
+                    f"but got {self.interval_unit!r}"
+                )
+
+            properties['interval.unit'] = self.interval_unit
+
+        return properties
+
+
+@dataclass(frozen=True)
+class InjectedProjection:
+    """Projection of a partition column whose values are taken from query filters"""
+    column_types: ClassVar[FrozenSet[str]] = _STRING_TYPES
+
+    def properties(self) -> Dict[str, str]:
+        """Projection properties, without the `projection.<column>.` prefix"""
+        return {'type': 'injected'}
+
+
+Projection = Union[EnumProjection, IntegerProjection, DateProjection, InjectedProjection]
+
+
+@dataclass(frozen=True)
+class PartitionColumn:
+    """
+    Typed partition column data structure
+
+    Args:
+        name (str): column name
+        type (str): hive column type
+        projection (Optional[Projection]): how Athena projects the column values, without
+            reading partitions from the catalog
+    """
+    name: str
+    type: str = 'string'
+    projection: Optional[Projection] = None
+
+
+def projection_properties(
+        partitions: List[PartitionColumn],
+        storage_location_template: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Generates the table properties that enable partition projection, validating that
+    every partition column has a projection that suits its type
+
+    Args:
+        partitions (List[PartitionColumn]): partition columns of the table
+        storage_location_template (Optional[str]): S3 location of partitions, with a
+            `${<column>}` placeholder for each partition column. Partitions are expected
+            under the table location as `<column>=<value>/` if None
+
+    Returns:
+        Dict[str, str]: table properties, none if no column is projected
+
+    Raises:
+        InvalidPartitionError: if partitions or their projections are not valid
+    """
+    projected = [partition for partition in partitions if partition.projection is not None]
+
+    if not projected:
+        if storage_location_template is not None:
+            raise InvalidPartitionError("storage_location_template is only used by projected partitions")
+
+        return {}
+
+    if len(projected) != len(partitions):
+        missing = [partition.name for partition in partitions if partition.projection is None]
+        raise InvalidPartitionError(f"every partition column should be projected, but {missing} are not")
+
+    properties = {'projection.enabled': 'true'}
+
+    for partition in partitions:
+        projection = partition.projection
+
+        if partition.type.lower() not in projection.column_types:
+            raise InvalidPartitionError(
+                f"{type(projection).__name__} can not project {partition.type} column {partition.name!r}"
+            )
+
+        for name, value in projection.properties().items():
+            properties[f'projection.{partition.name}.{name}'] = value
+
+    if storage_location_template is not None:
+        if not storage_location_template.startswith('s3://'):
+            raise InvalidPartitionError("storage_location_template must start with `s3://`")
+
+        missing = [
+            partition.name for partition in partitions
+            if f'${{{partition.name}}}' not in storage_location_template
+        ]
+
+        if missing:
+            raise InvalidPartitionError(f"storage_location_template should have a placeholder for {missing}")
+
+        properties['storage.location.template'] = storage_location_template
+
+    return properties
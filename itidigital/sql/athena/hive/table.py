@@ -1,21 +1,146 @@
 import os
+import functools
+
 import jinja2
 from typing import Union, Mapping, Tuple, Optional, List
 
+from itidigital.utils import walker
 from itidigital.variables import PROJECT_ROOT_PATH
-from itidigital.sql.athena.exceptions import InvalidS3LocationError, InvalidRowFormatError
+from itidigital.sql.athena.hive.partitions import PartitionColumn, projection_properties
+from itidigital.sql.athena.exceptions import InvalidS3LocationError, InvalidRowFormatError, InvalidPartitionError
 from itidigital.sql.athena.hive.properties import (
     CreateDisposition, TableReference, FileFormat, SerdeFormat, DelimiterFormat
 )
 
 
-class HiveTable:
-    """Represents a hive table and it's properties"""
-    _TEMPLATE_PATH = os.path.join(
-        PROJECT_ROOT_PATH,
-        'itidigital/sql/athena/statement_templates'
+_TEMPLATE_PATH = os.path.join(
+    PROJECT_ROOT_PATH,
+    'itidigital/sql/athena/statement_templates'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_template(name: str) -> jinja2.Template:
+    """
+    Gets a statement template, compiled on first use and shared by the whole process
+
+    Args:
+        name (str): template file name
+
+    Returns:
+        jinja2.Template: compiled template
+    """
+    # templates ship with the package, so they are never checked for changes
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(searchpath=_TEMPLATE_PATH),
+        auto_reload=False
     )
 
+    return env.get_template(name=name)
+
+
+def quote_table_name(table_reference: TableReference) -> str:
+    """
+    Formats a table reference as a table name that Athena accepts, quoting names that
+    start with an underscore or contain digits
+
+    Args:
+        table_reference (TableReference): table reference
+
+    Returns:
+        str: table name, prefixed by its database if any
+    """
+    table = table_reference.table_name
+    db = table_reference.database
+
+    if table.startswith('_'):
+        return f"`{table}`" if not db else f"`{db}.{table}`"
+
+    elif any(i.isdigit() for i in table):
+        return f'"{table}"' if not db else f'"{db}.{table}"'
+
+    else:
+        return f'{table}' if not db else f'{db}.{table}'
+
+
+def _visit_column_type(parts: List[str], node: Union[str, dict]) -> Optional[list]:
+    """
+    Adds the attributes of a field to the hive column type of its column
+
+    Args:
+        parts (List[str]): column type parts
+        node (Union[str, dict]): field attributes, or a field name, separator or closing
+            bracket, which are walked as plain strings
+
+    Returns:
+        Optional[list]: attributes of struct fields or array items, with their names,
+            separators and closing bracket, or None for other fields
+    """
+    if isinstance(node, str):
+        parts.append(node)
+        return None
+
+    field_type = node.get('type')
+
+    if 'fields' in node:
+        parts.append(f"{field_type}<")
+        children = []
+
+        for name, nested_attr in node.get('fields', {}).items():
+            if children:
+                children.append(', ')
+
+            children.extend([f"{name}:", nested_attr])
+
+        return children + ['>']
+
+    if field_type == 'array':
+        parts.append(f"{field_type}<")
+
+        # arrays without items hold any values, which can only be read as strings
+        return [node.get('items', {'type': 'string'}), '>']
+
+    parts.append(f"{field_type}")
+
+    return None
+
+
+def column_type(attr: dict) -> str:
+    """
+    Formats the attributes of a field as a hive column type, including struct fields and
+    array items, walking all nesting levels iteratively
+
+    Args:
+        attr (dict): attributes from a field, as mapped by `HiveTableCreator`
+
+    Returns:
+        str: field type formatted as string
+    """
+    parts: List[str] = []
+
+    walker.walk(roots=[attr], visit=functools.partial(_visit_column_type, parts))
+
+    return ''.join(parts)
+
+
+def _quote(value) -> str:
+    """
+    Quotes a table property name or value as a string literal
+
+    Args:
+        value: property name or value
+
+    Returns:
+        str: quoted value
+    """
+    if isinstance(value, bool):
+        value = str(value).lower()
+
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+class HiveTable:
+    """Represents a hive table and it's properties"""
     def __init__(
             self,
             create_disposition: CreateDisposition,
@@ -25,11 +150,12 @@ class HiveTable:
             location: str,
             stored_as: FileFormat = FileFormat.TEXTFILE,
             comment: Optional[str] = None,
-            partition_by: Optional[List[str]] = None,
+            partition_by: Optional[List[Union[str, PartitionColumn]]] = None,
             clustered_by: Optional[List[str]] = None,
             num_buckets: int = None,
             row_format: Union[SerdeFormat, DelimiterFormat] = None,
-            table_properties: dict = None
+            table_properties: dict = None,
+            storage_location_template: Optional[str] = None
     ) -> None:
         """
         Initializes `HiveTable` class
@@ -52,7 +178,9 @@ class HiveTable:
 
             comment (Optional[str]): Creates the comment table property and populates it with the comment you specify.
 
-            partition_by (Optional[List[str]]): Creates a partitioned table with one or more partition columns
+            partition_by (Optional[List[Union[str, PartitionColumn]]]): Creates a partitioned table with one or
+                more partition columns. Columns given by name are moved out of `fields`, keeping their type
+
 
             clustered_by (Optional[List[str]]): Divides, with or without partitioning, the data in the specified
                 col_name columns into data subsets called buckets.
@@ -64,19 +192,81 @@ class HiveTable:
 
             table_properties (dict): Specifies custom metadata key-value pairs for the table definition in addition to
                 predefined table properties, such as "comment".
+
+            storage_location_template (Optional[str]): Specifies the S3 location of projected partitions, with a
+                `${<column>}` placeholder for each partition column
+
+        Raises:
+            InvalidPartitionError: if partition columns, their projections or the table properties that they
+                generate are not valid
         """
         self._create_disposition = create_disposition
         self._table_reference = table_reference
         self._fields = fields
         self._comment = comment
         self._is_external = is_external
-        self._partition_by = partition_by
+        self._partition_by = self._get_partitions(partition_by or [], fields)
         self._clustered_by = clustered_by
         self._num_buckets = num_buckets
         self._row_format = row_format
         self._location = location
         self._stored_as = stored_as
-        self._table_properties = table_properties
+        self._table_properties = self._merge_table_properties(
+            table_properties or {},
+            projection_properties(self._partition_by, storage_location_template)
+        )
+
+    @staticmethod
+    def _get_partitions(partition_by: List[Union[str, PartitionColumn]], fields: Mapping) -> List[PartitionColumn]:
+        """
+        Helper function to type partition columns
+
+        Args:
+            partition_by (List[Union[str, PartitionColumn]]): partition columns, or names of fields
+            fields (Mapping): table fields
+
+        Returns:
+            List[PartitionColumn]: typed partition columns
+        """
+        partitions = []
+
+        for partition in partition_by:
+            if not isinstance(partition, PartitionColumn):
+                if partition not in fields:
+                    raise InvalidPartitionError(f"Partition column {partition!r} should be a field or typed")
+
+                partition = PartitionColumn(name=partition, type=column_type(fields[partition]))
+
+            if '<' in partition.type:
+                raise InvalidPartitionError(f"Partition column {partition.name!r} should have a primitive type")
+
+            partitions.append(partition)
+
+        names = [partition.name for partition in partitions]
+
+        if len(set(names)) != len(names):
+            raise InvalidPartitionError(f"Partition columns should be unique, but got {names}")
+
+        return partitions
+
+    @staticmethod
+    def _merge_table_properties(table_properties: dict, generated: dict) -> dict:
+        """
+        Helper function to add generated properties to the given table properties
+
+        Args:
+            table_properties (dict): given table properties
+            generated (dict): properties generated from partition columns
+
+        Returns:
+            dict: every table property
+        """
+        conflicts = sorted(set(table_properties) & set(generated))
+
+        if conflicts:
+            raise InvalidPartitionError(f"Table properties {conflicts} are generated from partition columns")
+
+        return {**table_properties, **generated}
 
     @property
     def ddl_statement(self) -> str:
@@ -86,11 +276,7 @@ class HiveTable:
         Returns:
             str: DDL statement
         """
-        loader = jinja2.FileSystemLoader(searchpath=self._TEMPLATE_PATH)
-        env = jinja2.Environment(loader=loader)
-        template = env.get_template(name='ddl.txt')
-
-        return template.render(
+        return get_template(name='ddl.txt').render(
             table_type=self.table_type,
             creation_disposition=self.create_disposition,
             table_name=self.table_name,
@@ -118,23 +304,15 @@ class HiveTable:
     @property
     def table_name(self) -> str:
         """Hive table type property"""
-        table = self._table_reference.table_name
-        db = self._table_reference.database
-
-        if table.startswith('_'):
-            return f"`{table}`" if not db else f"`{db}.{table}`"
-
-        elif any(i.isdigit() for i in table):
-            return f'"{table}"' if not db else f'"{db}.{table}"'
-
-        else:
-            return f'{table}' if not db else f'{db}.{table}'
+        return quote_table_name(self._table_reference)
 
     @property
     def fields(self) -> str:
         """Hive table fields property"""
+        partition_names = {partition.name for partition in self._partition_by}
+
         return ', \n\t'.join(
-            [self._parse_field(field) for field in self._fields.items()]
+            [self._parse_field(field) for field in self._fields.items() if field[0] not in partition_names]
         )
 
     def _parse_field(self, field: Tuple[str, dict]) -> str:
@@ -148,17 +326,20 @@ class HiveTable:
             str: field formatted as string
         """
         name, attr = field
-        field_type = attr.get('type')
 
-        if 'fields' in attr:
-            nested_fields = attr.get('fields', {})
-            nested_structure = f"""<{', '.join(
-                [self._parse_field(field).replace(' ', ':') for field in nested_fields.items()]
-            )}>"""
+        return f"{name} {self._parse_type(attr)}"
 
-            return f"{name} {field_type}{nested_structure}"
+    def _parse_type(self, attr: dict) -> str:
+        """
+        Helper function to parse field types, including struct fields and array items
+
+        Args:
+            attr (dict): attributes from a field
 
-        return f"{name} {field_type}"
+        Returns
+            str: field type formatted as string
+        """
+        return column_type(attr)
 
     @property
     def comment(self) -> str:
@@ -169,7 +350,7 @@ class HiveTable:
     def partition_by(self) -> str:
         """Hive table partition property"""
         if self._partition_by:
-            return ','.join([field for field in self._partition_by])
+            return ', '.join([f"{partition.name} {partition.type}" for partition in self._partition_by])
 
     @property
     def clustered_by(self) -> str:
@@ -234,5 +415,5 @@ class HiveTable:
         """Hive table properties"""
         if self._table_properties:
             return ",\n\t".join(
-                [f"{name} = {value}" for name, value in self._table_properties.items()]
+                [f"{_quote(name)} = {_quote(value)}" for name, value in self._table_properties.items()]
             )
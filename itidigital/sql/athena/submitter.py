@@ -0,0 +1,307 @@
+"""Module to run many DDL statements on Athena concurrently and wait for their outcome"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+__all__ = [
+    'MAX_CONCURRENT_DDL_QUERIES',
+    'QueryState',
+    'create_athena_client',
+    'is_throttling',
+    'QueryExecution',
+    'AthenaSubmitter'
+]
+
+# default Athena quota of DDL queries running at once per account and region
+MAX_CONCURRENT_DDL_QUERIES = 20
+_THROTTLING_CODES = frozenset({
+    'ThrottlingException',
+    'TooManyRequestsException'
+})
+
+
+class QueryState:
+    """Athena query execution states"""
+    QUEUED = 'QUEUED'
+    RUNNING = 'RUNNING'
+    SUCCEEDED = 'SUCCEEDED'
+    FAILED = 'FAILED'
+    CANCELLED = 'CANCELLED'
+
+    FINISHED = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+def create_athena_client(region_name: str = 'us-east-1', max_pool_connections: int = 50):
+    """
+    Creates an Athena client meant to be shared by the whole process
+
+    Args:
+        region_name (str): AWS region name
+        max_pool_connections (int): maximum number of connections kept in the HTTP pool
+
+    Returns:
+        Athena client with keep-alive connections and standard retries
+    """
+    config = Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        retries={'mode': 'standard'}
+    )
+
+    return boto3.client('athena', region_name=region_name, config=config)
+
+
+def is_throttling(error: ClientError) -> bool:
+    """
+    Checks if whether a client error means that the call was throttled, or that too
+    many queries are running already
+
+    Args:
+        error (ClientError): error raised by an Athena client
+
+    Returns:
+        bool: True if call should be retried later. Otherwise, False
+    """
+    return error.response.get('Error', {}).get('Code') in _THROTTLING_CODES
+
+
+@dataclass
+class QueryExecution:
+    """
+    Class to represent the outcome of a DDL statement
+
+    Args:
+        table_name (str): name of the table that the statement creates or changes
+        query (str): DDL statement
+        execution_id (Optional[str]): Athena query execution id, None if it could not be started
+        state (Optional[str]): last known `QueryState`
+        reason (Optional[str]): why the statement failed
+        submitted_at (float): clock value when the statement was submitted
+        finished_at (Optional[float]): clock value when the statement was seen finished
+    """
+    table_name: str
+    query: str
+    execution_id: Optional[str] = None
+    state: Optional[str] = None
+    reason: Optional[str] = None
+    submitted_at: float = 0.0
+    finished_at: Optional[float] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """True if statement ran successfully"""
+        return self.state == QueryState.SUCCEEDED
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds from submission until the statement was seen finished"""
+        return self.finished_at - self.submitted_at if self.finished_at is not None else None
+
+
+class AthenaSubmitter:
+    """
+    Runs DDL statements on Athena keeping up to `max_concurrency` executions in flight.
+
+    Statements are started in the given order as slots free up. Running executions
+    are polled with `get_query_execution`, waiting `poll_interval` seconds between
+    rounds and growing that wait by `backoff` while nothing finishes, up to
+    `max_poll_interval`. Throttled calls, including starts refused because too many
+    queries are running, are retried with exponential backoff up to `max_retries`
+    times before the statement is reported as failed.
+    """
+    def __init__(
+            self,
+            athena_client,
+            output_location: str,
+            work_group: Optional[str] = None,
+            max_concurrency: int = MAX_CONCURRENT_DDL_QUERIES,
+            poll_interval: float = 0.5,
+            max_poll_interval: float = 5.0,
+            backoff: float = 2.0,
+            max_retries: int = 5,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        """
+        Initializes `AthenaSubmitter` class
+
+        Args:
+            athena_client: boto3 Athena client
+            output_location (str): S3 location for query results, like `s3://my-bucket/results/`
+            work_group (Optional[str]): Athena work group, the default one if None
+            max_concurrency (int): maximum number of executions in flight
+            poll_interval (float): first wait between polling rounds, in seconds
+            max_poll_interval (float): longest wait between polling rounds, in seconds
+            backoff (float): factor that waits grow by
+            max_retries (int): retries of a throttled call
+            clock (Callable[[], float]): monotonic clock used to measure latencies
+            sleep (Callable[[float], None]): function used to wait
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency should be positive, but got {max_concurrency}")
+
+        self._athena_client = athena_client
+        self._output_location = output_location
+        self._work_group = work_group
+        self._max_concurrency = max_concurrency
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._backoff = backoff
+        self._max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+
+    def submit(self, statements: Iterable[Tuple[str, str]]) -> Iterator[QueryExecution]:
+        """
+        Runs DDL statements, yielding each one once it finished
+
+        Args:
+            statements (Iterable[Tuple[str, str]]): table name and DDL statement of each table
+
+        Returns:
+            Iterator[QueryExecution]: finished executions, in completion order
+        """
+        pending = iter(statements)
+        running: Dict[str, QueryExecution] = {}
+        finished: Deque[QueryExecution] = deque()
+        exhausted = False
+        interval = self._poll_interval
+
+        while True:
+            while not exhausted and len(running) < self._max_concurrency:
+                statement = next(pending, None)
+
+                if statement is None:
+                    exhausted = True
+                    break
+
+                execution = self._start(*statement)
+
+                if execution.execution_id is None:
+                    finished.append(execution)
+                else:
+                    running[execution.execution_id] = execution
+
+            while finished:
+                yield finished.popleft()
+
+            if not running:
+                return
+
+            done = self._poll(running)
+
+            for execution in done:
+                del running[execution.execution_id]
+                yield execution
+
+            if done:
+                interval = self._poll_interval
+                continue
+
+            self._sleep(interval)
+            interval = min(interval * self._backoff, self._max_poll_interval)
+
+    def run(self, statements: Iterable[Tuple[str, str]]) -> List[QueryExecution]:
+        """
+        Runs DDL statements and waits for all of them
+
+        Args:
+            statements (Iterable[Tuple[str, str]]): table name and DDL statement of each table
+
+        Returns:
+            List[QueryExecution]: finished executions, in completion order
+        """
+        return list(self.submit(statements))
+
+    def _start(self, table_name: str, query: str) -> QueryExecution:
+        """
+        Starts a DDL statement
+
+        Args:
+            table_name (str): name of the table that the statement creates or changes
+            query (str): DDL statement
+
+        Returns:
+            QueryExecution: started execution, or a failed one if it could not be started
+        """
+        execution = QueryExecution(table_name=table_name, query=query, submitted_at=self._clock())
+        kwargs = {'QueryString': query, 'ResultConfiguration': {'OutputLocation': self._output_location}}
+
+        if self._work_group is not None:
+            kwargs['WorkGroup'] = self._work_group
+
+        try:
+            response = self._call(self._athena_client.start_query_execution, **kwargs)
+
+        except ClientError as error:
+            execution.state = QueryState.FAILED
+            execution.reason = str(error)
+            execution.finished_at = self._clock()
+            return execution
+
+        execution.execution_id = response['QueryExecutionId']
+        execution.state = QueryState.QUEUED
+
+        return execution
+
+    def _poll(self, running: Dict[str, QueryExecution]) -> List[QueryExecution]:
+        """
+        Refreshes the state of running executions
+
+        Args:
+            running (Dict[str, QueryExecution]): running executions by execution id
+
+        Returns:
+            List[QueryExecution]: executions that finished
+        """
+        done = []
+
+        for execution_id, execution in running.items():
+            try:
+                response = self._call(self._athena_client.get_query_execution, QueryExecutionId=execution_id)
+
+            except ClientError as error:
+                if is_throttling(error):
+                    # still running as far as we know, polled again on the next round
+                    continue
+                raise
+
+            status = response['QueryExecution']['Status']
+            execution.state = status['State']
+
+            if execution.state in QueryState.FINISHED:
+                execution.reason = status.get('StateChangeReason')
+                execution.finished_at = self._clock()
+                done.append(execution)
+
+        return done
+
+    def _call(self, operation: Callable[..., dict], **kwargs) -> dict:
+        """
+        Calls an Athena operation, retrying it while it is throttled
+
+        Args:
+            operation (Callable[..., dict]): client method
+            kwargs (dict): named arguments of the operation
+
+        Returns:
+            dict: operation response
+        """
+        delay = self._poll_interval
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                return operation(**kwargs)
+
+            except ClientError as error:
+                if not is_throttling(error) or attempt == self._max_retries:
+                    raise
+
+            self._sleep(delay)
+            delay = min(delay * self._backoff, self._max_poll_interval)
@@ -1,14 +1,21 @@
+import threading
 from enum import Enum
-from typing import Union
+from functools import partial
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from itidigital.utils import walker
 from itidigital.sql.athena.hive.table import HiveTable
-from itidigital.utils.schema.event import EventSchema, ObjectField, SchemaField
+from itidigital.sql.athena.hive.properties import TableReference
+from itidigital.utils.schema.fingerprint import layout_fingerprint
+from itidigital.utils.schema.event import ArrayField, EventSchema, ObjectField, SchemaField
 
 
 class HiveType(Enum):
     """All possible hive types values"""
     STRING = 'string'
-    INTEGER = 'integer'
+    INTEGER = 'bigint'
     OBJECT = 'struct'
     ARRAY = 'array'
     BOOLEAN = 'boolean'
@@ -16,6 +23,33 @@ class HiveType(Enum):
     UNKNOWN = 'unknown'
 
 
+@dataclass(frozen=True, slots=True)
+class HiveColumn:
+    """
+    Class to represent an immutable hive column, or a struct field or the array items of one
+
+    Args:
+        name (str): column name
+        type (HiveType): column type
+        description (str): column description
+        fields (Tuple[HiveColumn, ...]): struct fields, in schema order
+        items (Optional[HiveColumn]): array items, or None for arrays of any values
+    """
+    name: str
+    type: HiveType
+    description: str = ''
+    fields: Tuple['HiveColumn', ...] = ()
+    items: Optional['HiveColumn'] = None
+
+
+# columns of the most recently converted schemas by layout fingerprint, shared by every
+# creator. Columns are immutable, so concurrent conversions of the same schema can only
+# store equal values
+_COLUMNS: 'OrderedDict[str, Tuple[HiveColumn, ...]]' = OrderedDict()
+_COLUMNS_MAXSIZE = 256
+_COLUMNS_LOCK = threading.Lock()
+
+
 class HiveTableCreator:
     """
     Hive table creator class
@@ -34,17 +68,45 @@ class HiveTableCreator:
         if 'fields' in hive_table_kwargs:
             raise KeyError("fields should not be specified on kwargs")
 
-        hive_schema = self._json_to_hive_type_converter(
-            schema=event_schema
-        )
-
-        fields = self._map_fields(schema=hive_schema)
+        fields = self.get_fields(schema=event_schema)
 
         return HiveTable(
             fields=fields,
             **hive_table_kwargs
         )
 
+    def from_event_schemas(
+            self,
+            event_schemas: Iterable[Tuple[TableReference, EventSchema]],
+            location: str,
+            **hive_table_kwargs
+    ) -> Iterator[HiveTable]:
+        """
+        Creates HiveTable class instances lazily, one for each given EventSchema
+
+        Args:
+            event_schemas (Iterable[Tuple[TableReference, EventSchema]]): table reference and schema of each table
+            location (str): S3 location template of tables, where `{database}` and `{table_name}`
+                are replaced by those of each table, like `s3://my-bucket/{table_name}/`
+            hive_table_kwargs (dict): Extra named arguments to be passed to every `HiveTable` constructor
+
+        Returns:
+            Iterator[HiveTable]: class instances of `HiveTable`, in the order of given schemas
+        """
+        if 'table_reference' in hive_table_kwargs:
+            raise KeyError("table_reference should not be specified on kwargs")
+
+        for table_reference, event_schema in event_schemas:
+            yield self.from_event_schema(
+                event_schema=event_schema,
+                table_reference=table_reference,
+                location=location.format(
+                    database=table_reference.database or '',
+                    table_name=table_reference.table_name
+                ),
+                **hive_table_kwargs
+            )
+
     @staticmethod
     def _is_nested_type(field_type: HiveType) -> bool:
         """
@@ -62,27 +124,117 @@ class HiveTableCreator:
 
         return True if field_type in nested_types else False
 
-    def _json_to_hive_type_converter(self, schema: Union[EventSchema, ObjectField]):
+    def get_columns(self, schema: Union[EventSchema, ObjectField]) -> Tuple[HiveColumn, ...]:
         """
-        Converts schema properties from JSON types to Hive types
+        Gets the hive columns of a schema, converting it only the first time that a schema
+        with its layout, descriptions included, is seen. Columns of the least recently used
+        layouts are dropped past `_COLUMNS_MAXSIZE` layouts. The schema is not changed, so
+        it can be shared with validators and other threads.
 
         Args:
             schema (Union[EventSchema, ObjectField]): schema to convert properties
+
+        Returns:
+            Tuple[HiveColumn, ...]: hive columns, in schema order
         """
-        for field in schema.properties:
-            json_type = field.type.value
-            hive_type = HiveType[json_type.upper()]
+        fingerprint = layout_fingerprint(schema)
+
+        with _COLUMNS_LOCK:
+            columns = _COLUMNS.get(fingerprint)
+
+            if columns is not None:
+                _COLUMNS.move_to_end(fingerprint)
+                return columns
+
+        columns = self._convert_columns(schema=schema)
 
-            if self._is_nested_type(hive_type):
-                self._json_to_hive_type_converter(field)
+        with _COLUMNS_LOCK:
+            _COLUMNS[fingerprint] = columns
+
+            if len(_COLUMNS) > _COLUMNS_MAXSIZE:
+                _COLUMNS.popitem(last=False)
+
+        return columns
+
+    def get_fields(self, schema: Union[EventSchema, ObjectField]) -> Dict[str, dict]:
+        """
+        Gets the fields mapping of a schema, as expected by `HiveTable`
 
-            field.type = hive_type
+        Args:
+            schema (Union[EventSchema, ObjectField]): schema to convert properties
 
-        return schema
+        Returns:
+            Dict[str, dict]: attributes of each column by name, in schema order
+        """
+        return self._map_columns(columns=self.get_columns(schema=schema))
 
-    def _map_fields(self, schema: EventSchema) -> dict:
+    def _convert_columns(self, schema: Union[EventSchema, ObjectField]) -> Tuple[HiveColumn, ...]:
         """
-        Map each schema properties to a mapping object, like:
+        Converts schema properties from JSON types to hive columns, walking all nesting levels iteratively
+
+        Args:
+            schema (Union[EventSchema, ObjectField]): schema to convert properties
+
+        Returns:
+            Tuple[HiveColumn, ...]: hive columns, in schema order
+        """
+        nodes = []
+
+        walker.walk(
+            roots=[(field, -1) for field in schema.properties],
+            visit=partial(self._collect_field, nodes)
+        )
+
+        # columns are immutable, so they are built from the deepest fields up to the roots
+        children: List[List[HiveColumn]] = [[] for _ in nodes]
+        roots = []
+
+        for index in range(len(nodes) - 1, -1, -1):
+            field, parent = nodes[index]
+            nested = children[index][::-1]
+            column = HiveColumn(
+                name=field.name,
+                type=HiveType[field.type.value.upper()],
+                description=field.description,
+                fields=tuple(nested) if isinstance(field, ObjectField) else (),
+                items=nested[0] if isinstance(field, ArrayField) and nested else None
+            )
+
+            (children[parent] if parent >= 0 else roots).append(column)
+
+        return tuple(reversed(roots))
+
+    @staticmethod
+    def _collect_field(
+            nodes: List[Tuple[Union[ObjectField, SchemaField], int]],
+            node: Tuple[Union[ObjectField, SchemaField], int]
+    ) -> Optional[List[Tuple[Union[ObjectField, SchemaField], int]]]:
+        """
+        Collects a schema field, in walking order, along with the index of its parent
+
+        Args:
+            nodes (List[Tuple[Union[ObjectField, SchemaField], int]]): collected fields and parent indexes
+            node (Tuple[Union[ObjectField, SchemaField], int]): schema field and parent index
+
+        Returns:
+            Optional[List[Tuple[Union[ObjectField, SchemaField], int]]]: nodes of nested field
+                properties or array field items, or None for regular fields
+        """
+        field = node[0]
+        index = len(nodes)
+        nodes.append(node)
+
+        if isinstance(field, ObjectField):
+            return [(prop, index) for prop in field.properties]
+
+        if isinstance(field, ArrayField) and field.items is not None:
+            return [(field.items, index)]
+
+        return None
+
+    def _map_columns(self, columns: Tuple[HiveColumn, ...]) -> dict:
+        """
+        Map each hive column to a mapping object, walking all nesting levels iteratively, like:
 
         ```
         "field_name" : {
@@ -91,47 +243,67 @@ class HiveTableCreator:
         }
 
         Args:
-            schema (EventSchema): schema to retrieve properties
+            columns (Tuple[HiveColumn, ...]): hive columns
 
         Returns:
-            dict: mapping of schema properties
+            dict: mapping of hive columns
         """
         fields_mapping = {}
 
-        for field in schema.properties:
-            if self._is_nested_type(field.type):
-                fields_mapping[field.name] = self._map_struct_field(field)
-            else:
-                fields_mapping[field.name] = self._map_regular_field(field)
+        walker.walk(
+            roots=[(fields_mapping, column.name, column) for column in columns],
+            visit=self._map_column
+        )
 
         return fields_mapping
 
-    @staticmethod
-    def _map_regular_field(field: SchemaField) -> dict:
+    def _map_column(self, node: Tuple[dict, str, HiveColumn]) -> Optional[List[Tuple[dict, str, HiveColumn]]]:
         """
-        Converts a regular schema field to a mapping
+        Adds the mapping of a hive column to the mapping of its parent, either as a
+        struct field or as the items of an array, like:
+
+        ```
+        "field_name" : {
+            "type": "array",
+            "description": "my field description",
+            "items": {
+                "type": "string",
+                "description": ""
+            }
+        }
+        ```
 
         Args:
-            field (SchemaField): schema field to be mapped
+            node (Tuple[dict, str, HiveColumn]): parent mapping, key and hive column
+
         Returns:
-            dict:  mapping of schema field
+            Optional[List[Tuple[dict, str, HiveColumn]]]: nodes of struct fields or
+                array items, or None for regular columns
         """
-        return {
-            "type": field.type.value,
-            "description": field.description
-        }
+        fields_mapping, key, column = node
+        fields_mapping[key] = self._map_regular_field(column)
+
+        if self._is_nested_type(column.type):
+            fields_mapping[key]["fields"] = {}
 
-    def _map_struct_field(self, field: ObjectField) -> dict:
+            return [(fields_mapping[key]["fields"], nested.name, nested) for nested in column.fields]
+
+        if column.items is not None:
+            return [(fields_mapping[key], "items", column.items)]
+
+        return None
+
+    @staticmethod
+    def _map_regular_field(column: HiveColumn) -> dict:
         """
-        Converts an object schema field to a mapping
+        Converts a hive column to a mapping, without its struct fields or array items
 
         Args:
-            field (ObjectField): schema field to be mapped
+            column (HiveColumn): hive column to be mapped
         Returns:
-            dict:  mapping of schema field
+            dict:  mapping of hive column
         """
         return {
-            "type": field.type.value,
-            "description": field.description,
-            "fields": self._map_fields(field)
+            "type": column.type.value,
+            "description": column.description
         }
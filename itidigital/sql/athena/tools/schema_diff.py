@@ -0,0 +1,169 @@
+"""Module to compare event schema versions and evolve hive tables with ALTER TABLE statements"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from itidigital.utils.schema.event import EventSchema
+from itidigital.sql.athena.hive.properties import TableReference
+from itidigital.sql.athena.hive.partitions import PartitionColumn
+from itidigital.sql.athena.hive.table import column_type, quote_table_name
+from itidigital.sql.athena.tools.hive_table_creator import HiveTableCreator
+
+__all__ = [
+    'ColumnChange',
+    'SchemaDiff',
+    'diff_schemas'
+]
+
+
+class ColumnChange(NamedTuple):
+    """
+    Class to represent a column that was added, removed or changed between schema versions
+
+    Args:
+        name (str): column name
+        old_type (Optional[str]): hive type on the old schema, None if column was added
+        new_type (Optional[str]): hive type on the new schema, None if column was removed
+    """
+    name: str
+    old_type: Optional[str]
+    new_type: Optional[str]
+
+
+@dataclass(frozen=True)
+class SchemaDiff:
+    """
+    Class to represent the differences between the data columns of two schema versions
+
+    Args:
+        columns (Tuple[Tuple[str, str], ...]): name and hive type of every column of the new schema
+        added (Tuple[ColumnChange, ...]): columns only on the new schema
+        removed (Tuple[ColumnChange, ...]): columns only on the old schema
+        changed (Tuple[ColumnChange, ...]): columns whose type changed, like structs that gained fields
+        reordered (bool): True if columns kept on both schemas are in another order, or
+            added columns are not all after them
+    """
+    columns: Tuple[Tuple[str, str], ...]
+    added: Tuple[ColumnChange, ...] = ()
+    removed: Tuple[ColumnChange, ...] = ()
+    changed: Tuple[ColumnChange, ...] = ()
+    reordered: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        """True if both schemas have the same columns"""
+        return not (self.added or self.removed or self.changed or self.reordered)
+
+    @property
+    def is_additive(self) -> bool:
+        """True if the new schema only appends columns to the old one"""
+        return bool(self.added) and not (self.removed or self.changed or self.reordered)
+
+    def alter_statements(self, table_reference: TableReference) -> List[str]:
+        """
+        Generates the statements that evolve a table from the old schema to the new one.
+        Appended columns only need `ADD COLUMNS`, which lists just those columns. Any other
+        change, including fields added to a struct column, needs `REPLACE COLUMNS` with
+        every column. Neither rewrites table data.
+
+        Args:
+            table_reference (TableReference): table to be altered
+
+        Returns:
+            List[str]: ALTER TABLE statements, none if both schemas have the same columns
+        """
+        if self.is_empty:
+            return []
+
+        table_name = quote_table_name(table_reference)
+
+        if self.is_additive:
+            return [f"ALTER TABLE {table_name} ADD COLUMNS ({_format_columns(self.added)})"]
+
+        return [f"ALTER TABLE {table_name} REPLACE COLUMNS ({_format_columns(self.columns)})"]
+
+
+def _format_columns(columns: Iterable[Union[Tuple[str, str], ColumnChange]]) -> str:
+    """
+    Formats columns as a column list of an ALTER TABLE statement
+
+    Args:
+        columns (Iterable[Union[Tuple[str, str], ColumnChange]]): name and hive type of each column
+
+    Returns:
+        str: columns formatted as string
+    """
+    return ', '.join(f"{column[0]} {column[-1]}" for column in columns)
+
+
+def _get_column_types(
+        creator: HiveTableCreator,
+        schema: EventSchema,
+        partition_by: Iterable[Union[str, PartitionColumn]]
+) -> List[Tuple[str, str]]:
+    """
+    Gets the name and hive type of the data columns of a schema
+
+    Args:
+        creator (HiveTableCreator): creator to convert the schema with
+        schema (EventSchema): schema to convert
+        partition_by (Iterable[Union[str, PartitionColumn]]): partition columns, which are not data columns
+
+    Returns:
+        List[Tuple[str, str]]: name and hive type of each column, in schema order
+    """
+    partition_names = {
+        partition.name if isinstance(partition, PartitionColumn) else partition
+        for partition in partition_by
+    }
+
+    return [
+        (name, column_type(attr))
+        for name, attr in creator.get_fields(schema=schema).items()
+        if name not in partition_names
+    ]
+
+
+def diff_schemas(
+        old_schema: EventSchema,
+        new_schema: EventSchema,
+        partition_by: Optional[List[Union[str, PartitionColumn]]] = None
+) -> SchemaDiff:
+    """
+    Compares the data columns of two versions of an event schema
+
+    Args:
+        old_schema (EventSchema): schema the table was created from
+        new_schema (EventSchema): schema the table should match
+        partition_by (Optional[List[Union[str, PartitionColumn]]]): partition columns of the table, which
+            can not be altered
+
+    Returns:
+        SchemaDiff: differences between both versions
+    """
+    creator = HiveTableCreator()
+    old_columns = _get_column_types(creator, old_schema, partition_by or [])
+    new_columns = _get_column_types(creator, new_schema, partition_by or [])
+
+    old_types = dict(old_columns)
+    new_types = dict(new_columns)
+
+    added = tuple(ColumnChange(name, None, new_type) for name, new_type in new_columns if name not in old_types)
+    removed = tuple(ColumnChange(name, old_type, None) for name, old_type in old_columns if name not in new_types)
+    changed = tuple(
+        ColumnChange(name, old_types[name], new_type)
+        for name, new_type in new_columns
+        if name in old_types and old_types[name] != new_type
+    )
+    kept = [name for name, _ in old_columns if name in new_types]
+
+    # `ADD COLUMNS` can only append, so columns added between kept ones count as a new order
+    reordered = [name for name, _ in new_columns[:len(kept)]] != kept
+
+    return SchemaDiff(
+        columns=tuple(new_columns),
+        added=added,
+        removed=removed,
+        changed=changed,
+        reordered=reordered
+    )
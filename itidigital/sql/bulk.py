@@ -0,0 +1,187 @@
+"""Module to render the DDL statements of many event schemas on multiple processes"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from itidigital.utils.schema import helpers
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.sql.athena.hive.properties import TableReference
+from itidigital.sql.athena.tools.hive_table_creator import HiveTableCreator
+
+__all__ = [
+    'RenderedTable',
+    'BulkStats',
+    'iter_schema_files',
+    'render_ddl_statements'
+]
+
+# Table settings of each worker process, set once by `_init_worker`
+_WORKER_CONFIG: dict = {}
+
+
+class RenderedTable(NamedTuple):
+    """
+    Class to represent the DDL statement of a schema file
+
+    Args:
+        schema_path (str): schema file path
+        table_name (str): table name, the schema file name without extension
+        ddl_statement (Optional[str]): DDL statement, or None if it could not be rendered
+        error (Optional[str]): why the DDL statement could not be rendered
+    """
+    schema_path: str
+    table_name: str
+    ddl_statement: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkStats:
+    """
+    Class to represent bulk DDL rendering counters
+
+    Args:
+        rendered (int): number of rendered tables
+        failed (List[RenderedTable]): schemas that could not be rendered
+        started_at (float): `time.perf_counter` value when rendering started
+    """
+    rendered: int = 0
+    failed: List[RenderedTable] = field(default_factory=list)
+    started_at: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of processed schemas"""
+        return self.rendered + len(self.failed)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since rendering started"""
+        return time.perf_counter() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Processed schemas per second"""
+        elapsed = self.elapsed
+        return self.total / elapsed if elapsed > 0 else 0.0
+
+
+def iter_schema_files(directory: str) -> Iterator[str]:
+    """
+    Lists the JSON schema files of a directory in name order. File names are listed and
+    sorted up front, so the order is stable, while the paths are yielded one at a time.
+
+    Args:
+        directory (str): directory with JSON schema files
+
+    Returns:
+        Iterator[str]: schema file paths
+    """
+    with os.scandir(directory) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_file() and entry.name.endswith('.json'))
+
+    for name in names:
+        yield os.path.join(directory, name)
+
+
+def _init_worker(database: Optional[str], location: str, hive_table_kwargs: dict) -> None:
+    """
+    Keeps the table settings shared by every table when a worker process starts
+
+    Args:
+        database (Optional[str]): database of every table
+        location (str): S3 location template of tables
+        hive_table_kwargs (dict): Extra named arguments to be passed to every `HiveTable` constructor
+    """
+    _WORKER_CONFIG.update(database=database, location=location, hive_table_kwargs=hive_table_kwargs)
+
+
+def _render(schema_path: str) -> RenderedTable:
+    """
+    Renders the DDL statement of a schema file on a worker process
+
+    Args:
+        schema_path (str): schema file path
+
+    Returns:
+        RenderedTable: DDL statement, or why it could not be rendered
+    """
+    table_name = os.path.splitext(os.path.basename(schema_path))[0]
+
+    try:
+        event_schema = SchemaBuilder(config=helpers.load_schema(schema_path)).construct()
+        hive_table, = HiveTableCreator().from_event_schemas(
+            event_schemas=[(TableReference(table_name=table_name, database=_WORKER_CONFIG['database']), event_schema)],
+            location=_WORKER_CONFIG['location'],
+            **_WORKER_CONFIG['hive_table_kwargs']
+        )
+
+        return RenderedTable(schema_path=schema_path, table_name=table_name, ddl_statement=hive_table.ddl_statement)
+
+    except Exception as error:
+        # a broken schema should not stop the rest of the catalogue
+        return RenderedTable(schema_path=schema_path, table_name=table_name, error=f"{type(error).__name__}: {error}")
+
+
+def render_ddl_statements(
+        schema_paths: Iterable[str],
+        location: str,
+        database: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 64,
+        stats: Optional[BulkStats] = None,
+        **hive_table_kwargs
+) -> Iterator[RenderedTable]:
+    """
+    Renders the DDL statement of every schema file on a pool of processes, one table
+    per file named after it
+
+    Args:
+        schema_paths (Iterable[str]): schema file paths
+        location (str): S3 location template of tables, like `s3://my-bucket/{table_name}/`
+        database (Optional[str]): database of every table
+        max_workers (Optional[int]): number of worker processes, CPU count if None. With a
+            single worker, schemas are rendered on the calling process
+        chunksize (int): number of schemas sent to a worker at once
+        stats (Optional[BulkStats]): counters to be updated
+        hive_table_kwargs (dict): Extra named arguments to be passed to every `HiveTable` constructor
+
+    Returns:
+        Iterator[RenderedTable]: DDL statements, in the order of given schema files
+    """
+    stats = stats if stats is not None else BulkStats()
+    stats.started_at = stats.started_at or time.perf_counter()
+    max_workers = max_workers or os.cpu_count() or 1
+    initargs = (database, location, hive_table_kwargs)
+
+    if max_workers == 1:
+        _init_worker(*initargs)
+        results = map(_render, schema_paths)
+        yield from _count(results, stats)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=initargs) as executor:
+        yield from _count(executor.map(_render, schema_paths, chunksize=chunksize), stats)
+
+
+def _count(results: Iterable[RenderedTable], stats: BulkStats) -> Iterator[RenderedTable]:
+    """
+    Counts rendered and failed tables
+
+    Args:
+        results (Iterable[RenderedTable]): rendered tables
+        stats (BulkStats): counters to be updated
+
+    Returns:
+        Iterator[RenderedTable]: the same rendered tables
+    """
+    for result in results:
+        if result.error is None:
+            stats.rendered += 1
+        else:
+            stats.failed.append(result)
+
+        yield result
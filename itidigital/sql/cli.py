@@ -0,0 +1,114 @@
+"""Command line interface for bulk DDL generation"""
+
+import os
+import sys
+import argparse
+import contextlib
+from typing import List, Optional
+
+from itidigital.sql import bulk
+from itidigital.sql.athena.hive.properties import CreateDisposition, FileFormat
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line arguments parser
+
+    Returns:
+        argparse.ArgumentParser: arguments parser
+    """
+    parser = argparse.ArgumentParser(prog='python -m itidigital.sql')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ddl = commands.add_parser(
+        'ddl',
+        help='renders a Hive DDL statement for every JSON schema of a directory'
+    )
+    ddl.add_argument('--schemas', required=True, help='directory with JSON schema files, one table per file')
+    ddl.add_argument(
+        '--location', required=True,
+        help='S3 location template of tables, like `s3://my-bucket/{database}/{table_name}/`'
+    )
+    ddl.add_argument('--database', help='database of every table')
+    ddl.add_argument(
+        '--stored-as', choices=[file_format.value for file_format in FileFormat], default=FileFormat.PARQUET.value,
+        help='file format of every table'
+    )
+    ddl.add_argument('--managed', action='store_true', help='creates managed tables instead of external ones')
+    ddl.add_argument('--workers', type=int, help='number of processes, CPU count by default')
+
+    output = ddl.add_mutually_exclusive_group(required=True)
+    output.add_argument('--output-dir', help='directory for one `<table_name>.sql` file per table')
+    output.add_argument('--output', help='file path for a single script with every table, or `-` for stdout')
+
+    return parser
+
+
+def ddl(args: argparse.Namespace) -> bulk.BulkStats:
+    """
+    Renders the DDL statement of every schema of a directory and writes them to the outputs
+
+    Args:
+        args (argparse.Namespace): `ddl` command arguments
+
+    Returns:
+        bulk.BulkStats: rendering counters
+    """
+    stats = bulk.BulkStats()
+    results = bulk.render_ddl_statements(
+        schema_paths=bulk.iter_schema_files(args.schemas),
+        location=args.location,
+        database=args.database,
+        max_workers=args.workers,
+        stats=stats,
+        create_disposition=CreateDisposition.IF_NOT_EXISTS,
+        is_external=not args.managed,
+        stored_as=FileFormat(args.stored_as)
+    )
+
+    with contextlib.ExitStack() as stack:
+        script = None
+
+        if args.output == '-':
+            script = sys.stdout
+        elif args.output:
+            script = stack.enter_context(open(args.output, 'w'))
+        else:
+            os.makedirs(args.output_dir, exist_ok=True)
+
+        for result in results:
+            if result.error is not None:
+                continue
+
+            if script is not None:
+                script.write(f"-- {result.table_name}\n{result.ddl_statement};\n\n")
+            else:
+                with open(os.path.join(args.output_dir, f'{result.table_name}.sql'), 'w') as table_file:
+                    table_file.write(f"{result.ddl_statement};\n")
+
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line interface
+
+    Args:
+        argv (Optional[List[str]]): command line arguments, `sys.argv` if None
+
+    Returns:
+        int: exit code, 1 if any schema could not be rendered
+    """
+    args = _build_parser().parse_args(argv)
+    stats = ddl(args)
+
+    for failed in stats.failed:
+        print(f"Failed to render {failed.schema_path}: {failed.error}", file=sys.stderr)
+
+    print(
+        f"Rendered {stats.rendered} of {stats.total} tables in {stats.elapsed:.2f}s: "
+        f"{stats.throughput:,.0f} tables/s",
+        file=sys.stderr
+    )
+
+    return 1 if stats.failed else 0
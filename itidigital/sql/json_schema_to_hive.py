@@ -4,6 +4,7 @@ import pathlib
 from itidigital import variables
 from itidigital.utils.schema import helpers
 from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.sql.athena.submitter import AthenaSubmitter, QueryExecution
 from itidigital.sql.athena.tools.hive_table_creator import HiveTableCreator
 
 _ATHENA_CLIENT = None
@@ -13,17 +14,19 @@ _SCHEMA_FILE_PATH = os.path.join(
 )
 
 
-def create_hive_table_with_athena(query):
+def create_hive_table_with_athena(query, table_name=''):
     """
-    Creates hive table on Athena based on given DDL query
+    Creates hive table on Athena based on given DDL query and waits for it
     """
     print(f"DDL Query: {query}")
-    _ATHENA_CLIENT.start_query_execution(
-        QueryString=query,
-        ResultConfiguration={
-            'OutputLocation': f's3://iti-query-results/'
-        }
+    submitter = AthenaSubmitter(
+        athena_client=_ATHENA_CLIENT,
+        output_location='s3://iti-query-results/'
     )
+    execution: QueryExecution = submitter.run([(table_name, query)])[0]
+    print(f"DDL {execution.state} in {execution.latency:.2f}s{f': {execution.reason}' if execution.reason else ''}")
+
+    return execution
 
 
 def handler(**hive_table_kwargs) -> None:
@@ -40,5 +43,6 @@ def handler(**hive_table_kwargs) -> None:
     )
 
     create_hive_table_with_athena(
-        query=hive_table.ddl_statement
+        query=hive_table.ddl_statement,
+        table_name=hive_table.table_name
     )
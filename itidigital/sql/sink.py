@@ -0,0 +1,437 @@
+"""Module to write validated events to partitioned Parquet files that hive tables can read"""
+
+import uuid
+import posixpath
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from itidigital.utils import serialization
+from itidigital.utils.schema.event import EventSchema
+from itidigital.sql.athena.hive.partitions import PartitionColumn
+from itidigital.sql.athena.tools.hive_table_creator import HiveColumn, HiveTableCreator, HiveType
+
+try:
+    import pyarrow
+    import pyarrow.fs
+    import pyarrow.parquet
+except ImportError:  # optional dependency, required only by `ParquetEventSink`
+    pyarrow = None
+
+__all__ = [
+    'arrow_schema',
+    'SinkStats',
+    'ParquetEventSink'
+]
+
+_DEFAULT_ROW_GROUP_SIZE = 10_000
+_DEFAULT_MAX_FILE_BYTES = 128 * 1024 * 1024
+# directory of events without a partition value, the one hive uses
+_DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+# characters that hive `FileUtils.escapePathName` percent-escapes on partition directories
+_PARTITION_ESCAPES = {
+    code: f'%{code:02X}'
+    for code in [*range(0x01, 0x20), 0x7F, *map(ord, '"#%\'*/:=?\\{[]^')]
+}
+
+
+def _arrow_type(column: HiveColumn):
+    """
+    Gets the Arrow type that matches the hive type of a column, so files can be read
+    by tables created from the same schema
+
+    Args:
+        column (HiveColumn): hive column
+
+    Returns:
+        pyarrow.DataType: Arrow type
+    """
+    if column.type == HiveType.OBJECT:
+        return pyarrow.struct([pyarrow.field(nested.name, _arrow_type(nested)) for nested in column.fields])
+
+    if column.type == HiveType.ARRAY:
+        # arrays without items are `array<string>` on hive tables, their values are written as JSON
+        return pyarrow.list_(_arrow_type(column.items) if column.items is not None else pyarrow.string())
+
+    return {
+        HiveType.INTEGER: pyarrow.int64(),
+        HiveType.BOOLEAN: pyarrow.bool_(),
+        HiveType.NULL: pyarrow.null()
+    }.get(column.type, pyarrow.string())
+
+
+def arrow_schema(columns: Iterable[HiveColumn]):
+    """
+    Gets the Arrow schema of hive columns
+
+    Args:
+        columns (Iterable[HiveColumn]): hive columns, as converted by `HiveTableCreator`
+
+    Returns:
+        pyarrow.Schema: Arrow schema, in column order
+    """
+    if pyarrow is None:
+        raise ImportError("pyarrow is required to write Parquet files, install it with `pip install pyarrow`")
+
+    return pyarrow.schema([pyarrow.field(column.name, _arrow_type(column)) for column in columns])
+
+
+def _needs_coercion(column: HiveColumn) -> bool:
+    """
+    Checks if whether a column holds integers or arrays without items at any nesting level
+
+    Args:
+        column (HiveColumn): hive column
+
+    Returns:
+        bool: True if column values need to be coerced. Otherwise, False
+    """
+    stack = [column]
+
+    while stack:
+        current = stack.pop()
+
+        if current.type == HiveType.INTEGER or (current.type == HiveType.ARRAY and current.items is None):
+            return True
+
+        stack.extend(current.fields)
+
+        if current.items is not None:
+            stack.append(current.items)
+
+    return False
+
+
+def _coerce(value, column: HiveColumn):
+    """
+    Encodes the values of arrays without items as JSON strings, and integral floats as
+    integers. The validator takes any number as an integer, but Arrow would truncate
+    fractional ones
+
+    Args:
+        value: event value
+        column (HiveColumn): hive column of the value
+
+    Returns:
+        value, with untyped array values as strings
+
+    Raises:
+        ValueError: if an integer column holds a fractional number
+    """
+    if value is None:
+        return None
+
+    if column.type == HiveType.INTEGER and isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{column.name} should be an integer, but got {value}")
+
+        return int(value)
+
+    if column.type == HiveType.OBJECT and isinstance(value, dict):
+        return {
+            nested.name: _coerce(value.get(nested.name), nested)
+            for nested in column.fields
+        }
+
+    if column.type == HiveType.ARRAY and isinstance(value, list):
+        if column.items is None:
+            return [item if isinstance(item, str) else serialization.dumps(item) for item in value]
+
+        return [_coerce(item, column.items) for item in value]
+
+    return value
+
+
+def _partition_value(value) -> str:
+    """
+    Formats a partition value as a directory name part, percent-escaping the characters
+    that hive escapes, so values holding `/` or `=` are read back as the same partition
+
+    Args:
+        value: partition value
+
+    Returns:
+        str: escaped partition value, or the hive default partition for missing or empty values
+    """
+    if value is None or value == '':
+        return _DEFAULT_PARTITION
+
+    if isinstance(value, bool):
+        return str(value).lower()
+
+    return str(value).translate(_PARTITION_ESCAPES)
+
+
+@dataclass
+class SinkStats:
+    """
+    Class to represent event sink counters
+
+    Args:
+        rows (int): number of written events
+        files (List[str]): paths of closed Parquet files
+        bytes (int): size of closed Parquet files
+    """
+    rows: int = 0
+    files: List[str] = field(default_factory=list)
+    bytes: int = 0
+
+
+class _PartitionFile:
+    """Parquet file being written for a partition"""
+    def __init__(self, path: str, stream, writer) -> None:
+        self.path = path
+        self.stream = stream
+        self.writer = writer
+
+    @property
+    def size(self) -> int:
+        """Bytes written so far"""
+        return self.stream.tell()
+
+
+class ParquetEventSink:
+    """
+    Buffers validated events and writes them as Parquet files, laid out by partition
+    columns like the hive tables created from the same schema.
+
+    Events are buffered per partition and converted to an Arrow record batch, one row
+    group, once `row_group_size` of them are buffered. Each partition keeps a file open
+    until it reaches `max_file_bytes`, then a new file is started. At most
+    `max_open_files` files are open, the least recently written one is closed to open
+    another. Files are only complete once closed, so callers should `close` the sink
+    when done, which the context manager does on exit.
+
+    Partition columns are left out of files, like hive does. Their values are taken
+    from the event fields with the same name, or from `partition_values` for columns
+    that are not event fields, like a projected `dt` partition.
+    """
+    def __init__(
+            self,
+            schema: EventSchema,
+            base_path: str,
+            partition_by: Optional[List[Union[str, PartitionColumn]]] = None,
+            filesystem=None,
+            partition_values: Optional[Callable[[dict], Dict[str, str]]] = None,
+            path_template: Optional[str] = None,
+            compression: str = 'snappy',
+            row_group_size: int = _DEFAULT_ROW_GROUP_SIZE,
+            max_file_bytes: int = _DEFAULT_MAX_FILE_BYTES,
+            max_open_files: int = 64
+    ) -> None:
+        """
+        Initializes `ParquetEventSink` class
+
+        Args:
+            schema (EventSchema): schema of the events, which sets the column types
+            base_path (str): table location, like `s3://my-bucket/events/` or a local directory
+            partition_by (Optional[List[Union[str, PartitionColumn]]]): partition columns of the table
+            filesystem (Optional[pyarrow.fs.FileSystem]): filesystem to write to, like a
+                `pyarrow.fs.S3FileSystem` pointed at a local S3 endpoint. Inferred from
+                `base_path` if None
+            partition_values (Optional[Callable[[dict], Dict[str, str]]]): gets the values of
+                partition columns that are not event fields
+            path_template (Optional[str]): partition directory relative to `base_path`, with a
+                `${<column>}` placeholder for each partition column, like the table
+                `storage_location_template`. `<column>=<value>/` directories if None
+            compression (str): Parquet compression codec
+            row_group_size (int): events per row group
+            max_file_bytes (int): approximate size of each file
+            max_open_files (int): files that may be open at once
+        """
+        if pyarrow is None:
+            raise ImportError("pyarrow is required to write Parquet files, install it with `pip install pyarrow`")
+
+        if row_group_size < 1 or max_file_bytes < 1 or max_open_files < 1:
+            raise ValueError("row_group_size, max_file_bytes and max_open_files should be positive")
+
+        if filesystem is None:
+            filesystem, base_path = pyarrow.fs.FileSystem.from_uri(base_path)
+
+        self._partition_names = [
+            partition.name if isinstance(partition, PartitionColumn) else partition
+            for partition in partition_by or []
+        ]
+        self._columns: Tuple[HiveColumn, ...] = tuple(
+            column for column in HiveTableCreator().get_columns(schema=schema)
+            if column.name not in self._partition_names
+        )
+        self._coerced = [_needs_coercion(column) for column in self._columns]
+        self._schema = arrow_schema(self._columns)
+        self._filesystem = filesystem
+        self._base_path = base_path.rstrip('/')
+        self._partition_values = partition_values
+        self._path_template = path_template
+        self._compression = compression
+        self._row_group_size = row_group_size
+        self._max_file_bytes = max_file_bytes
+        self._max_open_files = max_open_files
+        self._prefix = uuid.uuid4().hex[:12]
+        self._sequence = 0
+        self._buffers: Dict[str, List[list]] = {}
+        self._files: 'OrderedDict[str, _PartitionFile]' = OrderedDict()
+        self.stats = SinkStats()
+
+    def __enter__(self) -> 'ParquetEventSink':
+        """Starts writing"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Writes every buffered event and closes files"""
+        self.close()
+
+    @property
+    def schema(self):
+        """Arrow schema of written files"""
+        return self._schema
+
+    def write(self, event: dict) -> None:
+        """
+        Buffers a validated event, writing a row group when its partition buffer is full
+
+        Args:
+            event (dict): raw event that matches the schema
+
+        Raises:
+            ValueError: if an integer field holds a fractional number, the event is not buffered
+        """
+        row = [
+            _coerce(event.get(column.name), column) if coerced else event.get(column.name)
+            for column, coerced in zip(self._columns, self._coerced)
+        ]
+        directory = self._partition_directory(event)
+        buffer = self._buffers.setdefault(directory, [[] for _ in self._columns])
+
+        for values, value in zip(buffer, row):
+            values.append(value)
+
+        if len(buffer[0]) >= self._row_group_size:
+            self._write_row_group(directory)
+
+    def write_many(self, events: Iterable[dict]) -> None:
+        """
+        Buffers validated events
+
+        Args:
+            events (Iterable[dict]): raw events that match the schema
+        """
+        for event in events:
+            self.write(event)
+
+    def flush(self) -> None:
+        """Writes every buffered event to its partition file, keeping files open"""
+        for directory in list(self._buffers):
+            self._write_row_group(directory)
+
+    def close(self) -> SinkStats:
+        """
+        Writes every buffered event and closes files
+
+        Returns:
+            SinkStats: sink counters
+        """
+        self.flush()
+
+        while self._files:
+            self._close_file(next(iter(self._files)))
+
+        return self.stats
+
+    def _partition_directory(self, event: dict) -> str:
+        """
+        Gets the directory of an event partition, relative to the base path
+
+        Args:
+            event (dict): raw event
+
+        Returns:
+            str: partition directory, empty for tables without partitions
+        """
+        if not self._partition_names:
+            return ''
+
+        values = self._partition_values(event) if self._partition_values is not None else {}
+        values = {
+            name: _partition_value(values[name] if name in values else event.get(name))
+            for name in self._partition_names
+        }
+
+        if self._path_template is not None:
+            directory = self._path_template
+
+            for name, value in values.items():
+                directory = directory.replace(f'${{{name}}}', value)
+
+            return directory.strip('/')
+
+        return '/'.join(f'{name}={value}' for name, value in values.items())
+
+    def _write_row_group(self, directory: str) -> None:
+        """
+        Writes the buffered events of a partition as a row group, rolling to a new file
+        once the current one reached `max_file_bytes`
+
+        Args:
+            directory (str): partition directory
+        """
+        buffer = self._buffers.pop(directory, None)
+
+        if not buffer or not buffer[0]:
+            return
+
+        arrays = [
+            pyarrow.array(values, type=schema_field.type)
+            for values, schema_field in zip(buffer, self._schema)
+        ]
+        batch = pyarrow.RecordBatch.from_arrays(arrays, schema=self._schema)
+        partition_file = self._get_file(directory)
+
+        partition_file.writer.write_batch(batch)
+        self._files.move_to_end(directory)
+        self.stats.rows += batch.num_rows
+
+        if partition_file.size >= self._max_file_bytes:
+            self._close_file(directory)
+
+    def _get_file(self, directory: str) -> _PartitionFile:
+        """
+        Gets the open file of a partition, opening a new one if needed
+
+        Args:
+            directory (str): partition directory
+
+        Returns:
+            _PartitionFile: open partition file
+        """
+        partition_file = self._files.get(directory)
+
+        if partition_file is not None:
+            return partition_file
+
+        if len(self._files) >= self._max_open_files:
+            self._close_file(next(iter(self._files)))
+
+        self._sequence += 1
+        path = posixpath.join(
+            *filter(None, [self._base_path, directory]),
+            f'{self._prefix}-{self._sequence:05d}.{self._compression}.parquet'
+        )
+        self._filesystem.create_dir(posixpath.dirname(path), recursive=True)
+        stream = self._filesystem.open_output_stream(path)
+        writer = pyarrow.parquet.ParquetWriter(stream, self._schema, compression=self._compression)
+        partition_file = self._files[directory] = _PartitionFile(path=path, stream=stream, writer=writer)
+
+        return partition_file
+
+    def _close_file(self, directory: str) -> None:
+        """
+        Closes the open file of a partition
+
+        Args:
+            directory (str): partition directory
+        """
+        partition_file = self._files.pop(directory)
+        partition_file.writer.close()
+        self.stats.bytes += partition_file.size
+        partition_file.stream.close()
+        self.stats.files.append(partition_file.path)
@@ -0,0 +1,222 @@
+"""Module with helpers to work with SQS clients, queue URLs and batch APIs"""
+
+import time
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+__all__ = [
+    'MAX_BATCH_ENTRIES',
+    'MAX_BATCH_BYTES',
+    'create_sqs_client',
+    'is_queue_does_not_exist',
+    'QueueUrlCache',
+    'entry_size',
+    'chunk_batch_entries',
+    'send_message_batch'
+]
+
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+_QUEUE_DOES_NOT_EXIST_CODES = frozenset({
+    'QueueDoesNotExist',
+    'AWS.SimpleQueueService.NonExistentQueue'
+})
+
+T = TypeVar('T')
+
+
+def create_sqs_client(
+        region_name: str = 'us-east-1',
+        max_pool_connections: int = 50,
+        endpoint_url: Optional[str] = None
+):
+    """
+    Creates a SQS client meant to be shared by the whole process
+
+    Args:
+        region_name (str): AWS region name
+        max_pool_connections (int): maximum number of connections kept in the HTTP pool
+        endpoint_url (Optional[str]): SQS endpoint, like a local moto server, AWS if None
+
+    Returns:
+        SQS client with keep-alive connections and standard retries
+    """
+    config = Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        retries={'mode': 'standard'}
+    )
+
+    return boto3.client('sqs', region_name=region_name, config=config, endpoint_url=endpoint_url)
+
+
+def is_queue_does_not_exist(error: ClientError) -> bool:
+    """
+    Checks if whether a client error means that the queue does not exist
+
+    Args:
+        error (ClientError): error raised by a SQS client
+
+    Returns:
+        bool: True if queue does not exist. Otherwise, False
+    """
+    return error.response.get('Error', {}).get('Code') in _QUEUE_DOES_NOT_EXIST_CODES
+
+
+class QueueUrlCache:
+    """
+    Cache of queue name to queue URL resolutions, with a time to live
+    """
+    def __init__(self, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes `QueueUrlCache` class
+
+        Args:
+            ttl (float): seconds that a resolved URL is kept
+            clock (Callable[[], float]): monotonic clock used to expire URLs
+        """
+        self._ttl = ttl
+        self._clock = clock
+        self._urls: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sqs_client, queue_name: str) -> str:
+        """
+        Gets a queue URL, calling `get_queue_url` only when it is not cached or expired
+
+        Args:
+            sqs_client: boto3 SQS client
+            queue_name (str): queue name
+
+        Returns:
+            str: queue URL
+        """
+        cached = self._urls.get(queue_name)
+
+        if cached is not None and cached[1] > self._clock():
+            return cached[0]
+
+        queue_url = sqs_client.get_queue_url(QueueName=queue_name)['QueueUrl']
+
+        with self._lock:
+            self._urls[queue_name] = (queue_url, self._clock() + self._ttl)
+
+        return queue_url
+
+    def invalidate(self, queue_name: str = None) -> None:
+        """
+        Drops a cached queue URL, or all of them when no name is given
+
+        Args:
+            queue_name (str): queue name
+        """
+        with self._lock:
+            if queue_name is None:
+                self._urls.clear()
+            else:
+                self._urls.pop(queue_name, None)
+
+    def call(self, sqs_client, queue_name: str, operation: Callable[[str], T]) -> T:
+        """
+        Runs an operation with the queue URL. If the queue does not exist anymore, the
+        URL is invalidated and resolved again once, in case the queue was re-created.
+
+        Args:
+            sqs_client: boto3 SQS client
+            queue_name (str): queue name
+            operation (Callable[[str], T]): operation that receives the queue URL
+
+        Returns:
+            T: operation result
+        """
+        try:
+            return operation(self.get(sqs_client=sqs_client, queue_name=queue_name))
+
+        except ClientError as error:
+            if not is_queue_does_not_exist(error):
+                raise
+
+            self.invalidate(queue_name=queue_name)
+
+            return operation(self.get(sqs_client=sqs_client, queue_name=queue_name))
+
+
+def entry_size(entry: dict) -> int:
+    """
+    Gets the size that an entry counts towards the batch payload limit, which is
+    its body plus the name, data type and value of each message attribute
+
+    Args:
+        entry (dict): `send_message_batch` entry
+
+    Returns:
+        int: entry size in bytes
+    """
+    size = len(entry['MessageBody'].encode('utf-8'))
+
+    for name, attribute in entry.get('MessageAttributes', {}).items():
+        value = attribute.get('StringValue') or attribute.get('BinaryValue') or ''
+        size += len(name.encode('utf-8')) + len(attribute['DataType'].encode('utf-8'))
+        size += len(value) if isinstance(value, bytes) else len(value.encode('utf-8'))
+
+    return size
+
+
+def chunk_batch_entries(
+        entries: Iterable[dict],
+        max_entries: int = MAX_BATCH_ENTRIES,
+        max_bytes: int = MAX_BATCH_BYTES
+) -> Iterator[List[dict]]:
+    """
+    Groups `send_message_batch` entries into batches that respect SQS count and size limits
+
+    Args:
+        entries (Iterable[dict]): entries to be grouped
+        max_entries (int): maximum number of entries per batch
+        max_bytes (int): maximum total payload size per batch
+
+    Returns:
+        Iterator[List[dict]]: batches of entries
+    """
+    batch, batch_bytes = [], 0
+
+    for entry in entries:
+        size = entry_size(entry)
+
+        if batch and (len(batch) == max_entries or batch_bytes + size > max_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+
+        batch.append(entry)
+        batch_bytes += size
+
+    if batch:
+        yield batch
+
+
+def send_message_batch(sqs_client, queue_url: str, entries: Iterable[dict]) -> List[dict]:
+    """
+    Sends entries to a queue with as few `send_message_batch` calls as possible
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url (str): destination queue URL
+        entries (Iterable[dict]): entries with unique `Id` and `MessageBody`
+
+    Returns:
+        List[dict]: failed entries as reported by SQS, with `Id`, `Code` and `Message`
+    """
+    failed = []
+
+    for batch in chunk_batch_entries(entries):
+        response = sqs_client.send_message_batch(
+            QueueUrl=queue_url,
+            Entries=batch
+        )
+        failed.extend(response.get('Failed', []))
+
+    return failed
@@ -1,4 +1,5 @@
-from typing import Protocol
+from dataclasses import fields
+from typing import Callable, ClassVar, Optional, Protocol, Tuple
 
 
 class BaseBuilder(Protocol):
@@ -7,14 +8,36 @@ class BaseBuilder(Protocol):
 
     You can implement as many other methods as you like to help build the class
 
+    Concrete builders may set `product` to the dataclass they construct and implement
+    one `get_<field>` getter per dataclass init field. Getters are then resolved once,
+    when the builder class is created, and `construct` calls them directly.
+
     Args:
         config (dict): Class configuration as dictionary
     """
     config: dict
+    product: ClassVar[Optional[type]] = None
+    _getters: ClassVar[Tuple[Tuple[str, Callable], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Resolves the getters of each field of `product` for concrete builders"""
+        super().__init_subclass__(**kwargs)
+
+        if cls.product is not None:
+            cls._getters = tuple(
+                (field.name, getattr(cls, f'get_{field.name}'))
+                for field in fields(cls.product)
+                if field.init
+            )
 
     def construct(self) -> object:
         """
-        This method should be implemented on concrete class and must be able
+        Constructs a `product` class instance calling the resolved getters.
+
+        This method can be overridden on concrete class and must be able
         to construct your class instance
         """
-        raise NotImplementedError()
+        if self.product is None:
+            raise NotImplementedError()
+
+        return self.product(**{name: getter(self) for name, getter in self._getters})
@@ -0,0 +1,7 @@
+"""Module for custom exceptions related to shared utilities"""
+
+
+class MaxDepthExceededError(RecursionError):
+    """Exception for trees nested deeper than the allowed maximum depth"""
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
@@ -1,14 +1,17 @@
 """Module to implement all concrete builder classes related to schema"""
 
-from typing import List
+import functools
+from typing import Callable, List, Optional, Tuple, Union
 
+from itidigital.utils import walker
 from itidigital.data_quality.event.event import FieldType
 from itidigital.utils.builder.base import BaseBuilder
-from itidigital.utils.schema.event import EventSchema, SchemaField, ObjectField
+from itidigital.utils.schema.event import EventSchema, SchemaField, ArrayField, ObjectField
 
 
 class SchemaFieldBuilder(BaseBuilder):
     """Builder concrete class for `SchemaFieldBuilder`"""
+    product = SchemaField
 
     def __init__(self, config: dict) -> None:
         """
@@ -22,21 +25,6 @@ class SchemaFieldBuilder(BaseBuilder):
         """
         self._config = config
 
-    def construct(self) -> SchemaField:
-        """
-        Constructs a `SchemaField` class instance
-
-        Returns:
-            SchemaField: a class instance of SchemaField based on given configuration
-        """
-        kwargs = {}
-
-        for field in SchemaField.__dataclass_fields__:
-            method = getattr(self, f'get_{field}')
-            kwargs[field] = method()
-
-        return SchemaField(**kwargs)
-
     def get_id(self) -> str:
         """
         Gets schema field id attribute
@@ -53,7 +41,7 @@ class SchemaFieldBuilder(BaseBuilder):
         Returns:
             str: schema field name attribute
         """
-        identifier = self.get_id()
+        identifier = self._config.get('$id', '')
 
         return identifier.split('/')[-1]
 
@@ -65,7 +53,7 @@ class SchemaFieldBuilder(BaseBuilder):
             FieldType: schema field type attribute
         """
         try:
-            type_name = self._config.get('type', '')
+            type_name = _get_type_name(self._config)
             return FieldType[type_name.upper()]
 
         except KeyError:
@@ -98,9 +86,46 @@ class SchemaFieldBuilder(BaseBuilder):
         """
         return self._config.get('examples', [])
 
+    def get_nullable(self) -> bool:
+        """
+        Gets schema field nullable attribute
+
+        Returns:
+            bool: True if `null` is one of the schema field types. Otherwise, False
+        """
+        return _is_nullable(self._config)
+
+
+class ArrayFieldBuilder(SchemaFieldBuilder):
+    """Builder concrete class for `ArrayFieldBuilder`"""
+    product = ArrayField
+
+    def get_items(self) -> Optional[Union[SchemaField, ObjectField, ArrayField]]:
+        """
+        Gets array field items attribute, walking all nesting levels iteratively
+
+        Returns:
+            Optional[Union[SchemaField, ObjectField, ArrayField]]: array field items attribute,
+                or None when any item is accepted
+        """
+        raw_items = self._config.get('items')
+
+        if not isinstance(raw_items, dict):
+            return None
+
+        items = []
+        walker.walk(
+            roots=[(items.append, raw_items)],
+            visit=_build_property
+        )
+
+        return items[0]
+
 
 class ObjectFieldBuilder(BaseBuilder):
     """Builder concrete class for `SchemaFieldBuilder`"""
+    product = ObjectField
+
     def __init__(self, config: dict) -> None:
         """
         Initializes `ObjectFieldBuilder` class
@@ -113,21 +138,6 @@ class ObjectFieldBuilder(BaseBuilder):
         """
         self._config = config
 
-    def construct(self) -> ObjectField:
-        """
-        Constructs a `ObjectField` class instance
-
-        Returns:
-            ObjectField: a class instance of ObjectField based on given configuration
-        """
-        kwargs = {}
-
-        for field in ObjectField.__dataclass_fields__:
-            method = getattr(self, f'get_{field}')
-            kwargs[field] = method()
-
-        return ObjectField(**kwargs)
-
     def get_id(self) -> str:
         """
         Gets object field id attribute
@@ -144,7 +154,7 @@ class ObjectFieldBuilder(BaseBuilder):
         Returns:
             str: object field name attribute
         """
-        identifier = self.get_id()
+        identifier = self._config.get('$id', '')
 
         return identifier.split('/')[-1]
 
@@ -156,7 +166,7 @@ class ObjectFieldBuilder(BaseBuilder):
             FieldType: object field type attribute
         """
         try:
-            type_name = self._config.get('type', '')
+            type_name = _get_type_name(self._config)
 
             return FieldType[type_name.upper()]
 
@@ -190,9 +200,18 @@ class ObjectFieldBuilder(BaseBuilder):
         """
         return self._config.get('required', [])
 
+    def get_nullable(self) -> bool:
+        """
+        Gets object field nullable attribute
+
+        Returns:
+            bool: True if `null` is one of the object field types. Otherwise, False
+        """
+        return _is_nullable(self._config)
+
     def get_properties(self) -> List[SchemaField]:
         """
-        Gets object field properties attribute
+        Gets object field properties attribute, walking all nesting levels iteratively
 
         Returns:
             List[SchemaField]: object field properties attribute
@@ -203,24 +222,17 @@ class ObjectFieldBuilder(BaseBuilder):
         if not raw_properties:
             return properties
 
-        for name, value in raw_properties.items():
-            property_type_name = value.get('type', '')
-            property_type = FieldType[property_type_name.upper()]
-
-            if property_type == FieldType.OBJECT:
-                builder = ObjectFieldBuilder(config=value)
-
-            else:
-                builder = SchemaFieldBuilder(config=value)
-
-            property = builder.construct()
-            properties.append(property)
+        walker.walk(
+            roots=[(properties.append, value) for value in raw_properties.values()],
+            visit=_build_property
+        )
 
         return properties
 
 
 class SchemaBuilder(ObjectFieldBuilder):
     """Builder concrete class for `SchemaBuilder`"""
+    product = EventSchema
 
     def __init__(self, config: dict) -> None:
         """
@@ -235,21 +247,6 @@ class SchemaBuilder(ObjectFieldBuilder):
         super().__init__(config=config)
         self._config = config
 
-    def construct(self) -> EventSchema:
-        """
-        Constructs a `EventSchema` class instance
-
-        Returns:
-            EventSchema: a class instance of EventSchema based on given configuration
-        """
-        kwargs = {}
-
-        for field in EventSchema.__dataclass_fields__:
-            method = getattr(self, f'get_{field}')
-            kwargs[field] = method()
-
-        return EventSchema(**kwargs)
-
     def get_schema(self) -> str:
         """
         Gets schema attribute
@@ -258,3 +255,81 @@ class SchemaBuilder(ObjectFieldBuilder):
             str: schema attribute
         """
         return self._config.get('$schema', '')
+
+
+def _build_property(node: Tuple[Callable, dict]) -> Optional[List[Tuple[Callable, dict]]]:
+    """
+    Builds a schema field and adds it to its parent, either to the properties of an
+    object field or as the items of an array field. Nested fields are built empty and
+    then filled in by the nodes of their properties or items.
+
+    Args:
+        node (Tuple[Callable, dict]): function adding the field to its parent and raw field
+
+    Returns:
+        Optional[List[Tuple[Callable, dict]]]: nodes of object field properties or array
+            field items, or None for regular fields
+    """
+    add, value = node
+
+    property_type_name = _get_type_name(value)
+    property_type = FieldType[property_type_name.upper()]
+
+    if property_type == FieldType.OBJECT:
+        property = ObjectFieldBuilder(config={**value, 'properties': {}}).construct()
+        add(property)
+
+        return [(property.properties.append, nested_value) for nested_value in value.get('properties', {}).values()]
+
+    if property_type == FieldType.ARRAY:
+        property = ArrayFieldBuilder(config={**value, 'items': None}).construct()
+        add(property)
+        raw_items = value.get('items')
+
+        if not isinstance(raw_items, dict):
+            return None
+
+        return [(functools.partial(setattr, property, 'items'), raw_items)]
+
+    add(SchemaFieldBuilder(config=value).construct())
+
+    return None
+
+
+def _get_type_name(config: dict) -> str:
+    """
+    Gets the JSON schema type name of a raw field. Fields holding a list of types, like
+    `["string", "null"]`, get their single non-null type.
+
+    Args:
+        config (dict): raw field
+
+    Returns:
+        str: type name, `unknown` when a field has more than one non-null type
+    """
+    type_name = config.get('type', '')
+
+    if not isinstance(type_name, list):
+        return type_name
+
+    type_names = [name for name in type_name if name != FieldType.NULL.value]
+
+    if not type_names:
+        return FieldType.NULL.value
+
+    return type_names[0] if len(type_names) == 1 else FieldType.UNKNOWN.value
+
+
+def _is_nullable(config: dict) -> bool:
+    """
+    Checks if a raw field accepts null values besides its own type
+
+    Args:
+        config (dict): raw field
+
+    Returns:
+        bool: True if field type is a list holding `null` and another type. Otherwise, False
+    """
+    type_name = config.get('type', '')
+
+    return isinstance(type_name, list) and FieldType.NULL.value in type_name and len(type_name) > 1
@@ -1,8 +1,11 @@
-from typing import List, Any, Union
+from functools import partial
+from typing import List, Any, Optional, Union
 from dataclasses import dataclass, field
 
+from itidigital.utils import walker
 
-@dataclass
+
+@dataclass(slots=True)
 class SchemaField:
     """
     Class to represent the data structure of a schema field
@@ -14,6 +17,7 @@ class SchemaField:
         title (str): Schema field type
         description (str): Schema field description
         examples (List[Any]): Examples of possible values
+        nullable (bool): Whether the field also accepts null values
     """
     id: str = field(compare=False)
     name: str = field(compare=True)
@@ -21,9 +25,90 @@ class SchemaField:
     title: str = field(compare=False)
     description: str = field(compare=False)
     examples: List[Any] = field(compare=False)
+    nullable: bool = field(default=False, compare=False, kw_only=True)
+
+
+@dataclass(slots=True)
+class ArrayField(SchemaField):
+    """
+    Class to represent the data structure of an array field
+
+    Arrays without `items` accept elements of any type, so they are equal to
+    arrays of any items.
+
+    Args:
+        items (Optional[Union[SchemaField, ObjectField, ArrayField]]): schema of array elements
+    """
+    items: Optional[Union[SchemaField, 'ObjectField', 'ArrayField']] = field(default=None, compare=True)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return _fields_equal(self, other)
+
+
+def _visit_pair(state: List[bool], node: tuple) -> Optional[List[tuple]]:
+    """
+    Compares two schema fields, without their nested fields
+
+    Args:
+        state (List[bool]): comparison outcome so far, set to False on the first difference
+        node (tuple): both fields, and whether their names are compared. Item names are
+            ignored, since items are not named properties
+
+    Returns:
+        Optional[List[tuple]]: pairs of object properties or array items, or None if there
+            is nothing else to compare
+    """
+    field, other, compare_name = node
+
+    # once a difference is found, the remaining pairs are skipped
+    if not state[0]:
+        return None
 
+    if (
+            field.__class__ is not other.__class__
+            or field.type != other.type
+            or (compare_name and field.name != other.name)
+    ):
+        state[0] = False
+        return None
 
-@dataclass
+    if isinstance(field, ObjectField):
+        if len(field.properties) != len(other.properties):
+            state[0] = False
+            return None
+
+        return [(prop, other_prop, True) for prop, other_prop in zip(field.properties, other.properties)]
+
+    # arrays without items accept elements of any type, so they are equal to arrays of any items
+    if isinstance(field, ArrayField) and field.items is not None and other.items is not None:
+        return [(field.items, other.items, False)]
+
+    return None
+
+
+def _fields_equal(field, other) -> bool:
+    """
+    Compares two schema fields and all their nested fields, walking all nesting levels
+    iteratively. Only names, types, object properties and array items are compared.
+
+    Args:
+        field (Union[SchemaField, ObjectField, ArrayField]): schema field
+        other (Union[SchemaField, ObjectField, ArrayField]): schema field
+
+    Returns:
+        bool: True if both fields are equal. Otherwise, False
+    """
+    state = [True]
+
+    walker.walk(roots=[(field, other, True)], visit=partial(_visit_pair, state))
+
+    return state[0]
+
+
+@dataclass(slots=True)
 class ObjectField:
     """
     Class to represent the data structure of an object field
@@ -36,6 +121,7 @@ class ObjectField:
         description (str): Object field description
         required (List[str]): Object field required fields
         properties (List[SchemaField]): List with all object properties
+        nullable (bool): Whether the field also accepts null values
     """
     id: str = field(compare=False)
     name: str = field(compare=True)
@@ -44,9 +130,18 @@ class ObjectField:
     description: str = field(compare=False)
     required: List[str] = field(compare=False)
     properties: List[SchemaField] = field(compare=True)
+    nullable: bool = field(default=False, compare=False, kw_only=True)
+    _fingerprint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _layout_fingerprint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-@dataclass
+        return _fields_equal(self, other)
+
+
+@dataclass(slots=True)
 class EventSchema(ObjectField):
     """
     Class to represent the data structure of an event schema
@@ -58,5 +153,4 @@ class EventSchema(ObjectField):
     schema: str = field(compare=False)
     properties: List[Union[SchemaField, ObjectField]] = field(compare=True)
 
-
-
+    __eq__ = ObjectField.__eq__
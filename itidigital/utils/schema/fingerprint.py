@@ -0,0 +1,242 @@
+"""Module to compute order-independent structural fingerprints of schemas and events"""
+
+import hashlib
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from itidigital.utils import walker
+from itidigital.data_quality.event.event import FieldType, get_field_type
+from itidigital.utils.schema.event import ArrayField, ObjectField, SchemaField
+
+__all__ = [
+    'schema_fingerprint',
+    'layout_fingerprint',
+    'event_fingerprint'
+]
+
+_OBJECT = FieldType.OBJECT.value
+
+
+def _digest(canonical: str) -> str:
+    """
+    Hashes a canonical structure
+
+    Args:
+        canonical (str): canonical structure
+
+    Returns:
+        str: structure hash as hexadecimal string
+    """
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _member(name: str, canonical: str) -> str:
+    """
+    Builds the canonical structure of an object member. Names are length-prefixed,
+    so they can hold any character without being confused with the structure.
+
+    Args:
+        name (str): member name
+        canonical (str): canonical structure of member value
+
+    Returns:
+        str: canonical structure of member
+    """
+    return f"{len(name)}:{name}={canonical}"
+
+
+def _canonical(root, describe: Callable[[Any], Union[str, Iterable[Tuple[str, Any]]]]) -> str:
+    """
+    Builds the canonical structure of a tree, with object members sorted by name. Nodes
+    are collected in pre-order by `walker.walk`, then built in reverse order, so members
+    are built before the object that holds them and no nesting level recurses.
+
+    Args:
+        root (Any): top level node
+        describe (Callable[[Any], Union[str, Iterable[Tuple[str, Any]]]]): gets the name
+            and node of object members, or the type of any other node
+
+    Returns:
+        str: canonical structure
+    """
+    # members of the parent, member name, and type or members of the node
+    nodes: List[Tuple[List[str], str, Union[str, List[str]]]] = []
+    canonical_root: List[str] = []
+
+    def visit(node):
+        parent, name, value = node
+        description = describe(value)
+
+        if type(description) is str:
+            nodes.append((parent, name, description))
+            return None
+
+        members: List[str] = []
+        nodes.append((parent, name, members))
+
+        return [(members, member_name, member) for member_name, member in description]
+
+    walker.walk(roots=[(canonical_root, '', root)], visit=visit)
+
+    for parent, name, canonical in reversed(nodes):
+        if type(canonical) is list:
+            canonical = f"{_OBJECT}{{{','.join(sorted(canonical))}}}"
+
+        parent.append(_member(name, canonical) if parent is not canonical_root else canonical)
+
+    return canonical_root[0]
+
+
+def _describe_schema(field: Union[ObjectField, SchemaField]) -> Union[str, List[Tuple[str, SchemaField]]]:
+    """
+    Describes a schema field for `_canonical`
+
+    Args:
+        field (Union[ObjectField, SchemaField]): schema field
+
+    Returns:
+        Union[str, List[Tuple[str, SchemaField]]]: name and field of object properties, or field type
+    """
+    if isinstance(field, ObjectField):
+        return [(prop.name, prop) for prop in field.properties]
+
+    return field.type.value
+
+
+def _canonical_schema(field: Union[ObjectField, SchemaField]) -> str:
+    """
+    Builds the canonical structure of a schema field, with object properties sorted by name
+
+    Args:
+        field (Union[ObjectField, SchemaField]): schema field
+
+    Returns:
+        str: canonical structure
+    """
+    return _canonical(root=field, describe=_describe_schema)
+
+
+def _visit_layout(parts: List[str], node: Union[str, ObjectField, SchemaField]) -> Optional[list]:
+    """
+    Adds a schema field to the canonical layout of its schema
+
+    Args:
+        parts (List[str]): canonical layout parts
+        node (Union[str, ObjectField, SchemaField]): schema field, or a member name or
+            closing bracket, which are walked as plain strings
+
+    Returns:
+        Optional[list]: properties of object fields and items of array fields, with their
+            member names and closing bracket, or None for other nodes
+    """
+    if isinstance(node, str):
+        parts.append(node)
+        return None
+
+    parts.append(f"{node.type.value}{len(node.description)}:{node.description}")
+
+    if isinstance(node, ObjectField):
+        parts.append('{')
+        return [part for prop in node.properties for part in (_member(prop.name, ''), prop)] + ['}']
+
+    if isinstance(node, ArrayField) and node.items is not None:
+        parts.append('<')
+        return [node.items, '>']
+
+    return None
+
+
+def _canonical_layout(schema: ObjectField) -> str:
+    """
+    Builds the canonical layout of a schema, with object properties in schema order,
+    array items and descriptions, walking all nesting levels iteratively
+
+    Args:
+        schema (ObjectField): schema, or nested object field
+
+    Returns:
+        str: canonical layout
+    """
+    parts: List[str] = []
+
+    walker.walk(roots=[schema], visit=partial(_visit_layout, parts))
+
+    return ''.join(parts)
+
+
+def _describe_event(value) -> Union[str, Iterable[Tuple[str, Any]]]:
+    """
+    Describes a raw event value for `_canonical`
+
+    Args:
+        value (Any): raw event value
+
+    Returns:
+        Union[str, Iterable[Tuple[str, Any]]]: name and value of object keys, or value type
+    """
+    return value.items() if type(value) is dict else get_field_type(value).value
+
+
+def _canonical_event(value) -> str:
+    """
+    Builds the canonical structure of a raw event value, with object keys sorted by name
+
+    Args:
+        value (Any): raw event value
+
+    Returns:
+        str: canonical structure
+    """
+    return _canonical(root=value, describe=_describe_event)
+
+
+def schema_fingerprint(schema: ObjectField) -> str:
+    """
+    Gets the structural fingerprint of a schema, made of its property names and
+    types and independent of property order. The fingerprint is computed once and
+    cached on the schema, which is expected not to change afterwards.
+
+    Args:
+        schema (ObjectField): schema, or nested object field
+
+    Returns:
+        str: structural fingerprint
+    """
+    if schema._fingerprint is None:
+        schema._fingerprint = _digest(_canonical_schema(schema))
+
+    return schema._fingerprint
+
+
+def layout_fingerprint(schema: ObjectField) -> str:
+    """
+    Gets the layout fingerprint of a schema, made of its property names, types and
+    descriptions in schema order, along with array items. Unlike `schema_fingerprint`,
+    it tells apart schemas whose properties come in other order, whose arrays hold other
+    items or whose descriptions differ, like table columns and their comments do. It is
+    cached on the schema too.
+
+    Args:
+        schema (ObjectField): schema, or nested object field
+
+    Returns:
+        str: layout fingerprint
+    """
+    if schema._layout_fingerprint is None:
+        schema._layout_fingerprint = _digest(_canonical_layout(schema))
+
+    return schema._layout_fingerprint
+
+
+def event_fingerprint(event: dict) -> str:
+    """
+    Gets the structural fingerprint of a raw event. It is equal to the fingerprint
+    of every schema that the event structurally matches.
+
+    Args:
+        event (dict): raw event
+
+    Returns:
+        str: structural fingerprint
+    """
+    return _digest(_canonical_event(event))
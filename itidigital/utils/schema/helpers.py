@@ -1,4 +1,6 @@
-import json
+from typing import Union
+
+from itidigital.utils import serialization
 
 
 def load_schema(file_path: str) -> dict:
@@ -11,5 +13,18 @@ def load_schema(file_path: str) -> dict:
     Returns
         dict: JSON schema loaded as dictionary
     """
-    with open(file_path, 'r') as schema_file:
-        return json.loads(schema_file.read())
+    with open(file_path, 'rb') as schema_file:
+        return parse_schema(schema_file.read())
+
+
+def parse_schema(content: Union[str, bytes]) -> dict:
+    """
+    Parses JSON schema from its raw content
+
+    Args:
+        content (Union[str, bytes]): JSON schema document
+
+    Returns
+        dict: JSON schema loaded as dictionary
+    """
+    return serialization.loads(content)
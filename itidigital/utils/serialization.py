@@ -0,0 +1,173 @@
+"""Module to decode and encode JSON with the fastest installed backend"""
+
+import os
+import json
+from typing import Any, Callable, List, NamedTuple, Optional, Union
+
+__all__ = [
+    'BACKENDS',
+    'JsonBackend',
+    'get_backend',
+    'available_backends',
+    'BACKEND',
+    'loads',
+    'dumps',
+    'dumps_bytes'
+]
+
+# preferred first
+BACKENDS = ('orjson', 'ujson', 'json')
+
+Payload = Union[str, bytes, bytearray, memoryview]
+
+
+def _compact_dumps(value: Any) -> str:
+    """
+    Encodes a value with the standard library, as compact as the other backends do. It
+    is their fallback for values they can not encode, like integers beyond 64 bits.
+
+    Args:
+        value (Any): value to be encoded
+
+    Returns:
+        str: encoded document
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+class JsonBackend(NamedTuple):
+    """
+    Class to represent a JSON library
+
+    Args:
+        name (str): library name
+        loads (Callable[[Payload], Any]): decodes a `str` or `bytes` document, raising `ValueError` if invalid
+        dumps (Callable[[Any], str]): encodes a value as a `str` document
+        dumps_bytes (Callable[[Any], bytes]): encodes a value as an UTF-8 `bytes` document
+    """
+    name: str
+    loads: Callable[[Payload], Any]
+    dumps: Callable[[Any], str]
+    dumps_bytes: Callable[[Any], bytes]
+
+
+def _orjson_backend() -> JsonBackend:
+    """Builds the `orjson` backend, which decodes `bytes` natively and encodes to `bytes`"""
+    import orjson
+
+    orjson_dumps = orjson.dumps
+
+    def orjson_dumps_str(value: Any) -> str:
+        try:
+            return orjson_dumps(value).decode('utf-8')
+        except TypeError:
+            return _compact_dumps(value)
+
+    def orjson_dumps_bytes(value: Any) -> bytes:
+        try:
+            return orjson_dumps(value)
+        except TypeError:
+            return _compact_dumps(value).encode('utf-8')
+
+    return JsonBackend(
+        name='orjson',
+        loads=orjson.loads,
+        dumps=orjson_dumps_str,
+        dumps_bytes=orjson_dumps_bytes
+    )
+
+
+def _ujson_backend() -> JsonBackend:
+    """Builds the `ujson` backend, which decodes `bytes` natively and encodes to `str`"""
+    import ujson
+
+    def ujson_loads(payload: Payload) -> Any:
+        return ujson.loads(bytes(payload) if isinstance(payload, memoryview) else payload)
+
+    def ujson_dumps(value: Any) -> str:
+        try:
+            return ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return _compact_dumps(value)
+
+    return JsonBackend(
+        name='ujson',
+        loads=ujson_loads,
+        dumps=ujson_dumps,
+        dumps_bytes=lambda value: ujson_dumps(value).encode('utf-8')
+    )
+
+
+def _json_backend() -> JsonBackend:
+    """Builds the standard library backend"""
+    def json_loads(payload: Payload) -> Any:
+        return json.loads(bytes(payload) if isinstance(payload, memoryview) else payload)
+
+    return JsonBackend(
+        name='json',
+        loads=json_loads,
+        dumps=json.dumps,
+        dumps_bytes=lambda value: json.dumps(value).encode('utf-8')
+    )
+
+
+_FACTORIES = {
+    'orjson': _orjson_backend,
+    'ujson': _ujson_backend,
+    'json': _json_backend
+}
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Gets a JSON backend
+
+    Args:
+        name (Optional[str]): one of `BACKENDS`, or None for the first installed one
+
+    Returns:
+        JsonBackend: JSON backend
+
+    Raises:
+        ValueError: if the name is unknown
+        ImportError: if the named library is not installed
+    """
+    if name is not None:
+        if name not in _FACTORIES:
+            raise ValueError(f"JSON backend should be one of {BACKENDS}, but got {name!r}")
+
+        return _FACTORIES[name]()
+
+    for candidate in BACKENDS:
+        try:
+            return _FACTORIES[candidate]()
+        except ImportError:
+            continue
+
+    return _json_backend()
+
+
+def available_backends() -> List[JsonBackend]:
+    """
+    Gets the installed JSON backends
+
+    Returns:
+        List[JsonBackend]: installed backends, preferred first
+    """
+    backends = []
+
+    for name in BACKENDS:
+        try:
+            backends.append(get_backend(name))
+        except ImportError:
+            continue
+
+    return backends
+
+
+# process wide backend, `JSON_BACKEND` environment variable forces one
+BACKEND = get_backend(os.environ.get('JSON_BACKEND') or None)
+
+loads = BACKEND.loads
+dumps = BACKEND.dumps
+dumps_bytes = BACKEND.dumps_bytes
@@ -0,0 +1,59 @@
+"""Module to walk nested event and schema trees without recursion"""
+
+import os
+from typing import Callable, Iterable, Optional, TypeVar
+
+from itidigital.utils.exceptions import MaxDepthExceededError
+
+__all__ = [
+    'DEFAULT_MAX_DEPTH',
+    'walk'
+]
+
+# Deepest nesting level walked when no `max_depth` is given. Mirrors the depth limit
+# of most JSON parsers, so any payload that could be parsed can also be walked.
+DEFAULT_MAX_DEPTH = int(os.environ.get('MAX_TREE_DEPTH', 1024))
+
+Node = TypeVar('Node')
+
+
+def walk(
+        roots: Iterable[Node],
+        visit: Callable[[Node], Optional[Iterable[Node]]],
+        max_depth: Optional[int] = None
+) -> None:
+    """
+    Walks a tree depth-first on an explicit stack, calling `visit` once per node.
+
+    Nodes are visited in pre-order and siblings keep their order, so `visit` can
+    append each node to the output container of its parent, built when the parent
+    was visited. `visit` returns the children of the node, or None for leaves.
+
+    Args:
+        roots (Iterable[Node]): top level nodes, at depth 1
+        visit (Callable[[Node], Optional[Iterable[Node]]]): processes a node and
+            returns its children
+        max_depth (Optional[int]): deepest level allowed, `DEFAULT_MAX_DEPTH` if None
+
+    Raises:
+        MaxDepthExceededError: if a node is nested deeper than `max_depth`
+    """
+    max_depth = DEFAULT_MAX_DEPTH if max_depth is None else max_depth
+    stack = [iter(roots)]
+
+    while stack:
+        # siblings are consumed by a plain loop, the stack only grows on nested nodes
+        for node in stack[-1]:
+            if len(stack) > max_depth:
+                raise MaxDepthExceededError(
+                    f"Tree is nested deeper than the maximum depth of {max_depth}"
+                )
+
+            children = visit(node)
+
+            if children is not None:
+                stack.append(iter(children))
+                break
+
+        else:
+            stack.pop()
@@ -0,0 +1,92 @@
+import mock
+import pytest
+
+from tests.test_data import examples
+
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality.event.validator import EventValidator
+from itidigital.data_quality.event.cache import CacheStats, ShapeCachedEventValidator, shape_signature
+
+
+@pytest.fixture
+def event_validator() -> EventValidator:
+    """Fixture for EventValidator class example"""
+    return EventValidator(
+        schema=SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+    )
+
+
+@pytest.fixture
+def cached_validator(event_validator: EventValidator) -> ShapeCachedEventValidator:
+    """Fixture for ShapeCachedEventValidator class example"""
+    return ShapeCachedEventValidator(validator=event_validator, maxsize=2)
+
+
+def test_shape_signature_should_works_as_expected():
+    """Asserts that `shape_signature` captures keys and value types recursively"""
+    signature = shape_signature({"foo": "bar", "nested": {"number": 1}})
+
+    assert signature == (dict, 2, "foo", str, "nested", dict, 1, "number", int)
+
+
+def test_shape_signature_should_ignore_values():
+    """Asserts that events with the same shape have the same signature"""
+    other_event = {**examples.EXAMPLE_EVENT, "name": "Mary", "age": 40}
+
+    assert shape_signature(other_event) == shape_signature(examples.EXAMPLE_EVENT)
+
+
+def test_shape_signature_should_capture_array_element_types():
+    """Asserts that arrays with different element types have different signatures"""
+    strings = shape_signature({"tags": ["a", "b"], "contacts": [{"kind": "email"}]})
+    numbers = shape_signature({"tags": [1, 2], "contacts": [{"kind": "email"}]})
+    objects = shape_signature({"tags": ["a", "b"], "contacts": [{"kind": 1}]})
+
+    assert strings == shape_signature({"tags": ["c"], "contacts": [{"kind": "phone"}]})
+    assert strings != numbers
+    assert strings != objects
+
+
+def test_is_valid_should_works_as_expected(cached_validator: ShapeCachedEventValidator):
+    """Asserts that `is_valid` returns the wrapped validator result"""
+    assert cached_validator.is_valid(examples.EXAMPLE_EVENT)
+    assert not cached_validator.is_valid({**examples.EXAMPLE_EVENT, "age": "32"})
+
+
+def test_is_valid_should_skip_validator_for_known_shapes(
+    cached_validator: ShapeCachedEventValidator, event_validator: EventValidator
+):
+    """Asserts that `is_valid` only calls the wrapped validator on misses"""
+    with mock.patch.object(event_validator, 'is_valid', wraps=event_validator.is_valid) as is_valid_mock:
+        for age in range(5):
+            assert cached_validator.is_valid({**examples.EXAMPLE_EVENT, "age": age})
+
+    assert is_valid_mock.call_count == 1
+    assert cached_validator.stats == CacheStats(hits=4, misses=1, evictions=0)
+
+
+def test_is_valid_should_evict_least_recently_used_shapes(cached_validator: ShapeCachedEventValidator):
+    """Asserts that `is_valid` keeps at most `maxsize` shapes"""
+    cached_validator.is_valid({"a": 1})
+    cached_validator.is_valid({"b": 1})
+    cached_validator.is_valid({"a": 1})
+    cached_validator.is_valid({"c": 1})
+    cached_validator.is_valid({"a": 1})
+
+    assert len(cached_validator) == 2
+    assert cached_validator.stats == CacheStats(hits=2, misses=3, evictions=1)
+
+
+def test_clear_should_works_as_expected(cached_validator: ShapeCachedEventValidator):
+    """Asserts that `clear` drops cached shapes and counters"""
+    cached_validator.is_valid({"a": 1})
+    cached_validator.clear()
+
+    assert len(cached_validator) == 0
+    assert cached_validator.stats == CacheStats()
+
+
+def test_init_should_raise_exception_for_invalid_maxsize(event_validator: EventValidator):
+    """Asserts that `maxsize` must be positive"""
+    with pytest.raises(ValueError):
+        ShapeCachedEventValidator(validator=event_validator, maxsize=0)
@@ -0,0 +1,71 @@
+import pytest
+
+from tests.test_data import examples
+
+from itidigital.utils.schema.event import EventSchema
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality.event.event import FieldType
+from itidigital.data_quality.event.compiler import FieldCheck, ItemsCheck, compile_schema
+
+
+class TestCompileSchema:
+    """Test class for `compile_schema`"""
+
+    @pytest.fixture
+    def schema(self) -> EventSchema:
+        """Fixture for Schema class example"""
+        return SchemaBuilder(
+            config=examples.EXAMPLE_SCHEMA
+        ).construct()
+
+    def test_compile_schema_should_works_as_expected(self, schema: EventSchema) -> None:
+        """Asserts that `compile_schema` flattens the schema as expected"""
+        checks = compile_schema(schema=schema)
+
+        assert checks[3] == FieldCheck(
+            path=('age',),
+            expected_type=FieldType.INTEGER,
+            required=True
+        )
+        assert checks[4] == FieldCheck(
+            path=('address',),
+            expected_type=FieldType.OBJECT,
+            required=True,
+            keys=frozenset({'street', 'number', 'mailAddress'}),
+            required_keys=frozenset({'street', 'number', 'mailAddress'})
+        )
+        assert checks[7] == FieldCheck(
+            path=('address', 'mailAddress'),
+            expected_type=FieldType.BOOLEAN,
+            required=True,
+            parent=4
+        )
+
+    def test_compile_schema_should_place_parents_first(self, schema: EventSchema) -> None:
+        """Asserts that every check comes after its parent check"""
+        checks = compile_schema(schema=schema)
+
+        for index, check in enumerate(checks):
+            assert check.parent < index
+            if check.parent >= 0:
+                assert checks[check.parent].path == check.path[:-1]
+
+    def test_name_property_should_works_as_expected(self) -> None:
+        """Asserts that `name` property returns the last path key"""
+        check = FieldCheck(path=('address', 'street'), expected_type=FieldType.STRING, required=False)
+
+        assert check.name == 'street'
+
+    def test_compile_schema_should_compile_array_items(self) -> None:
+        """Asserts that array fields are compiled with a check of their items"""
+        schema = SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+        checks = {check.name: check for check in compile_schema(schema=schema)}
+
+        assert checks['tags'].items == ItemsCheck(expected_type=FieldType.STRING)
+        assert checks['contacts'].items.keys == frozenset({'kind', 'value'})
+        assert len(checks['contacts'].items.checks) == 2
+        assert checks['matrix'].items == ItemsCheck(
+            expected_type=FieldType.ARRAY,
+            items=ItemsCheck(expected_type=FieldType.INTEGER)
+        )
+        assert checks['extra'].items is None
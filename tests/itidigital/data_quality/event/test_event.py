@@ -186,3 +186,52 @@ class TestEvent:
         )
 
         assert field_property == expected_field_property
+
+
+class TestEventField:
+    """Test class for `EventField`"""
+
+    def test_event_field_should_not_have_instance_dict(self) -> None:
+        """Asserts that `EventField` instances use slots instead of `__dict__`"""
+        event_field = EventField(name="foo", value="bar", type=FieldType.STRING)
+
+        assert not hasattr(event_field, '__dict__')
+
+
+class TestEventArrayItems:
+    """Test class for `items` inference of array fields on `Event`"""
+
+    @pytest.mark.parametrize('values, expected_items', [
+        ([1, 2, 3], {"type": "integer"}),
+        (["a", "b"], {"type": "string"}),
+        ([1, "a"], {"type": "unknown"}),
+        ([[1], [2, 3]], {"type": "array", "items": {"type": "integer"}}),
+        ([{"foo": 1}, {"foo": "bar"}], {"type": "unknown"}),
+        ([{"foo": [1]}, {"foo": ["bar"]}], {"type": "unknown"}),
+        ([{"foo": [[1]]}, {"foo": [[1, "bar"]]}], {"type": "unknown"}),
+        ([], None),
+    ])
+    def test__get_items_should_works_as_expected(self, values: list, expected_items) -> None:
+        """Asserts that `_get_items` infers the items schema from array elements"""
+        assert Event._get_items(values=values) == expected_items
+
+    def test__get_items_should_infer_object_items(self) -> None:
+        """Asserts that `_get_items` infers object items from elements with the same structure"""
+        items = Event._get_items(values=[{"foo": "bar"}, {"foo": "baz"}])
+
+        assert items["type"] == "object"
+        assert items["properties"]["foo"]["type"] == "string"
+
+    def test__get_items_should_infer_object_items_from_every_element(self) -> None:
+        """Asserts that nested array items of object items are inferred from every element, not only the first"""
+        items = Event._get_items(values=[{"foo": []}, {"foo": [1]}])
+
+        assert items["properties"]["foo"]["items"] == {"type": "integer"}
+
+    def test__get_properties_for_regular_fields_should_add_items(self) -> None:
+        """Asserts that array fields get an inferred `items` schema"""
+        field_property = Event._get_properties_for_regular_fields(
+            field=EventField(name="tags", value=["a", "b"], type=FieldType.ARRAY)
+        )
+
+        assert field_property["items"] == {"type": "string"}
@@ -0,0 +1,262 @@
+import os
+import json
+
+import mock
+import pytest
+
+from tests.test_data import examples
+
+from itidigital.data_quality.event.result import ErrorKind, FieldError
+from itidigital.data_quality.event.exceptions import DuplicateSchemaKey
+from itidigital.data_quality.event.validator import CompiledEventValidator
+from itidigital.data_quality.event import registry as registry_module
+from itidigital.data_quality.event.registry import SchemaFileRegistry, SchemaRegistry, RegistryStats
+from itidigital.utils import walker
+
+
+def _touch(path: str) -> None:
+    """Moves file modification time forward"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _write_schema(path, schema: dict) -> str:
+    """Writes a schema file, moving its modification time forward"""
+    path.write_text(json.dumps(schema))
+    _touch(str(path))
+
+    return str(path)
+
+
+def _typed_schema(event_type: str, **properties: dict) -> dict:
+    """Builds a schema whose `type` property is constant"""
+    return {
+        "type": "object",
+        "required": ["type", *properties],
+        "properties": {
+            "type": {"$id": "#/properties/type", "type": "string", "const": event_type},
+            **{
+                name: {"$id": f"#/properties/{name}", **prop}
+                for name, prop in properties.items()
+            }
+        }
+    }
+
+
+class TestSchemaFileRegistry:
+    """Test class for `SchemaFileRegistry`"""
+
+    @pytest.fixture
+    def schema_path(self, tmp_path) -> str:
+        """Fixture for a schema file"""
+        path = tmp_path / 'schema.json'
+        path.write_text(json.dumps(examples.EXAMPLE_SCHEMA))
+
+        return str(path)
+
+    @pytest.fixture
+    def registry(self) -> SchemaFileRegistry:
+        """Fixture for `SchemaFileRegistry` class example"""
+        return SchemaFileRegistry()
+
+    def test_get_should_works_as_expected(
+        self, registry: SchemaFileRegistry, schema_path: str
+    ) -> None:
+        """Asserts that `get` loads schema and builds a validator"""
+        entry = registry.get(file_path=schema_path)
+
+        assert isinstance(entry.validator, CompiledEventValidator)
+        assert entry.validator.is_valid(examples.EXAMPLE_EVENT)
+        assert registry.stats == RegistryStats(hits=0, reloads=1)
+
+    def test_get_should_reuse_loaded_schema(
+        self, registry: SchemaFileRegistry, schema_path: str
+    ) -> None:
+        """Asserts that `get` does not rebuild an unchanged schema"""
+        first = registry.get(file_path=schema_path)
+        second = registry.get(file_path=schema_path)
+
+        assert first is second
+        assert registry.stats == RegistryStats(hits=1, reloads=1)
+
+    def test_get_should_not_rebuild_when_only_mtime_changes(
+        self, registry: SchemaFileRegistry, schema_path: str
+    ) -> None:
+        """Asserts that `get` keeps the schema when content hash is unchanged"""
+        first = registry.get(file_path=schema_path)
+        _touch(schema_path)
+
+        assert registry.get(file_path=schema_path) is first
+        assert registry.stats == RegistryStats(hits=1, reloads=1)
+
+    def test_get_should_reload_changed_schema(
+        self, registry: SchemaFileRegistry, schema_path: str
+    ) -> None:
+        """Asserts that `get` rebuilds the schema when file content changes"""
+        first = registry.get(file_path=schema_path)
+
+        changed_schema = {**examples.EXAMPLE_SCHEMA, 'properties': {}}
+        with open(schema_path, 'w') as schema_file:
+            schema_file.write(json.dumps(changed_schema))
+        _touch(schema_path)
+
+        second = registry.get(file_path=schema_path)
+
+        assert second is not first
+        assert second.validator.is_valid({})
+        assert registry.stats == RegistryStats(hits=0, reloads=2)
+
+    def test_clear_should_works_as_expected(
+        self, registry: SchemaFileRegistry, schema_path: str
+    ) -> None:
+        """Asserts that `clear` drops loaded schemas and counters"""
+        registry.get(file_path=schema_path)
+        registry.clear()
+        registry.get(file_path=schema_path)
+
+        assert registry.stats == RegistryStats(hits=0, reloads=1)
+
+
+class TestSchemaRegistry:
+    """Test class for `SchemaRegistry`"""
+
+    @pytest.fixture
+    def schema_dir(self, tmp_path):
+        """Fixture for a directory with two versions of an event schema"""
+        _write_schema(tmp_path / 'user_v1.json', _typed_schema('user.v1', name={"type": "string"}))
+        _write_schema(tmp_path / 'user_v2.json', _typed_schema('user.v2', age={"type": "integer"}))
+        (tmp_path / 'README.md').write_text('not a schema')
+
+        return tmp_path
+
+    @pytest.fixture
+    def registry(self, schema_dir) -> SchemaRegistry:
+        """Fixture for a registry dispatching by `type` field"""
+        return SchemaRegistry(directory=str(schema_dir), discriminator='type')
+
+    def test_dispatch_should_use_discriminator(self, registry: SchemaRegistry, schema_dir) -> None:
+        """Asserts that events are dispatched by the `const` of their discriminator"""
+        assert len(registry) == 2
+        assert registry.dispatch({"type": "user.v2", "age": 1}).path == str(schema_dir / 'user_v2.json')
+        assert registry.dispatch({"type": "user.v3"}) is None
+        assert registry.dispatch({"type": {"unhashable": True}}) is None
+        assert registry.dispatch([]) is None
+
+    def test_dispatch_should_fall_back_to_file_name(self, tmp_path) -> None:
+        """Asserts that schemas without a constant discriminator are keyed by file name"""
+        _write_schema(tmp_path / 'example.json', examples.EXAMPLE_SCHEMA)
+        registry = SchemaRegistry(directory=str(tmp_path), discriminator='name')
+
+        assert registry.is_valid({**examples.EXAMPLE_EVENT, "name": "example"})
+        assert not registry.is_valid(examples.EXAMPLE_EVENT)
+
+    def test_dispatch_should_use_fingerprints(self, tmp_path) -> None:
+        """Asserts that events are dispatched by structural fingerprint without discriminator"""
+        _write_schema(tmp_path / 'example.json', examples.EXAMPLE_SCHEMA)
+        _write_schema(tmp_path / 'array.json', examples.EXAMPLE_ARRAY_SCHEMA)
+        registry = SchemaRegistry(directory=str(tmp_path))
+
+        assert registry.dispatch(examples.EXAMPLE_EVENT).path == str(tmp_path / 'example.json')
+        assert registry.is_valid(examples.EXAMPLE_ARRAY_EVENT)
+        assert registry.dispatch({"foo": "bar"}) is None
+
+    def test_dispatch_should_use_root_keys(self, tmp_path) -> None:
+        """Asserts that events are dispatched by their root keys, without fingerprinting them"""
+        _write_schema(tmp_path / 'example.json', examples.EXAMPLE_SCHEMA)
+        registry = SchemaRegistry(directory=str(tmp_path))
+        event = {**examples.EXAMPLE_EVENT, "address": {"street": 1}}
+
+        with mock.patch.object(registry_module, 'event_fingerprint') as fingerprint:
+            assert registry.dispatch(event).path == str(tmp_path / 'example.json')
+            assert registry.validate(event).errors[0].kind != ErrorKind.UNKNOWN_SCHEMA
+
+        fingerprint.assert_not_called()
+
+    def test_dispatch_should_fingerprint_shared_root_keys(self, tmp_path) -> None:
+        """Asserts that schemas sharing root keys are told apart by fingerprint, and duplicates rejected"""
+        _write_schema(tmp_path / 'text.json', _typed_schema('user', value={"type": "string"}))
+        _write_schema(tmp_path / 'number.json', _typed_schema('user', value={"type": "integer"}))
+        registry = SchemaRegistry(directory=str(tmp_path))
+
+        assert registry.dispatch({"type": "user", "value": "a"}).path == str(tmp_path / 'text.json')
+        assert registry.dispatch({"type": "user", "value": 1}).path == str(tmp_path / 'number.json')
+        assert registry.dispatch({"type": "user", "value": []}) is None
+
+        _write_schema(tmp_path / 'copy.json', _typed_schema('order', value={"type": "integer"}))
+
+        with pytest.raises(DuplicateSchemaKey):
+            SchemaRegistry(directory=str(tmp_path))
+
+    def test_validate_should_report_deep_events_as_unknown(self, tmp_path) -> None:
+        """Asserts that events nested deeper than the maximum depth fit no schema, instead of raising"""
+        _write_schema(tmp_path / 'text.json', _typed_schema('user', value={"type": "string"}))
+        _write_schema(tmp_path / 'object.json', _typed_schema('user', value={"type": "object"}))
+        registry = SchemaRegistry(directory=str(tmp_path))
+
+        value = {}
+        for _ in range(walker.DEFAULT_MAX_DEPTH + 1):
+            value = {"value": value}
+
+        assert registry.validate({"type": "user", "value": value}).errors == [
+            FieldError(kind=ErrorKind.UNKNOWN_SCHEMA, path=())
+        ]
+
+    def test_validate_should_report_unknown_schemas(self, registry: SchemaRegistry) -> None:
+        """Asserts that `validate` reports events without schema and validates the others"""
+        assert registry.validate({"type": "user.v3"}).errors == [
+            FieldError(kind=ErrorKind.UNKNOWN_SCHEMA, path=('type',))
+        ]
+        assert registry.validate({"type": "user.v1", "name": "Joseph"}).is_valid
+        assert registry.validate({"type": "user.v1", "name": 1}).errors[0].kind == ErrorKind.TYPE_MISMATCH
+
+    def test_init_should_reject_duplicate_keys(self, tmp_path) -> None:
+        """Asserts that schemas sharing a discriminator value are rejected"""
+        _write_schema(tmp_path / 'a.json', _typed_schema('user', name={"type": "string"}))
+        _write_schema(tmp_path / 'b.json', _typed_schema('user', age={"type": "integer"}))
+
+        with pytest.raises(DuplicateSchemaKey):
+            SchemaRegistry(directory=str(tmp_path), discriminator='type')
+
+    def test_reload_should_rebuild_changed_schema_only(self, registry: SchemaRegistry, schema_dir) -> None:
+        """Asserts that `reload` hot-swaps a single schema"""
+        v1 = registry.dispatch({"type": "user.v1"})
+        path = _write_schema(schema_dir / 'user_v2.json', _typed_schema('user.v2', age={"type": "string"}))
+
+        registry.reload(file_path=path)
+
+        assert registry.dispatch({"type": "user.v1"}) is v1
+        assert registry.is_valid({"type": "user.v2", "age": "32"})
+
+    def test_refresh_should_add_and_remove_schemas(self, registry: SchemaRegistry, schema_dir) -> None:
+        """Asserts that `refresh` loads new schema files and drops removed ones"""
+        _write_schema(schema_dir / 'order.json', _typed_schema('order', total={"type": "integer"}))
+        os.remove(schema_dir / 'user_v1.json')
+
+        registry.refresh()
+
+        assert len(registry) == 2
+        assert registry.is_valid({"type": "order", "total": 15})
+        assert registry.dispatch({"type": "user.v1"}) is None
+
+    def test_dispatch_should_refresh_periodically(self, schema_dir) -> None:
+        """Asserts that schemas are refreshed every `refresh_interval` seconds and broken files are skipped"""
+        now = [0.0]
+        registry = SchemaRegistry(
+            directory=str(schema_dir),
+            discriminator='type',
+            refresh_interval=10,
+            clock=lambda: now[0]
+        )
+        _write_schema(schema_dir / 'order.json', _typed_schema('order', total={"type": "integer"}))
+
+        assert registry.dispatch({"type": "order"}) is None
+
+        now[0] = 10.0
+
+        assert registry.dispatch({"type": "order"}) is not None
+
+        (schema_dir / 'broken.json').write_text('{"type": ')
+        now[0] = 20.0
+
+        with pytest.warns(UserWarning):
+            assert registry.dispatch({"type": "order"}) is not None
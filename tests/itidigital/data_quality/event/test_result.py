@@ -0,0 +1,56 @@
+from itidigital.data_quality.event.result import (
+    ErrorKind,
+    FieldError,
+    ValidationResult,
+    ValidationSummary
+)
+
+
+class TestFieldError:
+    """Test class for `FieldError`"""
+
+    def test_str_should_works_as_expected(self) -> None:
+        """Asserts that errors are described with their kind, path and types"""
+        error = FieldError(kind=ErrorKind.TYPE_MISMATCH, path=('address', 'number'), expected='integer', actual='string')
+
+        assert str(error) == 'type_mismatch at address.number: expected integer, got string'
+        assert str(FieldError(kind=ErrorKind.NOT_AN_OBJECT, path=())) == 'not_an_object at <root>'
+
+
+class TestValidationResult:
+    """Test class for `ValidationResult`"""
+
+    def test_is_valid_should_works_as_expected(self) -> None:
+        """Asserts that results are valid only without errors"""
+        invalid = ValidationResult(errors=[FieldError(kind=ErrorKind.EXTRA_KEY, path=('foo',))])
+
+        assert ValidationResult().is_valid and ValidationResult()
+        assert not invalid.is_valid and not invalid
+
+
+class TestValidationSummary:
+    """Test class for `ValidationSummary`"""
+
+    def test_add_should_works_as_expected(self) -> None:
+        """Asserts that `add` counts results and errors by kind"""
+        summary = ValidationSummary()
+        missing = FieldError(kind=ErrorKind.MISSING_KEY, path=('foo',))
+
+        summary.add(ValidationResult())
+        summary.add(ValidationResult(errors=[missing, missing]))
+        summary.add(ValidationResult(errors=[FieldError(kind=ErrorKind.EXTRA_KEY, path=('bar',))]))
+
+        assert (summary.total, summary.valid, summary.invalid) == (3, 1, 2)
+        assert summary.errors == {ErrorKind.MISSING_KEY: 2, ErrorKind.EXTRA_KEY: 1}
+
+    def test_str_should_works_as_expected(self) -> None:
+        """Asserts that summaries are described with their counters and errors by kind, most common first"""
+        summary = ValidationSummary()
+        missing = FieldError(kind=ErrorKind.MISSING_KEY, path=('foo',))
+
+        assert str(summary) == '0 events (0 valid, 0 invalid)'
+
+        summary.add(ValidationResult())
+        summary.add(ValidationResult(errors=[FieldError(kind=ErrorKind.EXTRA_KEY, path=('bar',)), missing, missing]))
+
+        assert str(summary) == '2 events (1 valid, 1 invalid): missing_key 2, extra_key 1'
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from tests.test_data import examples
@@ -5,8 +7,15 @@ from tests.test_data import examples
 from itidigital.utils.schema.event import EventSchema
 from itidigital.utils.schema.builder import SchemaBuilder
 from itidigital.data_quality.event.builder import EventBuilder
-from itidigital.data_quality.event.validator import EventValidator
+from itidigital.data_quality.event.cache import ShapeCachedEventValidator
+from itidigital.data_quality.event.validator import (
+    EventValidator,
+    CompiledEventValidator,
+    FingerprintEventValidator,
+    ValidationMode
+)
 from itidigital.data_quality.event.exceptions import InvalidSchemaObject
+from itidigital.data_quality.event.result import ErrorKind, FieldError
 
 
 class TestEventValidator:
@@ -63,3 +72,407 @@ class TestEventValidator:
         assert event_validator.is_valid(
             event=event
         )
+
+
+class TestCompiledEventValidator:
+    """Test class for CompiledEventValidator"""
+
+    @pytest.fixture
+    def schema(self) -> EventSchema:
+        """Fixture for Schema class example"""
+        return SchemaBuilder(
+            config=examples.EXAMPLE_SCHEMA
+        ).construct()
+
+    @pytest.fixture
+    def event_validator(self, schema: EventSchema) -> CompiledEventValidator:
+        """Fixture for CompiledEventValidator class example"""
+        return CompiledEventValidator(
+            schema=schema
+        )
+
+    def test_schema_setter_should_throws_exception(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `schema` setter raises InvalidSchemaObject error"""
+        with pytest.raises(InvalidSchemaObject):
+            event_validator.schema = 'INVALID_SCHEMA_OBJECT'
+
+    def test_checks_property_should_works_as_expected(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `checks` property holds one check per schema field"""
+        assert len(event_validator.checks) == 8
+
+    def test_is_valid_should_works_as_expected(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `is_valid` method accepts a valid event"""
+        assert event_validator.is_valid(
+            event=copy.deepcopy(examples.EXAMPLE_EVENT)
+        )
+
+    def test_is_valid_should_ignore_key_order(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `is_valid` method does not depend on key order"""
+        event = dict(reversed(list(examples.EXAMPLE_EVENT.items())))
+
+        assert event_validator.is_valid(event=event)
+
+    @pytest.mark.parametrize('mutation', [
+        lambda event: event.pop('age'),
+        lambda event: event.update(extra='field'),
+        lambda event: event.update(age='32'),
+        lambda event: event['address'].pop('street'),
+        lambda event: event['address'].update(mailAddress=1),
+        lambda event: event.update(address='St. Blue'),
+    ])
+    def test_is_valid_should_reject_invalid_events(
+        self, event_validator: CompiledEventValidator, mutation
+    ) -> None:
+        """Asserts that `is_valid` method rejects invalid events"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        mutation(event)
+
+        assert not event_validator.is_valid(event=event)
+
+    def test_is_valid_should_agree_with_event_validator(
+        self, event_validator: CompiledEventValidator, schema: EventSchema
+    ) -> None:
+        """Asserts that `is_valid` method agrees with the reference implementation"""
+        reference = EventValidator(schema=schema)
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        event['address']['number'] = 'three'
+
+        for candidate in [examples.EXAMPLE_EVENT, event]:
+            assert event_validator.is_valid(event=candidate) == reference.is_valid(
+                event=EventBuilder(config=candidate).construct()
+            )
+
+
+class TestCompiledEventValidatorValidate:
+    """Test class for `CompiledEventValidator.validate`"""
+
+    @pytest.fixture
+    def event_validator(self) -> CompiledEventValidator:
+        """Fixture for CompiledEventValidator class example"""
+        return CompiledEventValidator(
+            schema=SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+        )
+
+    @pytest.fixture
+    def invalid_event(self) -> dict:
+        """Fixture for an event with several errors"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        event['age'] = '32'
+        event['extra'] = 'field'
+        event['address'].pop('street')
+
+        return event
+
+    def test_validate_should_works_as_expected(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `validate` method returns no errors for valid events"""
+        result = event_validator.validate(event=examples.EXAMPLE_EVENT)
+
+        assert result.is_valid
+        assert result.errors == []
+
+    def test_validate_should_collect_every_error(
+        self, event_validator: CompiledEventValidator, invalid_event: dict
+    ) -> None:
+        """Asserts that `validate` method collects every error with its path and types"""
+        result = event_validator.validate(event=invalid_event)
+
+        assert result.errors == [
+            FieldError(kind=ErrorKind.EXTRA_KEY, path=('extra',)),
+            FieldError(kind=ErrorKind.TYPE_MISMATCH, path=('age',), expected='integer', actual='string'),
+            FieldError(kind=ErrorKind.MISSING_KEY, path=('address', 'street')),
+        ]
+
+    def test_validate_should_stop_at_first_error_on_fail_fast(
+        self, event_validator: CompiledEventValidator, invalid_event: dict
+    ) -> None:
+        """Asserts that `validate` method only reports the first error when failing fast"""
+        result = event_validator.validate(event=invalid_event, fail_fast=True)
+
+        assert result.errors == [FieldError(kind=ErrorKind.EXTRA_KEY, path=('extra',))]
+
+    def test_validate_should_skip_children_of_mismatched_objects(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `validate` method reports a mismatched object once, without its properties"""
+        result = event_validator.validate(event={**examples.EXAMPLE_EVENT, 'address': 'St. Blue'})
+
+        assert result.errors == [
+            FieldError(kind=ErrorKind.TYPE_MISMATCH, path=('address',), expected='object', actual='string')
+        ]
+
+    def test_validate_should_report_invalid_items_and_non_objects(self) -> None:
+        """Asserts that `validate` method reports invalid array items and events that are not objects"""
+        event_validator = CompiledEventValidator(
+            schema=SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+        )
+
+        result = event_validator.validate(event={**examples.EXAMPLE_ARRAY_EVENT, 'tags': ['new', 1]})
+
+        assert result.errors == [
+            FieldError(kind=ErrorKind.INVALID_ITEMS, path=('tags',), expected='string', actual='integer|string')
+        ]
+        assert event_validator.validate(event=[]).errors[0].kind == ErrorKind.NOT_AN_OBJECT
+
+    @pytest.mark.parametrize('mutation', [
+        lambda event: event.pop('age'),
+        lambda event: event.update(extra='field'),
+        lambda event: event.update(age='32'),
+        lambda event: event['address'].pop('street'),
+        lambda event: event['address'].update(mailAddress=1),
+        lambda event: event.update(address='St. Blue'),
+    ])
+    def test_validate_should_agree_with_is_valid(
+        self, event_validator: CompiledEventValidator, mutation
+    ) -> None:
+        """Asserts that `validate` method agrees with `is_valid` method"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        mutation(event)
+
+        assert event_validator.validate(event=event).is_valid == event_validator.is_valid(event=event)
+
+
+class TestCompiledEventValidatorArrays:
+    """Test class for array items validation on CompiledEventValidator"""
+
+    @pytest.fixture
+    def schema(self) -> EventSchema:
+        """Fixture for Schema with arrays example"""
+        return SchemaBuilder(
+            config=examples.EXAMPLE_ARRAY_SCHEMA
+        ).construct()
+
+    @pytest.fixture
+    def event_validator(self, schema: EventSchema) -> CompiledEventValidator:
+        """Fixture for CompiledEventValidator class example"""
+        return CompiledEventValidator(schema=schema)
+
+    def test_is_valid_should_works_as_expected(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `is_valid` method accepts events with valid array items"""
+        assert event_validator.is_valid(
+            event=copy.deepcopy(examples.EXAMPLE_ARRAY_EVENT)
+        )
+
+    @pytest.mark.parametrize('mutation', [
+        lambda event: event['tags'].append(1),
+        lambda event: event['contacts'].append({'kind': 'email'}),
+        lambda event: event['contacts'][0].update(value=1),
+        lambda event: event['contacts'].append('email'),
+        lambda event: event['matrix'].append(1),
+        lambda event: event['matrix'][0].append('3'),
+    ])
+    def test_is_valid_should_reject_invalid_items(
+        self, event_validator: CompiledEventValidator, mutation
+    ) -> None:
+        """Asserts that `is_valid` method rejects events with invalid array items"""
+        event = copy.deepcopy(examples.EXAMPLE_ARRAY_EVENT)
+        mutation(event)
+
+        assert not event_validator.is_valid(event=event)
+
+    def test_is_valid_should_accept_empty_arrays(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `is_valid` method accepts empty arrays and any items on arrays without items"""
+        event = {**examples.EXAMPLE_ARRAY_EVENT, 'tags': [], 'contacts': [], 'matrix': [[]], 'extra': [{}]}
+
+        assert event_validator.is_valid(event=event)
+
+    def test_is_valid_should_check_nested_object_items(self) -> None:
+        """Asserts that `is_valid` method checks object items holding nested objects"""
+        event = {"orders": [{"id": 1, "item": {"sku": "a"}}, {"id": 2, "item": {"sku": "b"}}]}
+        schema = SchemaBuilder(config=EventBuilder(config=event).construct().json_schema).construct()
+        event_validator = CompiledEventValidator(schema=schema)
+
+        assert event_validator.is_valid(event=event)
+        assert not event_validator.is_valid(event={"orders": [{"id": 1, "item": {"sku": 1}}]})
+
+    def test_is_valid_should_agree_with_event_validator(
+        self, event_validator: CompiledEventValidator, schema: EventSchema
+    ) -> None:
+        """Asserts that `is_valid` method agrees with the reference implementation on arrays"""
+        reference = EventValidator(schema=schema)
+        invalid_event = copy.deepcopy(examples.EXAMPLE_ARRAY_EVENT)
+        invalid_event['tags'].append(1)
+
+        for candidate in [examples.EXAMPLE_ARRAY_EVENT, invalid_event]:
+            assert event_validator.is_valid(event=candidate) == reference.is_valid(
+                event=EventBuilder(config=candidate).construct()
+            )
+
+    @pytest.mark.parametrize('event', [
+        {"a": [{"x": [1]}, {"x": ["s"]}]},
+        {"a": [{"x": ["s"]}, {"x": [1]}]},
+        {"a": [{"x": [1]}, {"x": [1, "s"]}]},
+        {"a": [{"x": []}, {"x": ["s"]}]},
+    ])
+    def test_is_valid_should_agree_on_mixed_nested_items(self, event: dict) -> None:
+        """Asserts that every validator rejects object items whose nested arrays hold other items, in any order"""
+        schema = SchemaBuilder(config=EventBuilder(config={"a": [{"x": [1]}]}).construct().json_schema).construct()
+        reference = EventValidator(schema=schema)
+        cached = ShapeCachedEventValidator(validator=reference)
+
+        assert not CompiledEventValidator(schema=schema).is_valid(event=event)
+        assert not reference.is_valid(event=EventBuilder(config=event).construct())
+        assert not cached.is_valid(event=event)
+        assert cached.is_valid(event={"a": [{"x": []}, {"x": [2]}]})
+
+
+class TestCompiledEventValidatorSchemaMode:
+    """Test class for CompiledEventValidator on `ValidationMode.SCHEMA` mode"""
+
+    @pytest.fixture
+    def raw_schema(self) -> dict:
+        """Fixture for raw schema example, with optional `name` and `address`, and nullable `age` and `street`"""
+        raw_schema = copy.deepcopy(examples.EXAMPLE_SCHEMA)
+        raw_schema['required'] = ['eid', 'documentNumber', 'age']
+        raw_schema['properties']['age']['type'] = ['integer', 'null']
+        raw_schema['properties']['address']['properties']['street']['type'] = ['string', 'null']
+
+        return raw_schema
+
+    @pytest.fixture
+    def event_validator(self, raw_schema: dict) -> CompiledEventValidator:
+        """Fixture for CompiledEventValidator class example"""
+        return CompiledEventValidator(
+            schema=SchemaBuilder(config=raw_schema).construct(),
+            mode=ValidationMode.SCHEMA
+        )
+
+    def test_mode_property_should_works_as_expected(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `mode` property returns the validation mode"""
+        assert event_validator.mode is ValidationMode.SCHEMA
+
+    @pytest.mark.parametrize('mutation', [
+        lambda event: None,
+        lambda event: event.pop('name'),
+        lambda event: event.pop('address'),
+        lambda event: event.update(age=None),
+        lambda event: event['address'].update(street=None),
+    ])
+    def test_is_valid_should_accept_optional_and_null_values(
+        self, event_validator: CompiledEventValidator, mutation
+    ) -> None:
+        """Asserts that `is_valid` method accepts missing optional keys and nulls of nullable fields"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        mutation(event)
+
+        assert event_validator.is_valid(event=event)
+
+    @pytest.mark.parametrize('mutation', [
+        lambda event: event.pop('eid'),
+        lambda event: event.update(name=None),
+        lambda event: event.update(extra='field'),
+        lambda event: event['address'].pop('number'),
+        lambda event: event['address'].update(number=None),
+        lambda event: event.update(age='32'),
+    ])
+    def test_is_valid_should_reject_invalid_events(
+        self, event_validator: CompiledEventValidator, mutation
+    ) -> None:
+        """Asserts that `is_valid` method rejects missing required keys, unknown keys and unexpected nulls"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        mutation(event)
+
+        assert not event_validator.is_valid(event=event)
+
+    def test_validate_should_only_report_required_keys(
+        self, event_validator: CompiledEventValidator
+    ) -> None:
+        """Asserts that `validate` method only reports missing required keys and non nullable nulls"""
+        event = {'documentNumber': '42323235600', 'age': None, 'name': None}
+
+        assert event_validator.validate(event=event).errors == [
+            FieldError(kind=ErrorKind.MISSING_KEY, path=('eid',)),
+            FieldError(kind=ErrorKind.TYPE_MISMATCH, path=('name',), expected='string', actual='null'),
+        ]
+
+    def test_is_valid_should_reject_nulls_on_strict_mode(self, raw_schema: dict) -> None:
+        """Asserts that strict mode keeps requiring every key and rejecting nulls"""
+        event_validator = CompiledEventValidator(schema=SchemaBuilder(config=raw_schema).construct())
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+
+        assert event_validator.is_valid(event=event)
+        assert not event_validator.is_valid(event={**event, 'age': None})
+        assert not event_validator.is_valid(event={key: value for key, value in event.items() if key != 'name'})
+
+    def test_is_valid_should_check_nullable_items(self) -> None:
+        """Asserts that `is_valid` method accepts nulls on arrays of nullable items"""
+        raw_schema = copy.deepcopy(examples.EXAMPLE_ARRAY_SCHEMA)
+        raw_schema['properties']['tags']['items']['type'] = ['string', 'null']
+        event_validator = CompiledEventValidator(
+            schema=SchemaBuilder(config=raw_schema).construct(),
+            mode=ValidationMode.SCHEMA
+        )
+
+        assert event_validator.is_valid(event={**examples.EXAMPLE_ARRAY_EVENT, 'tags': ['new', None]})
+        assert not event_validator.is_valid(event={**examples.EXAMPLE_ARRAY_EVENT, 'tags': ['new', 1]})
+
+
+class TestFingerprintEventValidator:
+    """Test class for FingerprintEventValidator"""
+
+    @pytest.fixture
+    def schema(self) -> EventSchema:
+        """Fixture for Schema class example"""
+        return SchemaBuilder(
+            config=examples.EXAMPLE_SCHEMA
+        ).construct()
+
+    @pytest.fixture
+    def other_schema(self) -> EventSchema:
+        """Fixture for a schema version without address"""
+        raw_schema = copy.deepcopy(examples.EXAMPLE_SCHEMA)
+        raw_schema['properties'].pop('address')
+
+        return SchemaBuilder(config=raw_schema).construct()
+
+    @pytest.fixture
+    def event_validator(self, schema: EventSchema, other_schema: EventSchema) -> FingerprintEventValidator:
+        """Fixture for FingerprintEventValidator class example"""
+        return FingerprintEventValidator(
+            schemas=[schema, other_schema]
+        )
+
+    def test_add_should_throws_exception(
+        self, event_validator: FingerprintEventValidator
+    ) -> None:
+        """Asserts that `add` raises InvalidSchemaObject error"""
+        with pytest.raises(InvalidSchemaObject):
+            event_validator.add(schema='INVALID_SCHEMA_OBJECT')
+
+    def test_match_should_works_as_expected(
+        self,
+        event_validator: FingerprintEventValidator,
+        schema: EventSchema,
+        other_schema: EventSchema
+    ) -> None:
+        """Asserts that `match` finds the schema of each event version"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+
+        assert event_validator.match(event=event) is schema
+
+        event.pop('address')
+
+        assert event_validator.match(event=event) is other_schema
+
+    def test_is_valid_should_works_as_expected(
+        self, event_validator: FingerprintEventValidator
+    ) -> None:
+        """Asserts that `is_valid` rejects events that match no schema"""
+        assert event_validator.is_valid(event=examples.EXAMPLE_EVENT)
+        assert not event_validator.is_valid(event={**examples.EXAMPLE_EVENT, "age": "32"})
+        assert not event_validator.is_valid(event=[])
@@ -0,0 +1,147 @@
+import io
+import sys
+import gzip
+import json
+
+import pytest
+
+from tests.test_data import examples
+
+from itidigital.data_quality import cli
+
+
+def test_main_should_validate_files(tmp_path, capsys):
+    """Asserts that `validate` command splits valid and invalid events"""
+    schema_path = tmp_path / 'schema.json'
+    schema_path.write_text(json.dumps(examples.EXAMPLE_SCHEMA))
+
+    input_path = tmp_path / 'events.ndjson.gz'
+    with gzip.open(input_path, 'wt') as file:
+        file.write(json.dumps(examples.EXAMPLE_EVENT) + '\n')
+        file.write(json.dumps({"foo": "bar"}) + '\n')
+        file.write('not json\n')
+
+    valid_path = tmp_path / 'valid.ndjson.gz'
+    invalid_path = tmp_path / 'invalid.ndjson'
+
+    exit_code = cli.main([
+        'validate',
+        '--schema', str(schema_path),
+        '--input', str(input_path),
+        '--valid-output', str(valid_path),
+        '--invalid-output', str(invalid_path),
+    ])
+
+    with gzip.open(valid_path, 'rt') as file:
+        valid_events = [json.loads(line) for line in file]
+
+    assert exit_code == 0
+    assert valid_events == [examples.EXAMPLE_EVENT]
+    assert invalid_path.read_text() == '{"foo": "bar"}\nnot json\n'
+    assert 'Validated 3 events (1 valid, 2 invalid)' in capsys.readouterr().err
+
+
+def test_main_should_validate_on_schema_mode(tmp_path, capsys):
+    """Asserts that `--mode schema` accepts events missing optional keys"""
+    schema_path = tmp_path / 'schema.json'
+    schema_path.write_text(json.dumps({**examples.EXAMPLE_SCHEMA, "required": ["eid"]}))
+
+    event = {key: value for key, value in examples.EXAMPLE_EVENT.items() if key != 'name'}
+    input_path = tmp_path / 'events.ndjson'
+    input_path.write_text(json.dumps(event) + '\n')
+
+    valid_path = tmp_path / 'valid.ndjson'
+
+    for mode, expected_valid in [('strict', ''), ('schema', json.dumps(event) + '\n')]:
+        cli.main([
+            'validate',
+            '--schema', str(schema_path),
+            '--input', str(input_path),
+            '--valid-output', str(valid_path),
+            '--mode', mode
+        ])
+
+        assert valid_path.read_text() == expected_valid
+
+
+@pytest.fixture
+def schema_path(tmp_path) -> str:
+    """Fixture for a schema file"""
+    path = tmp_path / 'schema.json'
+    path.write_text(json.dumps(examples.EXAMPLE_SCHEMA))
+
+    return str(path)
+
+
+@pytest.fixture
+def events() -> list:
+    """Fixture for three valid events and two invalid ones"""
+    return [examples.EXAMPLE_EVENT] * 3 + [{"foo": "bar"}] * 2
+
+
+def _write_input(tmp_path, kind: str, events: list) -> str:
+    """Writes events as a JSON array, gzipped newline-delimited JSON or standard input"""
+    if kind == 'array':
+        path = tmp_path / 'events.json'
+        path.write_text('\n  ' + json.dumps(events))
+        return str(path)
+
+    if kind == 'gzip':
+        path = tmp_path / 'events.ndjson.gz'
+        with gzip.open(path, 'wt') as file:
+            file.write(''.join(json.dumps(event) + '\n' for event in events))
+        return str(path)
+
+    return '-'
+
+
+@pytest.mark.parametrize('kind', ['array', 'gzip', 'stdin'])
+def test_main_should_validate_unsplittable_inputs_sequentially(
+    tmp_path, capsys, monkeypatch, schema_path: str, events: list, kind: str
+):
+    """Asserts that inputs that can not be split are validated sequentially when using multiple workers"""
+    input_path = _write_input(tmp_path, kind, events)
+    stdin = io.BytesIO(''.join(json.dumps(event) + '\n' for event in events).encode())
+    monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(stdin))
+    valid_path = tmp_path / 'valid.ndjson'
+
+    exit_code = cli.main([
+        'validate',
+        '--schema', schema_path,
+        '--input', input_path,
+        '--valid-output', str(valid_path),
+        '--workers', '2'
+    ])
+
+    err = capsys.readouterr().err
+
+    assert exit_code == 0
+    assert 'validating sequentially' in err
+    assert 'Validated 5 events (3 valid, 2 invalid)' in err
+    assert [json.loads(line) for line in valid_path.read_text().splitlines()] == [examples.EXAMPLE_EVENT] * 3
+
+
+@pytest.mark.parametrize('content, offset', [
+    ('[{"foo": "bar"}, {"foo" "bar"}]', 17),
+    ('[{"foo": "bar"}, {"foo"', 17),
+    ('[{"foo": "bar"}', 15),
+])
+def test_main_should_report_malformed_arrays(tmp_path, capsys, schema_path: str, content: str, offset: int):
+    """Asserts that a malformed JSON array stops validation with its offset, a summary and a non-zero exit code"""
+    input_path = tmp_path / 'events.json'
+    input_path.write_text(content)
+    invalid_path = tmp_path / 'invalid.ndjson'
+
+    exit_code = cli.main([
+        'validate',
+        '--schema', schema_path,
+        '--input', str(input_path),
+        '--invalid-output', str(invalid_path)
+    ])
+
+    err = capsys.readouterr().err
+
+    assert exit_code == 1
+    assert f'at character {offset}' in err
+    assert 'Validated 1 events (0 valid, 1 invalid)' in err
+    assert invalid_path.read_text() == '{"foo": "bar"}\n'
@@ -0,0 +1,154 @@
+import copy
+import json
+import asyncio
+
+import boto3
+import mock
+import pytest
+from moto import mock_sqs
+
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality.consumer import AsyncEventConsumer
+from itidigital.data_quality.event.result import ErrorKind
+from itidigital.data_quality.event.validator import CompiledEventValidator
+
+from tests.test_data import examples
+
+
+@pytest.fixture
+def sqs_client():
+    """Fixture for a mocked SQS client with input, valid and invalid events queues"""
+    with mock_sqs():
+        sqs_client = boto3.client('sqs', region_name='us-east-1')
+
+        for queue_name in ['input-queue', 'valid-events-queue', 'invalid-events-queue']:
+            sqs_client.create_queue(QueueName=queue_name)
+
+        yield sqs_client
+
+
+@pytest.fixture
+def consumer(sqs_client) -> AsyncEventConsumer:
+    """Fixture for a consumer that does not wait on empty polls"""
+    # moto may hand the same message to concurrent receives, so counts are only exact with one poller
+    return AsyncEventConsumer(
+        sqs_client=sqs_client,
+        input_queue_name='input-queue',
+        validator=CompiledEventValidator(schema=SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()),
+        pollers=1,
+        workers=2,
+        max_pending_batches=1,
+        wait_time_seconds=0
+    )
+
+
+def _queue_url(sqs_client, queue_name: str) -> str:
+    """Gets a queue URL"""
+    return sqs_client.get_queue_url(QueueName=queue_name)['QueueUrl']
+
+
+def _send(sqs_client, bodies: list) -> None:
+    """Sends message bodies to the input queue"""
+    queue_url = _queue_url(sqs_client, 'input-queue')
+
+    for body in bodies:
+        sqs_client.send_message(QueueUrl=queue_url, MessageBody=body)
+
+
+def _count_messages(sqs_client, queue_name: str) -> dict:
+    """Gets the number of visible and in flight messages of a queue"""
+    attributes = sqs_client.get_queue_attributes(
+        QueueUrl=_queue_url(sqs_client, queue_name),
+        AttributeNames=['ApproximateNumberOfMessages', 'ApproximateNumberOfMessagesNotVisible']
+    )['Attributes']
+
+    return {
+        'visible': int(attributes['ApproximateNumberOfMessages']),
+        'in_flight': int(attributes['ApproximateNumberOfMessagesNotVisible'])
+    }
+
+
+class TestAsyncEventConsumer:
+    """Test class for `AsyncEventConsumer`"""
+
+    @pytest.fixture
+    def invalid_event(self) -> dict:
+        """Fixture for an event that does not match the schema"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        event['age'] = 'thirty two'
+
+        return event
+
+    def test_run_should_route_and_delete_messages(
+        self, consumer: AsyncEventConsumer, sqs_client, invalid_event: dict
+    ) -> None:
+        """Asserts that events, and messages that are not JSON, are routed to their queues and deleted"""
+        _send(sqs_client, [json.dumps(examples.EXAMPLE_EVENT)] * 25 + [json.dumps(invalid_event)] * 5 + ['{nope'])
+
+        stats = asyncio.run(consumer.run(stop_when_empty=True))
+
+        assert (stats.received, stats.valid, stats.invalid, stats.failed, stats.deleted) == (31, 25, 6, 0, 31)
+        assert stats.errors == {ErrorKind.TYPE_MISMATCH: 5, ErrorKind.INVALID_JSON: 1}
+        assert _count_messages(sqs_client, 'valid-events-queue')['visible'] == 25
+        assert _count_messages(sqs_client, 'invalid-events-queue')['visible'] == 6
+        assert _count_messages(sqs_client, 'input-queue') == {'visible': 0, 'in_flight': 0}
+
+    def test_run_should_send_messages_that_are_not_json_as_they_are(
+        self, consumer: AsyncEventConsumer, sqs_client
+    ) -> None:
+        """Asserts that messages that are not JSON reach the invalid events queue unchanged, with their error"""
+        _send(sqs_client, ['{nope'])
+
+        asyncio.run(consumer.run(stop_when_empty=True))
+
+        queue_url = sqs_client.get_queue_url(QueueName='invalid-events-queue')['QueueUrl']
+        message, = sqs_client.receive_message(QueueUrl=queue_url, MessageAttributeNames=['All'])['Messages']
+
+        assert message['Body'] == '{nope'
+        assert message['MessageAttributes']['error_kinds']['StringValue'] == 'invalid_json'
+
+    def test_run_should_stop_after_max_messages(self, consumer: AsyncEventConsumer, sqs_client) -> None:
+        """Asserts that receiving stops once `max_messages` messages were received"""
+        _send(sqs_client, [json.dumps(examples.EXAMPLE_EVENT)] * 50)
+
+        stats = asyncio.run(consumer.run(max_messages=10))
+
+        assert 10 <= stats.received < 50
+        assert stats.deleted == stats.valid == stats.received
+
+    def test_run_should_keep_failed_sends(self, consumer: AsyncEventConsumer, sqs_client) -> None:
+        """Asserts that messages whose events SQS rejected are not deleted"""
+        _send(sqs_client, [json.dumps(examples.EXAMPLE_EVENT)] * 3)
+
+        with mock.patch(
+            'itidigital.data_quality.router.sqs.send_message_batch',
+            return_value=[{'Id': '0', 'Code': 'InternalError', 'Message': 'boom'}]
+        ):
+            stats = asyncio.run(consumer.run(stop_when_empty=True))
+
+        assert (stats.valid, stats.failed, stats.deleted) == (2, 1, 2)
+        assert _count_messages(sqs_client, 'input-queue') == {'visible': 0, 'in_flight': 1}
+
+    def test_run_should_keep_batches_that_fail(self, consumer: AsyncEventConsumer, sqs_client) -> None:
+        """Asserts that batches whose events can not be sent are not deleted, and the consumer still returns"""
+        _send(sqs_client, [json.dumps(examples.EXAMPLE_EVENT)] * 25)
+
+        with mock.patch.object(consumer, '_valid_queue_name', 'missing-queue'):
+            stats = asyncio.run(asyncio.wait_for(consumer.run(stop_when_empty=True), timeout=30))
+
+        assert (stats.received, stats.valid, stats.failed, stats.deleted) == (25, 0, 25, 0)
+        assert _count_messages(sqs_client, 'input-queue') == {'visible': 0, 'in_flight': 25}
+
+    def test_run_should_stop_when_event_is_set(self, consumer: AsyncEventConsumer) -> None:
+        """Asserts that a set `stop` event stops the consumer"""
+        async def run():
+            stop = asyncio.Event()
+            stop.set()
+            return await consumer.run(stop=stop)
+
+        assert asyncio.run(run()).received == 0
+
+    def test_init_should_reject_invalid_concurrency(self, sqs_client) -> None:
+        """Asserts that pollers, workers and pending batches must be positive"""
+        with pytest.raises(ValueError):
+            AsyncEventConsumer(sqs_client=sqs_client, input_queue_name='input-queue', validator=None, workers=0)
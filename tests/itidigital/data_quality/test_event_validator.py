@@ -0,0 +1,238 @@
+import copy
+import json
+import base64
+
+import boto3
+import mock
+import pytest
+from moto import mock_sqs
+
+import itidigital.data_quality.event_validator as event_validator
+from itidigital.data_quality.event.exceptions import EventNotSentError
+
+from tests.test_data import examples
+
+
+def _receive_messages(sqs_client, queue_url: str) -> list:
+    """Drains a queue and returns all messages with their attributes"""
+    received = []
+
+    while True:
+        messages = sqs_client.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=10,
+            MessageAttributeNames=['All']
+        ).get('Messages', [])
+
+        if not messages:
+            return received
+
+        received.extend(messages)
+
+
+def _receive_all(sqs_client, queue_url: str) -> list:
+    """Drains a queue and returns all message bodies as dictionaries"""
+    return [json.loads(message['Body']) for message in _receive_messages(sqs_client, queue_url)]
+
+
+@pytest.fixture
+def sqs_client():
+    """Fixture for a mocked SQS client with the valid and invalid events queues"""
+    with mock_sqs():
+        sqs_client = boto3.client('sqs', region_name='us-east-1')
+        sqs_client.create_queue(QueueName='valid-events-queue')
+        sqs_client.create_queue(QueueName='invalid-events-queue')
+
+        event_validator._SQS_CLIENT = sqs_client
+        event_validator._QUEUE_URLS.invalidate()
+
+        yield sqs_client
+
+        event_validator._SQS_CLIENT = None
+        event_validator._QUEUE_URLS.invalidate()
+
+
+@pytest.fixture
+def queue_url(sqs_client) -> str:
+    """Fixture for the valid events queue URL"""
+    return sqs_client.get_queue_url(QueueName='valid-events-queue')['QueueUrl']
+
+
+@pytest.fixture
+def invalid_queue_url(sqs_client) -> str:
+    """Fixture for the invalid events queue URL"""
+    return sqs_client.get_queue_url(QueueName='invalid-events-queue')['QueueUrl']
+
+
+@pytest.fixture
+def invalid_event() -> dict:
+    """Fixture for an event that does not match the schema"""
+    event = copy.deepcopy(examples.EXAMPLE_EVENT)
+    event['age'] = 'thirty two'
+
+    return event
+
+
+class TestSendEventToQueue:
+    """Test class for `send_event_to_queue`"""
+
+    def test_get_sqs_client_should_create_client_once(self) -> None:
+        """Asserts that `get_sqs_client` reuses the process client"""
+        event_validator._SQS_CLIENT = None
+
+        try:
+            assert event_validator.get_sqs_client() is event_validator.get_sqs_client()
+
+        finally:
+            event_validator._SQS_CLIENT = None
+
+    def test_send_event_to_queue_should_resolve_queue_url_once(
+        self, sqs_client, queue_url: str
+    ) -> None:
+        """Asserts that `send_event_to_queue` caches the queue URL"""
+        with mock.patch.object(
+            target=sqs_client,
+            attribute='get_queue_url',
+            wraps=sqs_client.get_queue_url
+        ) as get_queue_url_mock:
+            for _ in range(3):
+                event_validator.send_event_to_queue(
+                    event=examples.EXAMPLE_EVENT,
+                    queue_name='valid-events-queue'
+                )
+
+        assert get_queue_url_mock.call_count == 1
+        assert _receive_all(sqs_client, queue_url) == [examples.EXAMPLE_EVENT] * 3
+
+
+class TestHandler:
+    """Test class for `handler`"""
+
+    def test_handler_should_send_valid_event(
+        self, sqs_client, queue_url: str, invalid_queue_url: str
+    ) -> None:
+        """Asserts that a valid event is sent to the valid events queue"""
+        event_validator.handler(examples.EXAMPLE_EVENT)
+
+        assert _receive_all(sqs_client, queue_url) == [examples.EXAMPLE_EVENT]
+        assert _receive_all(sqs_client, invalid_queue_url) == []
+
+    def test_handler_should_send_invalid_event_with_errors(
+        self, sqs_client, queue_url: str, invalid_queue_url: str, invalid_event: dict
+    ) -> None:
+        """Asserts that an invalid event is sent to the invalid events queue with its errors"""
+        event_validator.handler(invalid_event)
+
+        messages = _receive_messages(sqs_client, invalid_queue_url)
+
+        assert _receive_all(sqs_client, queue_url) == []
+        assert [json.loads(message['Body']) for message in messages] == [invalid_event]
+        assert messages[0]['MessageAttributes'] == {
+            'error_count': {'DataType': 'Number', 'StringValue': '1'},
+            'error_kinds': {'DataType': 'String', 'StringValue': 'type_mismatch'},
+            'errors': {'DataType': 'String', 'StringValue': 'type_mismatch at age: expected integer, got string'}
+        }
+
+    def test_handler_should_raise_for_rejected_event(self, sqs_client) -> None:
+        """Asserts that an event rejected by SQS raises an error, so that it is retried"""
+        with mock.patch.object(
+            target=event_validator.sqs,
+            attribute='send_message_batch',
+            return_value=[{'Id': '0', 'Code': 'InternalError', 'Message': 'boom'}]
+        ), pytest.raises(EventNotSentError):
+            event_validator.handler(examples.EXAMPLE_EVENT)
+
+
+class TestHandleBatch:
+    """Test class for `handle_batch`"""
+
+    def test_handle_batch_should_route_events(
+        self, sqs_client, queue_url: str, invalid_queue_url: str, invalid_event: dict, capsys
+    ) -> None:
+        """Asserts that valid and invalid events of a list are sent to their queues"""
+        events = [examples.EXAMPLE_EVENT] * 12 + [invalid_event]
+
+        with mock.patch.object(
+            target=sqs_client,
+            attribute='send_message_batch',
+            wraps=sqs_client.send_message_batch
+        ) as send_message_batch_mock:
+            response = event_validator.handle_batch(events)
+
+        assert response == {"batchItemFailures": []}
+        assert send_message_batch_mock.call_count == 3
+        assert 'Validated 13 events (12 valid, 1 invalid): type_mismatch 1' in capsys.readouterr().out
+        assert _receive_all(sqs_client, queue_url) == [examples.EXAMPLE_EVENT] * 12
+        assert _receive_all(sqs_client, invalid_queue_url) == [invalid_event]
+
+    def test_handle_batch_should_accept_sqs_records(
+        self, sqs_client, queue_url: str, invalid_queue_url: str, invalid_event: dict
+    ) -> None:
+        """Asserts that SQS lambda events are decoded and malformed messages are reported"""
+        events = {
+            "Records": [
+                {"messageId": "valid", "body": json.dumps(examples.EXAMPLE_EVENT)},
+                {"messageId": "invalid", "body": json.dumps(invalid_event)},
+                {"messageId": "malformed", "body": "{not json"},
+            ]
+        }
+
+        response = event_validator.handle_batch(events)
+
+        assert response == {"batchItemFailures": [{"itemIdentifier": "malformed"}]}
+        assert _receive_all(sqs_client, queue_url) == [examples.EXAMPLE_EVENT]
+        assert _receive_all(sqs_client, invalid_queue_url) == [invalid_event]
+
+    def test_handle_batch_should_accept_kinesis_records(
+        self, sqs_client, queue_url: str
+    ) -> None:
+        """Asserts that Kinesis lambda events are decoded"""
+        data = base64.b64encode(json.dumps(examples.EXAMPLE_EVENT).encode()).decode()
+        events = {
+            "Records": [
+                {"kinesis": {"sequenceNumber": "1", "data": data}},
+                {"kinesis": {"sequenceNumber": "2", "data": "%%%"}},
+            ]
+        }
+
+        response = event_validator.handle_batch(events)
+
+        assert response == {"batchItemFailures": [{"itemIdentifier": "2"}]}
+        assert _receive_all(sqs_client, queue_url) == [examples.EXAMPLE_EVENT]
+
+    def test_handle_batch_should_report_failed_sends(
+        self, sqs_client, queue_url: str
+    ) -> None:
+        """Asserts that events rejected by SQS are reported as failures"""
+        events = {
+            "Records": [
+                {"messageId": f"message-{index}", "body": json.dumps(examples.EXAMPLE_EVENT)}
+                for index in range(3)
+            ]
+        }
+
+        with mock.patch.object(
+            target=event_validator.sqs,
+            attribute='send_message_batch',
+            return_value=[{'Id': '1', 'Code': 'InternalError', 'Message': 'boom'}]
+        ):
+            response = event_validator.handle_batch(events)
+
+        assert response == {"batchItemFailures": [{"itemIdentifier": "message-1"}]}
+
+    def test_handle_batch_should_dispatch_to_schema_directory(
+        self, sqs_client, queue_url: str, invalid_queue_url: str, tmp_path, monkeypatch
+    ) -> None:
+        """Asserts that events are validated by the schemas of `SCHEMA_DIRECTORY` when it is set"""
+        (tmp_path / 'example.json').write_text(json.dumps(examples.EXAMPLE_SCHEMA))
+        (tmp_path / 'array.json').write_text(json.dumps(examples.EXAMPLE_ARRAY_SCHEMA))
+        monkeypatch.setattr(event_validator, '_SCHEMA_DIRECTORY', str(tmp_path))
+        monkeypatch.setattr(event_validator, '_SCHEMAS', None)
+
+        response = event_validator.handle_batch(
+            [examples.EXAMPLE_EVENT, examples.EXAMPLE_ARRAY_EVENT, {"foo": "bar"}]
+        )
+
+        assert response == {"batchItemFailures": []}
+        assert _receive_all(sqs_client, queue_url) == [examples.EXAMPLE_EVENT, examples.EXAMPLE_ARRAY_EVENT]
+        assert _receive_all(sqs_client, invalid_queue_url) == [{"foo": "bar"}]
@@ -0,0 +1,97 @@
+import io
+import json
+
+import pytest
+
+from tests.test_data import examples
+
+from itidigital.data_quality.parallel import ParallelEventValidator, is_splittable, split_file
+
+
+@pytest.fixture
+def events() -> list:
+    """Fixture for a mix of valid and invalid events"""
+    return [
+        {**examples.EXAMPLE_EVENT, "age": index} if index % 3 else {"index": index}
+        for index in range(60)
+    ]
+
+
+@pytest.fixture
+def input_path(tmp_path, events: list) -> str:
+    """Fixture for a newline-delimited JSON file"""
+    path = tmp_path / 'events.ndjson'
+    path.write_text(''.join(json.dumps(event) + '\n' for event in events))
+
+    return str(path)
+
+
+def test_split_file_should_align_ranges_to_newlines(input_path: str):
+    """Asserts that `split_file` covers the whole file with ranges ending on newlines"""
+    ranges = split_file(path=input_path, chunk_size=500)
+
+    with open(input_path, 'rb') as file:
+        content = file.read()
+
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(content)
+    assert all(previous[1] == current[0] for previous, current in zip(ranges, ranges[1:]))
+    assert all(content[end - 1:end] == b'\n' for _, end in ranges)
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_validate_file_should_works_as_expected(input_path: str, events: list, ordered: bool):
+    """Asserts that `validate_file` splits valid and invalid events"""
+    validator = ParallelEventValidator(
+        raw_schema=examples.EXAMPLE_SCHEMA,
+        max_workers=2,
+        chunk_size=500
+    )
+    valid_output, invalid_output = io.BytesIO(), io.BytesIO()
+
+    stats = validator.validate_file(
+        input_path=input_path,
+        valid_output=valid_output,
+        invalid_output=invalid_output,
+        ordered=ordered
+    )
+
+    valid_events = [json.loads(line) for line in valid_output.getvalue().splitlines()]
+    invalid_events = [json.loads(line) for line in invalid_output.getvalue().splitlines()]
+
+    assert (stats.valid, stats.invalid) == (40, 20)
+    if ordered:
+        assert valid_events == [event for event in events if 'eid' in event]
+    else:
+        assert sorted(event['age'] for event in valid_events) == [e['age'] for e in events if 'eid' in e]
+    assert len(invalid_events) == 20
+
+
+def test_validate_file_should_raise_exception_for_gzip_files():
+    """Asserts that `validate_file` rejects gzip files"""
+    validator = ParallelEventValidator(raw_schema=examples.EXAMPLE_SCHEMA)
+
+    with pytest.raises(ValueError):
+        validator.validate_file(input_path='events.ndjson.gz')
+
+
+def test_validate_file_should_raise_for_json_arrays(tmp_path, events: list):
+    """Asserts that JSON array files are not split as if they were newline-delimited JSON"""
+    path = tmp_path / 'events.json'
+    path.write_text('  \n' + json.dumps(events))
+
+    assert not is_splittable(str(path))
+
+    with pytest.raises(ValueError):
+        ParallelEventValidator(raw_schema=examples.EXAMPLE_SCHEMA, max_workers=2).validate_file(str(path))
+
+
+@pytest.mark.parametrize('path, expected', [('-', False), ('events.ndjson.gz', False)])
+def test_is_splittable_should_reject_streams_and_gzip(path: str, expected: bool):
+    """Asserts that standard input and gzip files can not be split"""
+    assert is_splittable(path) is expected
+
+
+def test_is_splittable_should_accept_ndjson(input_path: str):
+    """Asserts that newline-delimited JSON files can be split"""
+    assert is_splittable(input_path)
@@ -0,0 +1,167 @@
+import json
+
+import boto3
+import mock
+import pytest
+from moto import mock_sqs
+from botocore.exceptions import ClientError
+
+from itidigital.data_quality.router import EventRouter, error_attributes, route_event
+from itidigital.data_quality.event.result import ErrorKind, FieldError, ValidationResult
+
+
+@pytest.fixture
+def sqs_client():
+    """Fixture for a mocked SQS client with a queue"""
+    with mock_sqs():
+        sqs_client = boto3.client('sqs', region_name='us-east-1')
+        sqs_client.create_queue(QueueName='my-queue')
+
+        yield sqs_client
+
+
+@pytest.fixture
+def queue_url(sqs_client) -> str:
+    """Fixture for the queue URL"""
+    return sqs_client.get_queue_url(QueueName='my-queue')['QueueUrl']
+
+
+@pytest.fixture
+def now() -> list:
+    """Fixture for a controllable clock value"""
+    return [0.0]
+
+
+@pytest.fixture
+def router(sqs_client, now: list) -> EventRouter:
+    """Fixture for a router with a controllable clock"""
+    return EventRouter(sqs_client=sqs_client, max_delay=5.0, clock=lambda: now[0])
+
+
+def _count_messages(sqs_client, queue_url: str) -> int:
+    """Gets the number of messages on a queue"""
+    attributes = sqs_client.get_queue_attributes(
+        QueueUrl=queue_url,
+        AttributeNames=['ApproximateNumberOfMessages']
+    )['Attributes']
+
+    return int(attributes['ApproximateNumberOfMessages'])
+
+
+def test_error_attributes_should_works_as_expected():
+    """Asserts that `error_attributes` summarizes validation errors"""
+    result = ValidationResult(errors=[
+        FieldError(kind=ErrorKind.TYPE_MISMATCH, path=('age',), expected='integer', actual='string'),
+        FieldError(kind=ErrorKind.MISSING_KEY, path=('name',))
+    ])
+
+    assert error_attributes(result) == {
+        'error_count': {'DataType': 'Number', 'StringValue': '2'},
+        'error_kinds': {'DataType': 'String', 'StringValue': 'missing_key,type_mismatch'},
+        'errors': {
+            'DataType': 'String',
+            'StringValue': 'type_mismatch at age: expected integer, got string; missing_key at name'
+        }
+    }
+
+
+class TestEventRouter:
+    """Test class for `EventRouter`"""
+
+    def test_route_should_flush_full_buffers(self, router: EventRouter, sqs_client, queue_url: str) -> None:
+        """Asserts that a buffer is sent as soon as it holds 10 events"""
+        for index in range(12):
+            router.route(queue_name='my-queue', event={'index': index}, identifier=str(index))
+
+        assert _count_messages(sqs_client, queue_url) == 10
+        assert router.pending('my-queue') == 2
+
+    def test_route_should_flush_by_size(self, sqs_client, queue_url: str) -> None:
+        """Asserts that a buffer is sent before its payload gets too large"""
+        router = EventRouter(sqs_client=sqs_client, max_bytes=100)
+
+        for index in range(3):
+            router.route(queue_name='my-queue', event={'payload': 'x' * 40}, identifier=str(index))
+
+        assert _count_messages(sqs_client, queue_url) == 2
+        assert router.pending() == 1
+
+    def test_route_should_flush_expired_buffers(
+        self, router: EventRouter, sqs_client, queue_url: str, now: list
+    ) -> None:
+        """Asserts that a buffer is sent once its oldest event waited `max_delay` seconds"""
+        router.route(queue_name='my-queue', event={'index': 0}, identifier='0')
+        now[0] = 4.0
+        router.flush_expired()
+
+        assert router.pending() == 1
+
+        now[0] = 5.0
+        router.flush_expired()
+
+        assert router.pending() == 0
+        assert _count_messages(sqs_client, queue_url) == 1
+
+    def test_flush_should_send_every_queue(self, sqs_client, router: EventRouter) -> None:
+        """Asserts that `flush` sends the buffers of every queue, with their attributes"""
+        other_queue_url = sqs_client.create_queue(QueueName='other-queue')['QueueUrl']
+        attributes = {'reason': {'DataType': 'String', 'StringValue': 'test'}}
+
+        with router:
+            router.route(queue_name='my-queue', event={'index': 0}, identifier='0')
+            router.route(queue_name='other-queue', event={'index': 1}, identifier='1', attributes=attributes)
+
+        message, = sqs_client.receive_message(
+            QueueUrl=other_queue_url,
+            MessageAttributeNames=['All']
+        )['Messages']
+
+        assert router.pending() == 0
+        assert json.loads(message['Body']) == {'index': 1}
+        assert message['MessageAttributes'] == attributes
+
+    def test_flush_should_report_failed_events(self, router: EventRouter) -> None:
+        """Asserts that `flush` reports the identifiers of rejected events once"""
+        with mock.patch(
+            'itidigital.data_quality.router.sqs.send_message_batch',
+            return_value=[{'Id': '2', 'Code': 'InternalError', 'Message': 'boom'}]
+        ):
+            for identifier in ['a', 'b', 'c']:
+                router.route(queue_name='my-queue', event={}, identifier=identifier)
+
+            assert router.flush() == ['c']
+            assert router.flush() == []
+
+    def test_flush_should_report_events_of_failed_calls(self, router: EventRouter) -> None:
+        """Asserts that events of a `send_message_batch` call that raised are reported instead of lost"""
+        error = ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'boom'}}, 'SendMessageBatch')
+
+        with mock.patch('itidigital.data_quality.router.sqs.send_message_batch', side_effect=error):
+            for identifier in ['a', 'b']:
+                router.route(queue_name='my-queue', event={}, identifier=identifier)
+
+            assert router.flush() == ['a', 'b']
+
+        assert router.pending() == 0
+
+    def test_init_should_reject_invalid_max_entries(self, sqs_client) -> None:
+        """Asserts that batches can not be larger than SQS allows"""
+        with pytest.raises(ValueError):
+            EventRouter(sqs_client=sqs_client, max_entries=11)
+
+
+def test_route_event_should_collect_errors_of_invalid_events_only(router: EventRouter) -> None:
+    """Asserts that `route_event` checks events with `is_valid`, and collects errors only for invalid ones"""
+    validator = mock.Mock()
+    validator.is_valid.side_effect = [True, False]
+    validator.validate.return_value = ValidationResult(errors=[FieldError(kind=ErrorKind.MISSING_KEY, path=('a',))])
+
+    with mock.patch.object(router, 'route') as route_mock:
+        assert route_event(router, validator, 'a', {}, valid_queue_name='valid', invalid_queue_name='invalid')
+        validator.validate.assert_not_called()
+
+        assert not route_event(router, validator, 'b', {}, valid_queue_name='valid', invalid_queue_name='invalid')
+
+    validator.validate.assert_called_once_with(event={}, fail_fast=False)
+    assert route_mock.call_args.kwargs['queue_name'] == 'invalid'
+    assert route_mock.call_args.kwargs['attributes']['error_kinds']['StringValue'] == 'missing_key'
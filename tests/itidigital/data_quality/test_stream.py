@@ -0,0 +1,110 @@
+import io
+import gzip
+import json
+
+import pytest
+
+from tests.test_data import examples
+
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.data_quality import stream
+from itidigital.data_quality.event.exceptions import InvalidJsonArray
+from itidigital.data_quality.event.validator import CompiledEventValidator
+
+
+@pytest.fixture
+def validator() -> CompiledEventValidator:
+    """Fixture for CompiledEventValidator class example"""
+    return CompiledEventValidator(
+        schema=SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+    )
+
+
+def test_iter_ndjson_should_works_as_expected():
+    """Asserts that `iter_ndjson` yields one record per non-blank line"""
+    content = b'{"foo": "bar"}\n\n  [1, 2]\nnot json\n'
+
+    records = list(stream.iter_ndjson(io.BytesIO(content)))
+
+    assert records == [
+        stream.Record(raw=b'{"foo": "bar"}', event={"foo": "bar"}),
+        stream.Record(raw=b'[1, 2]', event=None),
+        stream.Record(raw=b'not json', event=None),
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1024])
+def test_iter_json_array_should_works_as_expected(chunk_size: int):
+    """Asserts that `iter_json_array` yields array elements across chunk boundaries"""
+    content = b' [ {"foo": "b\\u00e1r"}, 12345 ,{"a": {"b": [1, 2]}}, true ] '
+
+    records = list(stream.iter_json_array(io.BytesIO(content), chunk_size=chunk_size))
+
+    assert [record.event for record in records] == [{"foo": "bár"}, None, {"a": {"b": [1, 2]}}, None]
+    assert records[1].raw == b'12345'
+
+
+def test_iter_json_array_should_raise_exception_for_unterminated_arrays():
+    """Asserts that `iter_json_array` rejects truncated input"""
+    with pytest.raises(ValueError):
+        list(stream.iter_json_array(io.BytesIO(b'[{"foo": "bar"}, {"foo"'), chunk_size=4))
+
+
+def test_iter_json_array_should_report_offset_of_malformed_elements():
+    """Asserts that `iter_json_array` reports where a malformed element starts, across chunks"""
+    records = stream.iter_json_array(io.BytesIO(b'[1, 2, {"foo": bar}]'), chunk_size=3)
+
+    with pytest.raises(InvalidJsonArray) as error:
+        list(records)
+
+    assert error.value.offset == 7
+
+
+def test_iter_records_should_detect_input_format():
+    """Asserts that `iter_records` reads both JSON arrays and NDJSON"""
+    array = io.BytesIO(b'\n[{"foo": 1}, {"foo": 2}]')
+    ndjson = io.BytesIO(b'{"foo": 1}\n{"foo": 2}\n')
+
+    assert len(list(stream.iter_records(array))) == 2
+    assert len(list(stream.iter_records(ndjson))) == 2
+
+
+def test_validate_records_should_works_as_expected(validator: CompiledEventValidator):
+    """Asserts that `validate_records` flags records and counts them"""
+    records = [
+        stream.Record(raw=b'', event=examples.EXAMPLE_EVENT),
+        stream.Record(raw=b'', event={"foo": "bar"}),
+        stream.Record(raw=b'', event=None),
+    ]
+    stats = stream.StreamStats()
+
+    results = list(stream.validate_records(records, validator=validator, stats=stats))
+
+    assert [valid for valid, _ in results] == [True, False, False]
+    assert (stats.valid, stats.invalid, stats.total) == (1, 2, 3)
+
+
+def test_write_records_should_split_outputs():
+    """Asserts that `write_records` writes valid and invalid records separately"""
+    valid_output, invalid_output = io.BytesIO(), io.BytesIO()
+    results = [
+        (True, stream.Record(raw=b'{"a": 1}', event={"a": 1})),
+        (False, stream.Record(raw=b'oops', event=None)),
+    ]
+
+    stream.write_records(results, valid_output=valid_output, invalid_output=invalid_output)
+
+    assert valid_output.getvalue() == b'{"a": 1}\n'
+    assert invalid_output.getvalue() == b'oops\n'
+
+
+def test_open_input_should_read_gzip_files(tmp_path):
+    """Asserts that `open_input` decompresses `.gz` files"""
+    path = str(tmp_path / 'events.ndjson.gz')
+    with gzip.open(path, 'wb') as file:
+        file.write(json.dumps(examples.EXAMPLE_EVENT).encode() + b'\n')
+
+    with stream.open_input(path) as file:
+        records = list(stream.iter_records(file))
+
+    assert records[0].event == examples.EXAMPLE_EVENT
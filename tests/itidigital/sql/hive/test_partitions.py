@@ -0,0 +1,87 @@
+import pytest
+
+from itidigital.sql.athena.exceptions import InvalidPartitionError
+from itidigital.sql.athena.hive.partitions import (
+    DateProjection,
+    EnumProjection,
+    InjectedProjection,
+    IntegerProjection,
+    PartitionColumn,
+    projection_properties
+)
+
+
+@pytest.fixture
+def partitions() -> list:
+    """Fixture for projected date, hour, region and tenant partition columns"""
+    return [
+        PartitionColumn(
+            name='dt',
+            projection=DateProjection(
+                range=('2020-01-01', 'NOW'), format='yyyy-MM-dd', interval=1, interval_unit='DAYS'
+            )
+        ),
+        PartitionColumn(name='hour', type='int', projection=IntegerProjection(range=(0, 23), digits=2)),
+        PartitionColumn(name='region', projection=EnumProjection(values=['us-east-1', 'sa-east-1'])),
+        PartitionColumn(name='tenant', projection=InjectedProjection())
+    ]
+
+
+def test_projection_properties_should_works_as_expected(partitions: list):
+    """Asserts that projection properties are generated for every partition column"""
+    properties = projection_properties(
+        partitions, storage_location_template='s3://my-bucket/events/${tenant}/${region}/${dt}/${hour}/'
+    )
+
+    assert properties == {
+        'projection.enabled': 'true',
+        'projection.dt.type': 'date',
+        'projection.dt.range': '2020-01-01,NOW',
+        'projection.dt.format': 'yyyy-MM-dd',
+        'projection.dt.interval': '1',
+        'projection.dt.interval.unit': 'DAYS',
+        'projection.hour.type': 'integer',
+        'projection.hour.range': '0,23',
+        'projection.hour.digits': '2',
+        'projection.region.type': 'enum',
+        'projection.region.values': 'us-east-1,sa-east-1',
+        'projection.tenant.type': 'injected',
+        'storage.location.template': 's3://my-bucket/events/${tenant}/${region}/${dt}/${hour}/'
+    }
+
+
+def test_projection_properties_should_be_empty_without_projections():
+    """Asserts that partitions without projection generate no properties"""
+    assert projection_properties([PartitionColumn(name='dt'), PartitionColumn(name='hour', type='int')]) == {}
+
+
+@pytest.mark.parametrize('partition', [
+    PartitionColumn(name='dt', type='int', projection=DateProjection(range=('2020-01-01', 'NOW'), format='yyyy')),
+    PartitionColumn(name='dt', projection=DateProjection(range=('2020-01-01', ''), format='yyyy')),
+    PartitionColumn(name='dt', projection=DateProjection(range=('2020-01-01', 'NOW'), format='')),
+    PartitionColumn(name='dt', projection=DateProjection(
+        range=('2020-01-01', 'NOW'), format='yyyy', interval_unit='FORTNIGHTS'
+    )),
+    PartitionColumn(name='hour', type='date', projection=IntegerProjection(range=(0, 23))),
+    PartitionColumn(name='hour', projection=IntegerProjection(range=(23, 0))),
+    PartitionColumn(name='hour', projection=IntegerProjection(range=(0, 23), interval=0)),
+    PartitionColumn(name='region', projection=EnumProjection(values=[])),
+    PartitionColumn(name='region', projection=EnumProjection(values=['a,b'])),
+    PartitionColumn(name='tenant', type='int', projection=InjectedProjection()),
+])
+def test_projection_properties_should_raise_for_invalid_projection(partition: PartitionColumn):
+    """Asserts that invalid projections, or projections that do not suit the column type, raise an error"""
+    with pytest.raises(InvalidPartitionError):
+        projection_properties([partition])
+
+
+@pytest.mark.parametrize('partitions, template', [
+    ([PartitionColumn(name='tenant', projection=InjectedProjection()), PartitionColumn(name='dt')], None),
+    ([PartitionColumn(name='dt')], 's3://my-bucket/${dt}/'),
+    ([PartitionColumn(name='tenant', projection=InjectedProjection())], 'my-bucket/${tenant}/'),
+    ([PartitionColumn(name='tenant', projection=InjectedProjection())], 's3://my-bucket/events/'),
+])
+def test_projection_properties_should_raise_for_invalid_table(partitions: list, template: str):
+    """Asserts that partially projected tables and invalid location templates raise an error"""
+    with pytest.raises(InvalidPartitionError):
+        projection_properties(partitions, storage_location_template=template)
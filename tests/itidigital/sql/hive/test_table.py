@@ -1,8 +1,11 @@
+import mock
+import jinja2
 import pytest
 
 from itidigital.sql.athena.hive.properties import *
-from itidigital.sql.athena.hive.table import HiveTable
-from itidigital.sql.athena.exceptions import InvalidRowFormatError, InvalidS3LocationError
+from itidigital.sql.athena.hive.table import HiveTable, get_template
+from itidigital.sql.athena.hive.partitions import DateProjection, IntegerProjection, PartitionColumn
+from itidigital.sql.athena.exceptions import InvalidPartitionError, InvalidRowFormatError, InvalidS3LocationError
 
 
 class TestHiveTable:
@@ -68,11 +71,42 @@ class TestHiveTable:
     def test_fields_property_should_works_as_expected(
             self, hive_table: HiveTable
     ) -> None:
-        """Asserts that `fields` property works as expected"""
-        expected_fields = 'foo string, \n\tbar string'
+        """Asserts that `fields` property works as expected, leaving partition columns out"""
+        expected_fields = 'bar string'
 
         assert hive_table.fields == expected_fields
 
+    def test__parse_field_should_parse_nested_types(
+            self, hive_table: HiveTable
+    ) -> None:
+        """Asserts that `_parse_field` parses structs and arrays at any nesting level"""
+        field = (
+            "contacts",
+            {
+                "type": "array",
+                "items": {
+                    "type": "struct",
+                    "fields": {
+                        "kind": {"type": "string"},
+                        "address": {
+                            "type": "struct",
+                            "fields": {"street": {"type": "string"}, "number": {"type": "integer"}}
+                        }
+                    }
+                }
+            }
+        )
+
+        expected_field = "contacts array<struct<kind:string, address:struct<street:string, number:integer>>>"
+
+        assert hive_table._parse_field(field) == expected_field
+
+    def test__parse_field_should_default_array_items_to_string(
+            self, hive_table: HiveTable
+    ) -> None:
+        """Asserts that `_parse_field` parses arrays without items as arrays of strings"""
+        assert hive_table._parse_field(("extra", {"type": "array"})) == "extra array<string>"
+
     def test_comment_property_should_works_as_expected(
             self, hive_table: HiveTable
     ) -> None:
@@ -85,7 +119,7 @@ class TestHiveTable:
             self, hive_table: HiveTable
     ) -> None:
         """Asserts that `partition_by` property works as expected"""
-        expected_partition = 'foo'
+        expected_partition = 'foo string'
 
         assert hive_table.partition_by == expected_partition
 
@@ -148,6 +182,119 @@ class TestHiveTable:
         self, hive_table: HiveTable
     ) -> None:
         """Asserts that `table_properties` property works as expected"""
-        expected_table_properties = 'my_prop = my_value'
+        expected_table_properties = "'my_prop' = 'my_value'"
 
         assert hive_table.table_properties == expected_table_properties
+
+    def test_ddl_statement_should_works_as_expected(
+        self, hive_table: HiveTable
+    ) -> None:
+        """Asserts that `ddl_statement` renders every table property"""
+        expected_ddl_statement = (
+            "CREATE EXTERNAL TABLE IF NOT EXISTS itidigital.test_table (\n"
+            "    bar string\n"
+            ")\n"
+            "COMMENT My test table\n"
+            "PARTITIONED BY (foo string)\n"
+            "CLUSTERED BY bar INTO 10 BUCKETS\n"
+            "ROW FORMAT DELIMITED FIELDS TERMINATED BY ,\n"
+            "STORED AS parquet\n"
+            "LOCATION s3://my-bucket/itidigital/test_table\n"
+            "TBLPROPERTIES (\n"
+            "    'my_prop' = 'my_value'\n"
+            ")"
+        )
+
+        assert hive_table.ddl_statement == expected_ddl_statement
+
+    def test_ddl_statement_should_render_projected_partitions(self) -> None:
+        """Asserts that typed partition columns and their projection properties are rendered"""
+        hive_table = HiveTable(
+            create_disposition=CreateDisposition.IF_NOT_EXISTS,
+            table_reference=TableReference(database='itidigital', table_name='events'),
+            fields={"eid": {"type": "string"}},
+            is_external=True,
+            location='s3://my-bucket/events/',
+            stored_as=FileFormat.PARQUET,
+            partition_by=[
+                PartitionColumn(name='dt', projection=DateProjection(range=('2020-01-01', 'NOW'), format='yyyy-MM-dd')),
+                PartitionColumn(name='hour', type='int', projection=IntegerProjection(range=(0, 23)))
+            ],
+            table_properties={"classification": "parquet"},
+            storage_location_template='s3://my-bucket/events/${dt}/${hour}/'
+        )
+
+        assert hive_table.ddl_statement == (
+            "CREATE EXTERNAL TABLE IF NOT EXISTS itidigital.events (\n"
+            "    eid string\n"
+            ")\n"
+            "PARTITIONED BY (dt string, hour int)\n"
+            "STORED AS parquet\n"
+            "LOCATION s3://my-bucket/events/\n"
+            "TBLPROPERTIES (\n"
+            "    'classification' = 'parquet',\n\t"
+            "'projection.enabled' = 'true',\n\t"
+            "'projection.dt.type' = 'date',\n\t"
+            "'projection.dt.range' = '2020-01-01,NOW',\n\t"
+            "'projection.dt.format' = 'yyyy-MM-dd',\n\t"
+            "'projection.hour.type' = 'integer',\n\t"
+            "'projection.hour.range' = '0,23',\n\t"
+            "'storage.location.template' = 's3://my-bucket/events/${dt}/${hour}/'\n"
+            ")"
+        )
+
+    @pytest.mark.parametrize('partition_by, table_properties', [
+        (['missing'], None),
+        (['address'], None),
+        (['foo', PartitionColumn(name='foo')], None),
+        ([PartitionColumn(name='dt', type='int', projection=DateProjection(range=('2020', 'NOW'), format='y'))], None),
+        ([PartitionColumn(name='dt', projection=DateProjection(range=('2020', 'NOW'), format='yyyy'))],
+         {"projection.enabled": "false"}),
+    ])
+    def test_init_should_raise_for_invalid_partitions(self, partition_by: list, table_properties: dict) -> None:
+        """Asserts that invalid partition columns raise an error when the table is constructed"""
+        with pytest.raises(InvalidPartitionError):
+            HiveTable(
+                create_disposition=CreateDisposition.IF_NOT_EXISTS,
+                table_reference=TableReference(table_name='events'),
+                fields={
+                    "foo": {"type": "string"},
+                    "address": {"type": "struct", "fields": {"street": {"type": "string"}}}
+                },
+                is_external=True,
+                location='s3://my-bucket/events/',
+                partition_by=partition_by,
+                table_properties=table_properties
+            )
+
+    def test_table_properties_should_quote_names_and_values(self) -> None:
+        """Asserts that table property names and values are rendered as escaped string literals"""
+        hive_table = HiveTable(
+            create_disposition=CreateDisposition.IF_NOT_EXISTS,
+            table_reference=TableReference(table_name='events'),
+            fields={"foo": {"type": "string"}},
+            is_external=True,
+            location='s3://my-bucket/events/',
+            table_properties={"has_encrypted_data": False, "comment": "it's"}
+        )
+
+        assert hive_table.table_properties == "'has_encrypted_data' = 'false',\n\t'comment' = 'it\\'s'"
+
+    def test_ddl_statement_should_compile_template_once(
+        self, hive_table: HiveTable
+    ) -> None:
+        """Asserts that the DDL template is compiled once and shared by every table"""
+        get_template.cache_clear()
+
+        with mock.patch.object(
+            target=jinja2.Environment,
+            attribute='get_template',
+            autospec=True,
+            side_effect=jinja2.Environment.get_template
+        ) as get_template_mock:
+            first = hive_table.ddl_statement
+            second = hive_table.ddl_statement
+
+        assert first == second
+        assert get_template_mock.call_count == 1
+        assert get_template(name='ddl.txt') is get_template(name='ddl.txt')
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from itidigital.sql import bulk
+from itidigital.sql.athena.hive.properties import CreateDisposition, FileFormat
+
+from tests.test_data import examples
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """Fixture for a directory of schema files, one of them broken"""
+    (tmp_path / 'users.json').write_text(json.dumps(examples.EXAMPLE_SCHEMA))
+    (tmp_path / 'contacts.json').write_text(json.dumps(examples.EXAMPLE_ARRAY_SCHEMA))
+    (tmp_path / 'broken.json').write_text('{"type": ')
+    (tmp_path / 'notes.txt').write_text('not a schema')
+
+    return tmp_path
+
+
+def test_iter_schema_files_should_list_json_files(schema_dir):
+    """Asserts that `iter_schema_files` lists JSON files in name order"""
+    assert list(bulk.iter_schema_files(str(schema_dir))) == [
+        str(schema_dir / name) for name in ['broken.json', 'contacts.json', 'users.json']
+    ]
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_render_ddl_statements_should_works_as_expected(schema_dir, max_workers):
+    """Asserts that a DDL statement is rendered per schema, in order, and failures are reported"""
+    stats = bulk.BulkStats()
+
+    results = list(bulk.render_ddl_statements(
+        schema_paths=bulk.iter_schema_files(str(schema_dir)),
+        location='s3://my-bucket/{table_name}/',
+        database='itidigital',
+        max_workers=max_workers,
+        stats=stats,
+        create_disposition=CreateDisposition.OVERWRITE,
+        is_external=True,
+        stored_as=FileFormat.PARQUET
+    ))
+
+    assert [result.table_name for result in results] == ['broken', 'contacts', 'users']
+    assert results[0].ddl_statement is None and results[0].error.startswith('JSONDecodeError')
+    assert results[1].ddl_statement.startswith('CREATE EXTERNAL TABLE  itidigital.contacts (')
+    assert 'LOCATION s3://my-bucket/users/' in results[2].ddl_statement
+    assert (stats.rendered, stats.total, stats.failed) == (2, 3, [results[0]])
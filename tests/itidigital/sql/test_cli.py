@@ -0,0 +1,52 @@
+import json
+
+from itidigital.sql import cli
+
+from tests.test_data import examples
+
+
+def _write_schemas(directory) -> None:
+    """Writes two schema files"""
+    directory.mkdir()
+    (directory / 'users.json').write_text(json.dumps(examples.EXAMPLE_SCHEMA))
+    (directory / 'contacts.json').write_text(json.dumps(examples.EXAMPLE_ARRAY_SCHEMA))
+
+
+def test_main_should_write_a_file_per_table(tmp_path, capsys):
+    """Asserts that `ddl` command writes one `.sql` file per schema"""
+    _write_schemas(tmp_path / 'schemas')
+
+    exit_code = cli.main([
+        'ddl',
+        '--schemas', str(tmp_path / 'schemas'),
+        '--location', 's3://my-bucket/{table_name}/',
+        '--output-dir', str(tmp_path / 'ddl'),
+        '--workers', '1'
+    ])
+
+    assert exit_code == 0
+    assert sorted(path.name for path in (tmp_path / 'ddl').iterdir()) == ['contacts.sql', 'users.sql']
+    assert (tmp_path / 'ddl' / 'users.sql').read_text().startswith('CREATE EXTERNAL TABLE IF NOT EXISTS users (')
+    assert 'Rendered 2 of 2 tables' in capsys.readouterr().err
+
+
+def test_main_should_write_a_single_script(tmp_path, capsys):
+    """Asserts that `ddl` command writes every table to one script and reports failures"""
+    _write_schemas(tmp_path / 'schemas')
+    (tmp_path / 'schemas' / 'broken.json').write_text('{')
+
+    exit_code = cli.main([
+        'ddl',
+        '--schemas', str(tmp_path / 'schemas'),
+        '--location', 's3://my-bucket/{table_name}/',
+        '--output', str(tmp_path / 'catalogue.sql'),
+        '--managed',
+        '--workers', '1'
+    ])
+
+    script = (tmp_path / 'catalogue.sql').read_text()
+
+    assert exit_code == 1
+    assert script.count('CREATE TABLE IF NOT EXISTS') == 2
+    assert script.startswith('-- contacts\n')
+    assert 'Failed to render' in capsys.readouterr().err
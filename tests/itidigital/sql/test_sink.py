@@ -0,0 +1,211 @@
+import copy
+
+import mock
+import pytest
+
+from itidigital.sql import sink
+from itidigital.sql.sink import ParquetEventSink
+from itidigital.utils.schema.event import EventSchema
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.sql.athena.hive.partitions import DateProjection, PartitionColumn
+
+from tests.test_data import examples
+
+requires_pyarrow = pytest.mark.skipif(sink.pyarrow is None, reason='pyarrow is not installed')
+
+
+@pytest.fixture
+def schema() -> EventSchema:
+    """Fixture for Schema class example"""
+    return SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+
+
+@pytest.fixture
+def events() -> list:
+    """Fixture for valid events of two names"""
+    events = []
+
+    for index in range(10):
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        event['name'] = ['Joseph', 'Mary'][index % 2]
+        event['age'] = index
+        events.append(event)
+
+    return events
+
+
+def test_sink_should_require_pyarrow(schema: EventSchema, tmp_path):
+    """Asserts that a helpful error is raised when pyarrow is not installed"""
+    with mock.patch.object(sink, 'pyarrow', None), pytest.raises(ImportError, match='pip install pyarrow'):
+        ParquetEventSink(schema=schema, base_path=str(tmp_path))
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('a/b', 'a%2Fb'),
+    ('x=1', 'x%3D1'),
+    ('50%', '50%25'),
+    ('c:d', 'c%3Ad'),
+    ('#1', '%231'),
+    ('tab\t', 'tab%09'),
+    ('São Paulo', 'São Paulo'),
+    (None, '__HIVE_DEFAULT_PARTITION__'),
+    ('', '__HIVE_DEFAULT_PARTITION__'),
+    (True, 'true'),
+    (2022, '2022'),
+])
+def test_partition_value_should_escape_like_hive(value, expected: str):
+    """Asserts that partition values are percent-escaped like hive `FileUtils.escapePathName` does"""
+    assert sink._partition_value(value) == expected
+
+
+@requires_pyarrow
+class TestParquetEventSink:
+    """Test class for `ParquetEventSink`"""
+
+    def test_arrow_schema_should_match_hive_types(self) -> None:
+        """Asserts that Arrow types match the hive types of tables created from the same schema"""
+        pyarrow = sink.pyarrow
+        array_schema = SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+
+        with ParquetEventSink(schema=array_schema, base_path='/unused') as event_sink:
+            arrow_schema = event_sink.schema
+
+        assert arrow_schema.field('tags').type == pyarrow.list_(pyarrow.string())
+        assert arrow_schema.field('contacts').type == pyarrow.list_(
+            pyarrow.struct([('kind', pyarrow.string()), ('value', pyarrow.string())])
+        )
+        assert arrow_schema.field('matrix').type == pyarrow.list_(pyarrow.list_(pyarrow.int64()))
+        assert arrow_schema.field('extra').type == pyarrow.list_(pyarrow.string())
+
+    def test_write_should_lay_out_files_by_partition(self, schema: EventSchema, events: list, tmp_path) -> None:
+        """Asserts that events are written to hive partition directories, without partition columns"""
+        import pyarrow.dataset
+
+        with ParquetEventSink(schema=schema, base_path=str(tmp_path), partition_by=['name']) as event_sink:
+            event_sink.write_many(events)
+
+        stats = event_sink.stats
+        table = pyarrow.dataset.dataset(str(tmp_path), partitioning='hive').to_table()
+
+        assert stats.rows == 10
+        assert sorted(path.split('/')[-2] for path in stats.files) == ['name=Joseph', 'name=Mary']
+        assert 'name' not in sink.pyarrow.parquet.read_schema(stats.files[0]).names
+        assert sorted(table.column('age').to_pylist()) == list(range(10))
+        assert sorted(set(table.column('name').to_pylist())) == ['Joseph', 'Mary']
+        assert table.column('address').to_pylist()[0] == examples.EXAMPLE_EVENT['address']
+
+    def test_write_should_roll_files_by_size(self, schema: EventSchema, events: list, tmp_path) -> None:
+        """Asserts that a new file is started once a file reached `max_file_bytes`"""
+        with ParquetEventSink(
+                schema=schema, base_path=str(tmp_path), row_group_size=2, max_file_bytes=1
+        ) as event_sink:
+            event_sink.write_many(events)
+
+        assert len(event_sink.stats.files) == 5
+        assert [sink.pyarrow.parquet.read_metadata(path).num_rows for path in event_sink.stats.files] == [2] * 5
+
+    def test_write_should_close_least_recently_written_files(
+        self, schema: EventSchema, events: list, tmp_path
+    ) -> None:
+        """Asserts that no more than `max_open_files` files are open, and every closed file is complete"""
+        with ParquetEventSink(
+                schema=schema, base_path=str(tmp_path), partition_by=['name'], row_group_size=1, max_open_files=1
+        ) as event_sink:
+            event_sink.write_many(events)
+
+        assert len(event_sink.stats.files) == 10
+        assert sum(sink.pyarrow.parquet.read_metadata(path).num_rows for path in event_sink.stats.files) == 10
+
+    def test_write_should_use_partition_values_and_path_template(
+        self, schema: EventSchema, events: list, tmp_path
+    ) -> None:
+        """Asserts that partitions that are not event fields are laid out like the table location template"""
+        partition_by = [
+            PartitionColumn(name='dt', projection=DateProjection(range=('2020-01-01', 'NOW'), format='yyyy-MM-dd')),
+            'name'
+        ]
+
+        with ParquetEventSink(
+                schema=schema,
+                base_path=str(tmp_path),
+                partition_by=partition_by,
+                partition_values=lambda event: {'dt': '2022-10-01'},
+                path_template='${dt}/${name}/'
+        ) as event_sink:
+            event_sink.write_many(events)
+
+        assert sorted(path.split('/')[-3:-1] for path in event_sink.stats.files) == [
+            ['2022-10-01', 'Joseph'], ['2022-10-01', 'Mary']
+        ]
+
+    def test_write_should_encode_untyped_arrays(self, tmp_path) -> None:
+        """Asserts that values of arrays without items are written as JSON strings"""
+        array_schema = SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+        event = {
+            'eid': '1', 'tags': ['a'], 'contacts': [{'kind': 'email', 'value': 'a@b.c'}],
+            'matrix': [[1, 2]], 'extra': [1, {'a': 2}, 'text']
+        }
+
+        with ParquetEventSink(schema=array_schema, base_path=str(tmp_path)) as event_sink:
+            event_sink.write(event)
+
+        row, = sink.pyarrow.parquet.read_table(event_sink.stats.files[0]).to_pylist()
+
+        assert row['extra'][0] == '1' and row['extra'][2] == 'text'
+        assert sink.serialization.loads(row['extra'][1]) == {'a': 2}
+        assert row['contacts'] == event['contacts']
+
+    def test_write_should_escape_partition_values(self, schema: EventSchema, tmp_path) -> None:
+        """Asserts that partition values holding path separators get a single, escaped partition directory"""
+        events = [dict(examples.EXAMPLE_EVENT, name=name) for name in ['a/b', 'x=1', '']]
+
+        with ParquetEventSink(schema=schema, base_path=str(tmp_path), partition_by=['name']) as event_sink:
+            event_sink.write_many(events)
+
+        assert sorted(path.split('/')[-2] for path in event_sink.stats.files) == [
+            'name=__HIVE_DEFAULT_PARTITION__', 'name=a%2Fb', 'name=x%3D1'
+        ]
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            'name=__HIVE_DEFAULT_PARTITION__', 'name=a%2Fb', 'name=x%3D1'
+        ]
+
+    def test_write_should_use_given_filesystem(self, schema: EventSchema, events: list, tmp_path) -> None:
+        """Asserts that files are written to the given filesystem, relative to its root"""
+        import pyarrow.fs
+
+        filesystem = pyarrow.fs.SubTreeFileSystem(str(tmp_path), pyarrow.fs.LocalFileSystem())
+
+        with ParquetEventSink(
+                schema=schema, base_path='events', partition_by=['name'], filesystem=filesystem
+        ) as event_sink:
+            event_sink.write_many(events)
+
+        assert sorted(path.rsplit('/', 1)[0] for path in event_sink.stats.files) == [
+            'events/name=Joseph', 'events/name=Mary'
+        ]
+        assert (tmp_path / 'events' / 'name=Mary').is_dir()
+
+    def test_write_should_keep_large_and_integral_numbers(self, schema: EventSchema, tmp_path) -> None:
+        """Asserts that integers beyond 32 bits and integral floats are written as `bigint` values"""
+        events = [dict(examples.EXAMPLE_EVENT, age=3_000_000_000), dict(examples.EXAMPLE_EVENT, age=32.0)]
+
+        with ParquetEventSink(schema=schema, base_path=str(tmp_path)) as event_sink:
+            event_sink.write_many(events)
+
+        table = sink.pyarrow.parquet.read_table(event_sink.stats.files[0])
+
+        assert table.schema.field('age').type == sink.pyarrow.int64()
+        assert table.column('age').to_pylist() == [3_000_000_000, 32]
+
+    def test_write_should_reject_fractional_integers(self, schema: EventSchema, tmp_path) -> None:
+        """Asserts that fractional numbers of integer fields raise an error, instead of being truncated"""
+        event = copy.deepcopy(examples.EXAMPLE_EVENT)
+        event['address']['number'] = 32.5
+
+        with ParquetEventSink(schema=schema, base_path=str(tmp_path)) as event_sink:
+            with pytest.raises(ValueError, match='number'):
+                event_sink.write(event)
+
+            event_sink.write(examples.EXAMPLE_EVENT)
+
+        assert event_sink.stats.rows == 1
@@ -0,0 +1,142 @@
+import boto3
+import mock
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_athena
+
+from itidigital.sql.athena.submitter import AthenaSubmitter, QueryState, is_throttling
+
+
+def _client_error(code: str) -> ClientError:
+    """Builds a client error with the given code"""
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'operation')
+
+
+class _FakeAthenaClient:
+    """Athena client whose executions finish after a number of polls, tracking concurrency"""
+    def __init__(self, polls_until_done: int = 2, failing: tuple = (), throttled_starts: int = 0) -> None:
+        self.polls_until_done = polls_until_done
+        self.failing = failing
+        self.throttled_starts = throttled_starts
+        self.polls = {}
+        self.queries = {}
+        self.max_running = 0
+
+    def start_query_execution(self, QueryString: str, ResultConfiguration: dict) -> dict:
+        if self.throttled_starts:
+            self.throttled_starts -= 1
+            raise _client_error('TooManyRequestsException')
+
+        execution_id = str(len(self.queries))
+        self.queries[execution_id] = QueryString
+        self.polls[execution_id] = 0
+        self.max_running = max(self.max_running, len(self.polls))
+
+        return {'QueryExecutionId': execution_id}
+
+    def get_query_execution(self, QueryExecutionId: str) -> dict:
+        self.polls[QueryExecutionId] += 1
+
+        if self.polls[QueryExecutionId] < self.polls_until_done:
+            return {'QueryExecution': {'Status': {'State': QueryState.RUNNING}}}
+
+        del self.polls[QueryExecutionId]
+
+        if self.queries[QueryExecutionId] in self.failing:
+            return {'QueryExecution': {'Status': {'State': QueryState.FAILED, 'StateChangeReason': 'syntax error'}}}
+
+        return {'QueryExecution': {'Status': {'State': QueryState.SUCCEEDED}}}
+
+
+@pytest.fixture
+def statements() -> list:
+    """Fixture for table names and DDL statements"""
+    return [(f'table_{index}', f'CREATE TABLE table_{index} (eid string)') for index in range(7)]
+
+
+def test_is_throttling_should_works_as_expected():
+    """Asserts that throttled calls and concurrency limit errors are told apart from others"""
+    assert is_throttling(_client_error('ThrottlingException'))
+    assert is_throttling(_client_error('TooManyRequestsException'))
+    assert not is_throttling(_client_error('InvalidRequestException'))
+
+
+class TestAthenaSubmitter:
+    def test_run_should_keep_concurrency_under_limit(self, statements: list):
+        """Asserts that no more than `max_concurrency` executions are in flight"""
+        client = _FakeAthenaClient(polls_until_done=3)
+        submitter = AthenaSubmitter(client, 's3://results/', max_concurrency=3, sleep=mock.Mock())
+
+        executions = submitter.run(statements)
+
+        assert client.max_running == 3
+        assert sorted(execution.table_name for execution in executions) == [name for name, _ in statements]
+        assert all(execution.succeeded for execution in executions)
+
+    def test_run_should_report_failures_and_latency(self, statements: list):
+        """Asserts that failed statements are reported with their reason and latency"""
+        client = _FakeAthenaClient(failing=(statements[1][1],))
+        clock = mock.Mock(side_effect=range(100))
+        submitter = AthenaSubmitter(client, 's3://results/', clock=clock, sleep=mock.Mock())
+
+        executions = {execution.table_name: execution for execution in submitter.run(statements)}
+
+        assert executions['table_1'].state == QueryState.FAILED
+        assert executions['table_1'].reason == 'syntax error'
+        assert executions['table_0'].state == QueryState.SUCCEEDED
+        assert all(execution.latency > 0 for execution in executions.values())
+
+    def test_run_should_back_off_while_nothing_finishes(self):
+        """Asserts that polling waits grow while executions keep running, up to the maximum wait"""
+        sleep = mock.Mock()
+        submitter = AthenaSubmitter(
+            _FakeAthenaClient(polls_until_done=5), 's3://results/',
+            poll_interval=1.0, max_poll_interval=3.0, backoff=2.0, sleep=sleep
+        )
+
+        submitter.run([('foo', 'CREATE TABLE foo (eid string)')])
+
+        assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0, 3.0, 3.0]
+
+    def test_run_should_retry_throttled_starts(self):
+        """Asserts that starts refused for too many running queries are retried"""
+        client = _FakeAthenaClient(throttled_starts=2)
+        sleep = mock.Mock()
+        submitter = AthenaSubmitter(client, 's3://results/', poll_interval=1.0, sleep=sleep)
+
+        execution, = submitter.run([('foo', 'CREATE TABLE foo (eid string)')])
+
+        assert execution.succeeded
+        assert [call.args[0] for call in sleep.call_args_list][:2] == [1.0, 2.0]
+
+    def test_run_should_fail_statement_after_max_retries(self):
+        """Asserts that a statement is reported as failed when it keeps being throttled"""
+        client = _FakeAthenaClient(throttled_starts=10)
+        submitter = AthenaSubmitter(client, 's3://results/', max_retries=2, sleep=mock.Mock())
+
+        execution, = submitter.run([('foo', 'CREATE TABLE foo (eid string)')])
+
+        assert execution.state == QueryState.FAILED
+        assert execution.execution_id is None
+        assert 'TooManyRequestsException' in execution.reason
+        assert client.throttled_starts == 7
+
+    def test_init_should_raise_for_invalid_concurrency(self):
+        """Asserts that an error is raised for a non positive concurrency"""
+        with pytest.raises(ValueError):
+            AthenaSubmitter(_FakeAthenaClient(), 's3://results/', max_concurrency=0)
+
+    @mock_athena
+    def test_run_should_works_with_athena(self, statements: list):
+        """Asserts that statements are submitted to Athena and awaited"""
+        athena_client = boto3.client('athena', region_name='us-east-1')
+        submitter = AthenaSubmitter(athena_client, 's3://iti-query-results/', max_concurrency=2)
+
+        executions = submitter.run(statements)
+
+        assert len(executions) == len(statements)
+        assert all(execution.succeeded for execution in executions)
+        assert {
+            athena_client.get_query_execution(QueryExecutionId=execution.execution_id)['QueryExecution']['Query']
+            for execution in executions
+        } == {query for _, query in statements}
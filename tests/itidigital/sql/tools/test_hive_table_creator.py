@@ -1,3 +1,5 @@
+import copy
+
 import mock
 import pytest
 
@@ -5,7 +7,10 @@ import itidigital.sql.athena.tools.hive_table_creator
 from itidigital.data_quality.event.event import FieldType
 from itidigital.utils.schema.event import EventSchema, ObjectField, SchemaField
 from itidigital.sql.athena.hive.table import HiveTable
+from itidigital.data_quality.event.validator import CompiledEventValidator
+from itidigital.sql.athena.hive.properties import TableReference
 from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.utils.schema.fingerprint import layout_fingerprint
 from itidigital.sql.athena.tools.hive_table_creator import HiveTableCreator, HiveType
 
 from tests.test_data import examples
@@ -37,6 +42,42 @@ class TestHiveTableCreator:
 
         assert isinstance(table, HiveTable)
 
+    def test_from_event_schemas_should_works_as_expected(
+        self, hive_table_creator: HiveTableCreator
+    ) -> None:
+        """Asserts that `from_event_schemas` creates a table per schema with its own location"""
+        table_config = {
+            key: value for key, value in examples.TABLE_CONFIG.items()
+            if key not in ('table_reference', 'location')
+        }
+        event_schemas = (
+            (TableReference(table_name=name, database='itidigital'), SchemaBuilder(config=config).construct())
+            for name, config in [('foo', examples.EXAMPLE_SCHEMA), ('bar', examples.EXAMPLE_ARRAY_SCHEMA)]
+        )
+
+        tables = list(hive_table_creator.from_event_schemas(
+            event_schemas=event_schemas,
+            location='s3://my-bucket/{database}/{table_name}/',
+            **table_config
+        ))
+
+        assert [table.table_name for table in tables] == ['itidigital.foo', 'itidigital.bar']
+        assert [table.location for table in tables] == [
+            's3://my-bucket/itidigital/foo/', 's3://my-bucket/itidigital/bar/'
+        ]
+        assert 'tags array<string>' in tables[1].fields
+
+    def test_from_event_schemas_should_raise_exception(
+        self, hive_table_creator: HiveTableCreator
+    ) -> None:
+        """Asserts that `from_event_schemas` does not accept a shared table reference"""
+        with pytest.raises(KeyError):
+            next(hive_table_creator.from_event_schemas(
+                event_schemas=[],
+                location='',
+                table_reference=examples.TABLE_CONFIG['table_reference']
+            ))
+
     def test_from_event_schema_should_raise_exception(
         self, schema: EventSchema, hive_table_creator: HiveTableCreator
     ) -> None:
@@ -68,41 +109,121 @@ class TestHiveTableCreator:
             field_type=nested_field
         )
 
-    def test__json_to_hive_type_converter_should_works_as_expected(
+    def test_get_columns_should_works_as_expected(
+        self, hive_table_creator: HiveTableCreator, schema: EventSchema
+    ) -> None:
+        """Asserts that `get_columns` converts properties to hive columns without changing the schema"""
+        columns = hive_table_creator.get_columns(schema)
+
+        assert [(column.name, column.type) for column in columns] == [
+            ('eid', HiveType.STRING),
+            ('documentNumber', HiveType.STRING),
+            ('name', HiveType.STRING),
+            ('age', HiveType.INTEGER),
+            ('address', HiveType.OBJECT)
+        ]
+        assert [column.name for column in columns[4].fields] == ['street', 'number', 'mailAddress']
+        assert columns[4].fields[2].type == HiveType.BOOLEAN
+        assert schema.properties[4].type == FieldType.OBJECT
+        assert schema.properties[4].properties[0].type == FieldType.STRING
+
+    def test_get_columns_should_reuse_columns_of_same_layout(
+        self, hive_table_creator: HiveTableCreator
+    ) -> None:
+        """Asserts that `get_columns` converts each schema layout once"""
+        first = SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+        second = SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+
+        with mock.patch.object(
+            target=HiveTableCreator,
+            attribute='_convert_columns',
+            wraps=hive_table_creator._convert_columns
+        ) as convert_columns_mock:
+            columns = hive_table_creator.get_columns(first)
+
+            assert HiveTableCreator().get_columns(second) is columns
+
+        assert convert_columns_mock.call_count <= 1
+
+    def test_get_columns_should_tell_apart_property_order_and_items(
+        self, hive_table_creator: HiveTableCreator
+    ) -> None:
+        """Asserts that schemas with other property order or array items get their own columns"""
+        config = examples.EXAMPLE_ARRAY_SCHEMA
+        reordered = {**config, 'properties': dict(reversed(list(config['properties'].items())))}
+        other_items = copy.deepcopy(config)
+        other_items['properties']['tags']['items'] = {"type": "integer"}
+
+        columns = hive_table_creator.get_columns(SchemaBuilder(config=config).construct())
+        reordered_columns = hive_table_creator.get_columns(SchemaBuilder(config=reordered).construct())
+        other_columns = hive_table_creator.get_columns(SchemaBuilder(config=other_items).construct())
+
+        assert reordered_columns == tuple(reversed(columns))
+        assert columns[1].items.type == HiveType.STRING
+        assert other_columns[1].items.type == HiveType.INTEGER
+
+    def test_get_columns_should_keep_descriptions_of_each_schema(
+        self, hive_table_creator: HiveTableCreator
+    ) -> None:
+        """Asserts that schemas with the same layout but other descriptions get their own columns"""
+        described = copy.deepcopy(examples.EXAMPLE_SCHEMA)
+        described['properties']['address']['properties']['street']['description'] = 'street name'
+
+        columns = hive_table_creator.get_columns(SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct())
+        described_columns = hive_table_creator.get_columns(SchemaBuilder(config=described).construct())
+
+        assert described_columns[4].fields[0].description == 'street name'
+        assert columns[4].fields[0].description != 'street name'
+
+    def test_get_columns_should_drop_least_recently_used_layouts(
+        self, hive_table_creator: HiveTableCreator
+    ) -> None:
+        """Asserts that no more than `_COLUMNS_MAXSIZE` layouts are cached"""
+        module = itidigital.sql.athena.tools.hive_table_creator
+        schemas = [
+            SchemaBuilder(config={**examples.EXAMPLE_SCHEMA, 'description': str(index)}).construct()
+            for index in range(3)
+        ]
+
+        with mock.patch.object(module, '_COLUMNS', module.OrderedDict()), \
+                mock.patch.object(module, '_COLUMNS_MAXSIZE', 2):
+            first = hive_table_creator.get_columns(schemas[0])
+            hive_table_creator.get_columns(schemas[1])
+            hive_table_creator.get_columns(schemas[0])
+            hive_table_creator.get_columns(schemas[2])
+
+            assert list(module._COLUMNS) == [layout_fingerprint(schemas[0]), layout_fingerprint(schemas[2])]
+            assert hive_table_creator.get_columns(schemas[0]) is first
+
+    def test_from_event_schema_should_share_schema_with_validators(
         self, hive_table_creator: HiveTableCreator, schema: EventSchema
     ) -> None:
-        """Asserts that `_json_to_hive_type_converter` works as expected"""
-        converted_field = hive_table_creator._json_to_hive_type_converter(schema)
+        """Asserts that the same schema can be validated against after rendering its DDL"""
+        validator = CompiledEventValidator(schema=schema)
 
-        assert converted_field.type == FieldType.OBJECT
-        assert converted_field.properties[0].type == HiveType.STRING
-        assert converted_field.properties[1].type == HiveType.STRING
-        assert converted_field.properties[2].type == HiveType.STRING
-        assert converted_field.properties[3].type == HiveType.INTEGER
-        assert converted_field.properties[4].type == HiveType.OBJECT
+        first = hive_table_creator.from_event_schema(event_schema=schema, **examples.TABLE_CONFIG).ddl_statement
+        second = hive_table_creator.from_event_schema(event_schema=schema, **examples.TABLE_CONFIG).ddl_statement
+
+        assert first == second
+        assert CompiledEventValidator(schema=schema).is_valid(examples.EXAMPLE_EVENT)
+        assert validator.is_valid(examples.EXAMPLE_EVENT)
 
     @mock.patch.object(
         target=itidigital.sql.athena.tools.hive_table_creator.HiveTableCreator,
         attribute="_map_regular_field",
         return_value={}
     )
-    @mock.patch.object(
-        target=itidigital.sql.athena.tools.hive_table_creator.HiveTableCreator,
-        attribute="_map_struct_field",
-        return_value={}
-    )
-    def test__map_fields_should_works_as_expected(
+    def test__map_columns_should_works_as_expected(
         self,
         map_regular_field_mock: mock.MagicMock,
-        map_struct_field_mock: mock.MagicMock,
         hive_table_creator: HiveTableCreator,
         schema: EventSchema
     ) -> None:
-        """Asserts that `_map_fields` works as expected"""
+        """Asserts that `_map_columns` works as expected"""
         expected_mapping = {'mailAddress': {}, 'number': {}, 'street': {}}
 
-        field_mappings = hive_table_creator._map_fields(
-            schema=schema.properties[4]
+        field_mappings = hive_table_creator._map_columns(
+            columns=hive_table_creator.get_columns(schema)[4].fields
         )
 
         assert field_mappings == expected_mapping
@@ -117,31 +238,37 @@ class TestHiveTableCreator:
         }
 
         field_map = hive_table_creator._map_regular_field(
-            field=schema.properties[0]
+            column=hive_table_creator.get_columns(schema)[0]
         )
 
         assert field_map == expected_map
 
-    @mock.patch.object(
-        target=itidigital.sql.athena.tools.hive_table_creator.HiveTableCreator,
-        attribute="_map_fields",
-        return_value={}
-    )
-    def test__map_struct_field_should_work_as_expected(
-        self,
-        map_fields_mock: mock.MagicMock,
-        hive_table_creator: HiveTableCreator,
-        schema: EventSchema
+    def test__map_columns_should_map_struct_fields(
+        self, hive_table_creator: HiveTableCreator, schema: EventSchema
     ) -> None:
-        """Asserts that `_map_struct_field` works as expected"""
-        expected_map = {
+        """Asserts that `_map_columns` maps struct columns along with their fields"""
+        field_mappings = hive_table_creator._map_columns(
+            columns=hive_table_creator.get_columns(schema)
+        )
+
+        assert field_mappings['address']['type'] == 'struct'
+        assert field_mappings['address']['fields']['number'] == {
             'description': 'An explanation about the purpose of this instance.',
-            'fields': {},
-            'type': 'object'
+            'type': 'bigint'
         }
 
-        struct_map = hive_table_creator._map_struct_field(
-            field=schema.properties[4]
+    def test__map_columns_should_map_array_items(
+        self, hive_table_creator: HiveTableCreator
+    ) -> None:
+        """Asserts that `_map_columns` maps array columns along with their items"""
+        schema = SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+
+        field_mappings = hive_table_creator._map_columns(
+            columns=hive_table_creator.get_columns(schema)
         )
 
-        assert struct_map == expected_map
+        assert field_mappings['tags']['items'] == {'type': 'string', 'description': ''}
+        assert field_mappings['contacts']['items']['type'] == 'struct'
+        assert list(field_mappings['contacts']['items']['fields']) == ['kind', 'value']
+        assert field_mappings['matrix']['items']['items'] == {'type': 'bigint', 'description': ''}
+        assert 'items' not in field_mappings['extra']
@@ -0,0 +1,105 @@
+import copy
+
+import pytest
+
+from itidigital.utils.schema.event import EventSchema
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.sql.athena.hive.properties import TableReference
+from itidigital.sql.athena.tools.schema_diff import ColumnChange, diff_schemas
+
+from tests.test_data import examples
+
+_TABLE_REFERENCE = TableReference(table_name='users', database='itidigital')
+
+
+def _field(path: str, field_type: str, **attrs) -> dict:
+    """Builds a raw schema field, named after its path"""
+    return {"$id": f"#/properties/{path}", "type": field_type, **attrs}
+
+
+def _evolve(change) -> EventSchema:
+    """Builds a schema from a changed copy of the example schema"""
+    raw_schema = copy.deepcopy(examples.EXAMPLE_SCHEMA)
+    change(raw_schema)
+
+    return SchemaBuilder(config=raw_schema).construct()
+
+
+@pytest.fixture
+def schema() -> EventSchema:
+    """Fixture for Schema class example"""
+    return SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+
+
+class TestDiffSchemas:
+    """Test class for `diff_schemas`"""
+
+    def test_diff_schemas_should_be_empty_for_same_columns(self, schema: EventSchema) -> None:
+        """Asserts that schemas with the same columns need no statements"""
+        new_schema = _evolve(lambda raw_schema: raw_schema['properties']['eid'].update(description='changed'))
+
+        diff = diff_schemas(schema, new_schema)
+
+        assert diff.is_empty
+        assert diff.alter_statements(_TABLE_REFERENCE) == []
+
+    def test_diff_schemas_should_add_appended_columns(self, schema: EventSchema) -> None:
+        """Asserts that appended columns only need `ADD COLUMNS` with those columns"""
+        new_schema = _evolve(lambda raw_schema: raw_schema['properties'].update(
+            email=_field('email', 'string'),
+            tags=_field('tags', 'array', items=_field('tags/items', 'string'))
+        ))
+
+        diff = diff_schemas(schema, new_schema)
+
+        assert diff.is_additive
+        assert diff.added == (ColumnChange('email', None, 'string'), ColumnChange('tags', None, 'array<string>'))
+        assert diff.alter_statements(_TABLE_REFERENCE) == [
+            "ALTER TABLE itidigital.users ADD COLUMNS (email string, tags array<string>)"
+        ]
+
+    def test_diff_schemas_should_replace_columns_for_nested_changes(self, schema: EventSchema) -> None:
+        """Asserts that fields added to a struct column replace every column"""
+        new_schema = _evolve(lambda raw_schema: raw_schema['properties']['address']['properties'].update(
+            zip=_field('address/properties/zip', 'string')
+        ))
+
+        diff = diff_schemas(schema, new_schema)
+
+        assert diff.changed == (ColumnChange(
+            'address',
+            'struct<street:string, number:bigint, mailAddress:boolean>',
+            'struct<street:string, number:bigint, mailAddress:boolean, zip:string>'
+        ),)
+        assert diff.alter_statements(_TABLE_REFERENCE) == [
+            "ALTER TABLE itidigital.users REPLACE COLUMNS (eid string, documentNumber string, name string, "
+            "age bigint, address struct<street:string, number:bigint, mailAddress:boolean, zip:string>)"
+        ]
+
+    @pytest.mark.parametrize('change', [
+        lambda raw_schema: raw_schema['properties'].pop('name'),
+        lambda raw_schema: raw_schema['properties'].update(age=_field('age', 'string')),
+        lambda raw_schema: raw_schema.update(
+            properties={'email': _field('email', 'string'), **raw_schema['properties']}
+        ),
+        lambda raw_schema: raw_schema.update(
+            properties=dict(reversed(list(raw_schema['properties'].items())))
+        ),
+    ])
+    def test_diff_schemas_should_replace_columns(self, schema: EventSchema, change) -> None:
+        """Asserts that removed, changed, inserted or reordered columns replace every column"""
+        diff = diff_schemas(schema, _evolve(change))
+
+        statement, = diff.alter_statements(_TABLE_REFERENCE)
+
+        assert not diff.is_additive
+        assert statement.startswith("ALTER TABLE itidigital.users REPLACE COLUMNS (")
+
+    def test_diff_schemas_should_skip_partition_columns(self, schema: EventSchema) -> None:
+        """Asserts that partition columns are not part of the diff"""
+        new_schema = _evolve(lambda raw_schema: raw_schema['properties'].update(email=_field('email', 'string')))
+
+        diff = diff_schemas(schema, new_schema, partition_by=['eid', 'email'])
+
+        assert diff.is_empty
+        assert [name for name, _ in diff.columns] == ['documentNumber', 'name', 'age', 'address']
@@ -0,0 +1,145 @@
+import boto3
+import mock
+import pytest
+from moto import mock_sqs
+from botocore.exceptions import ClientError
+
+from itidigital.utils.aws.sqs import (
+    QueueUrlCache,
+    chunk_batch_entries,
+    create_sqs_client,
+    entry_size,
+    send_message_batch
+)
+
+
+def _entries(count: int, body: str = 'x') -> list:
+    """Builds `send_message_batch` entries"""
+    return [{'Id': str(index), 'MessageBody': body} for index in range(count)]
+
+
+def test_chunk_batch_entries_should_respect_max_entries():
+    """Asserts that `chunk_batch_entries` groups at most 10 entries per batch"""
+    batches = list(chunk_batch_entries(_entries(25)))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+
+
+def test_chunk_batch_entries_should_respect_max_bytes():
+    """Asserts that `chunk_batch_entries` splits batches by payload size"""
+    batches = list(chunk_batch_entries(_entries(4, body='x' * 100), max_bytes=250))
+
+    assert [len(batch) for batch in batches] == [2, 2]
+
+
+def test_chunk_batch_entries_should_handle_empty_input():
+    """Asserts that `chunk_batch_entries` yields nothing for no entries"""
+    assert list(chunk_batch_entries([])) == []
+
+
+def test_entry_size_should_count_message_attributes():
+    """Asserts that `entry_size` counts the body and every message attribute"""
+    entry = {
+        'Id': '0',
+        'MessageBody': 'ção',
+        'MessageAttributes': {
+            'kind': {'DataType': 'String', 'StringValue': 'abc'},
+            'raw': {'DataType': 'Binary', 'BinaryValue': b'\x00\x01'}
+        }
+    }
+
+    assert entry_size(entry) == 5 + (4 + 6 + 3) + (3 + 6 + 2)
+
+
+@mock_sqs
+def test_send_message_batch_should_works_as_expected():
+    """Asserts that `send_message_batch` sends every entry"""
+    sqs_client = boto3.client('sqs', region_name='us-east-1')
+    queue_url = sqs_client.create_queue(QueueName='my-queue')['QueueUrl']
+
+    failed = send_message_batch(
+        sqs_client=sqs_client,
+        queue_url=queue_url,
+        entries=_entries(12)
+    )
+
+    attributes = sqs_client.get_queue_attributes(
+        QueueUrl=queue_url,
+        AttributeNames=['ApproximateNumberOfMessages']
+    )['Attributes']
+
+    assert failed == []
+    assert attributes['ApproximateNumberOfMessages'] == '12'
+
+
+class TestQueueUrlCache:
+    """Test class for `QueueUrlCache`"""
+
+    @pytest.fixture
+    def now(self) -> list:
+        """Fixture for a controllable clock value"""
+        return [0.0]
+
+    @pytest.fixture
+    def cache(self, now: list) -> QueueUrlCache:
+        """Fixture for `QueueUrlCache` class example"""
+        return QueueUrlCache(ttl=10, clock=lambda: now[0])
+
+    @pytest.fixture
+    def sqs_client(self) -> mock.MagicMock:
+        """Fixture for a fake SQS client"""
+        sqs_client = mock.MagicMock()
+        sqs_client.get_queue_url.side_effect = [
+            {'QueueUrl': 'url-1'},
+            {'QueueUrl': 'url-2'},
+        ]
+
+        return sqs_client
+
+    def test_get_should_cache_queue_url(self, cache: QueueUrlCache, sqs_client) -> None:
+        """Asserts that `get` resolves a queue URL only once"""
+        assert cache.get(sqs_client, 'my-queue') == 'url-1'
+        assert cache.get(sqs_client, 'my-queue') == 'url-1'
+        assert sqs_client.get_queue_url.call_count == 1
+
+    def test_get_should_expire_queue_url(self, cache: QueueUrlCache, sqs_client, now: list) -> None:
+        """Asserts that `get` resolves a queue URL again after its TTL"""
+        cache.get(sqs_client, 'my-queue')
+        now[0] = 11
+
+        assert cache.get(sqs_client, 'my-queue') == 'url-2'
+
+    def test_invalidate_should_works_as_expected(self, cache: QueueUrlCache, sqs_client) -> None:
+        """Asserts that `invalidate` drops a cached queue URL"""
+        cache.get(sqs_client, 'my-queue')
+        cache.invalidate('my-queue')
+
+        assert cache.get(sqs_client, 'my-queue') == 'url-2'
+
+    def test_call_should_retry_when_queue_does_not_exist(self, cache: QueueUrlCache, sqs_client) -> None:
+        """Asserts that `call` resolves the URL again when the queue does not exist"""
+        error = ClientError(
+            error_response={'Error': {'Code': 'AWS.SimpleQueueService.NonExistentQueue'}},
+            operation_name='SendMessage'
+        )
+        operation = mock.MagicMock(side_effect=[error, 'sent'])
+
+        assert cache.call(sqs_client, 'my-queue', operation) == 'sent'
+        operation.assert_has_calls([mock.call('url-1'), mock.call('url-2')])
+
+    def test_call_should_raise_other_errors(self, cache: QueueUrlCache, sqs_client) -> None:
+        """Asserts that `call` does not retry other client errors"""
+        error = ClientError(
+            error_response={'Error': {'Code': 'AccessDenied'}},
+            operation_name='SendMessage'
+        )
+
+        with pytest.raises(ClientError):
+            cache.call(sqs_client, 'my-queue', mock.MagicMock(side_effect=error))
+
+
+def test_create_sqs_client_should_works_as_expected():
+    """Asserts that `create_sqs_client` configures the connection pool"""
+    sqs_client = create_sqs_client(max_pool_connections=32)
+
+    assert sqs_client.meta.config.max_pool_connections == 32
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from itidigital.utils.builder.base import BaseBuilder
+
+
+@dataclass
+class ExampleProduct:
+    name: str
+    size: int
+    cached: int = field(default=0, init=False)
+
+
+class ExampleBuilder(BaseBuilder):
+    product = ExampleProduct
+
+    def __init__(self, config: dict) -> None:
+        self.config = config
+
+    def get_name(self) -> str:
+        return self.config['name']
+
+    def get_size(self) -> int:
+        return len(self.config['name'])
+
+
+class TestBaseBuilder:
+    def test_getters_should_be_resolved_for_init_fields(self):
+        """Asserts that getters are resolved once per builder class, skipping non init fields"""
+        assert [name for name, _ in ExampleBuilder._getters] == ['name', 'size']
+
+    def test_construct_should_works_as_expected(self):
+        """Asserts that construct builds the product from resolved getters"""
+        assert ExampleBuilder(config={'name': 'abc'}).construct() == ExampleProduct(name='abc', size=3)
+
+    def test_construct_without_product_should_raise_error(self):
+        """Asserts that construct raises NotImplementedError when there is no product"""
+        class NoProductBuilder(BaseBuilder):
+            pass
+
+        with pytest.raises(NotImplementedError):
+            NoProductBuilder().construct()
@@ -7,10 +7,10 @@ from tests.test_data import examples
 
 from itidigital.data_quality.event.event import FieldType
 from itidigital.utils.schema.event import (
-    EventSchema, SchemaField, ObjectField
+    EventSchema, SchemaField, ArrayField, ObjectField
 )
 from itidigital.utils.schema.builder import (
-    SchemaBuilder, SchemaFieldBuilder, ObjectFieldBuilder,
+    SchemaBuilder, SchemaFieldBuilder, ArrayFieldBuilder, ObjectFieldBuilder,
 )
 
 
@@ -101,6 +101,78 @@ class TestSchemaFieldBuilder:
         assert field_examples == expected_field_examples
 
 
+class TestNullableTypes:
+    @pytest.mark.parametrize('raw_type, expected_type, expected_nullable', [
+        ('string', FieldType.STRING, False),
+        (['string', 'null'], FieldType.STRING, True),
+        (['null'], FieldType.NULL, False),
+        (['string', 'integer'], FieldType.UNKNOWN, False),
+    ])
+    def test_get_type_and_get_nullable_should_works_as_expected(
+        self, raw_type, expected_type: FieldType, expected_nullable: bool
+    ) -> None:
+        """Asserts that lists of types are parsed into a type and a nullable flag"""
+        builder = SchemaFieldBuilder(config={"$id": "#/properties/foo", "type": raw_type})
+
+        assert builder.get_type() == expected_type
+        assert builder.get_nullable() == expected_nullable
+
+    def test_get_properties_should_parse_nullable_objects(self) -> None:
+        """Asserts that nullable object properties are built as nullable object fields"""
+        object_field = ObjectFieldBuilder(
+            config={
+                "$id": "#/properties/foo",
+                "type": "object",
+                "properties": {
+                    "bar": {"$id": "#/properties/foo/properties/bar", "type": ["object", "null"], "properties": {}}
+                }
+            }
+        ).construct()
+
+        assert isinstance(object_field.properties[0], ObjectField)
+        assert object_field.properties[0].nullable
+
+
+class TestArrayFieldBuilder:
+    @pytest.fixture
+    def array_schema(self) -> dict:
+        """Fixture for raw array schemas example"""
+        return examples.EXAMPLE_ARRAY_SCHEMA['properties']
+
+    def test_construct_should_works_as_expected(self, array_schema: dict) -> None:
+        """Asserts that `construct` method builds array fields with their items"""
+        array_field = ArrayFieldBuilder(config=array_schema['tags']).construct()
+
+        assert isinstance(array_field, ArrayField)
+        assert array_field.name == 'tags'
+        assert array_field.items.type == FieldType.STRING
+
+    def test_get_items_should_build_nested_items(self, array_schema: dict) -> None:
+        """Asserts that `get_items` builds object and array items"""
+        contacts_items = ArrayFieldBuilder(config=array_schema['contacts']).get_items()
+        matrix_items = ArrayFieldBuilder(config=array_schema['matrix']).get_items()
+
+        assert isinstance(contacts_items, ObjectField)
+        assert [prop.name for prop in contacts_items.properties] == ['kind', 'value']
+        assert isinstance(matrix_items, ArrayField)
+        assert matrix_items.items.type == FieldType.INTEGER
+
+    def test_get_items_should_return_none_without_items(self, array_schema: dict) -> None:
+        """Asserts that `get_items` returns None for arrays accepting any items"""
+        assert ArrayFieldBuilder(config=array_schema['extra']).get_items() is None
+
+    def test_equality_should_ignore_item_names_and_missing_items(self, array_schema: dict) -> None:
+        """Asserts that array fields without items are equal to arrays of any items"""
+        tags = ArrayFieldBuilder(config=array_schema['tags']).construct()
+        unnamed_items = ArrayFieldBuilder(config={**array_schema['tags'], 'items': {'type': 'string'}}).construct()
+        any_items = ArrayFieldBuilder(config={**array_schema['tags'], 'items': None}).construct()
+        other_items = ArrayFieldBuilder(config={**array_schema['tags'], 'items': {'type': 'integer'}}).construct()
+
+        assert tags == unnamed_items
+        assert tags == any_items
+        assert tags != other_items
+
+
 class TestObjectFieldBuilder:
     @pytest.fixture
     def object_field_builder(self) -> ObjectFieldBuilder:
@@ -0,0 +1,84 @@
+import copy
+
+import pytest
+
+from tests.test_data import examples
+
+from itidigital.utils.schema.event import EventSchema
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.utils.schema.fingerprint import event_fingerprint, layout_fingerprint, schema_fingerprint
+
+
+@pytest.fixture
+def schema() -> EventSchema:
+    """Fixture for Schema class example"""
+    return SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+
+
+def test_schema_fingerprint_should_match_event_fingerprint(schema: EventSchema):
+    """Asserts that a matching event and schema have the same fingerprint"""
+    assert schema_fingerprint(schema) == event_fingerprint(examples.EXAMPLE_EVENT)
+
+
+def test_schema_fingerprint_should_be_cached(schema: EventSchema):
+    """Asserts that `schema_fingerprint` caches the fingerprint on the schema"""
+    fingerprint = schema_fingerprint(schema)
+    schema.properties = []
+
+    assert schema_fingerprint(schema) == fingerprint
+
+
+def test_schema_fingerprint_should_not_depend_on_property_order():
+    """Asserts that `schema_fingerprint` ignores property order"""
+    raw_schema = copy.deepcopy(examples.EXAMPLE_SCHEMA)
+    raw_schema['properties'] = dict(reversed(list(raw_schema['properties'].items())))
+
+    reordered = SchemaBuilder(config=raw_schema).construct()
+    original = SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+
+    assert reordered != original
+    assert schema_fingerprint(reordered) == schema_fingerprint(original)
+
+
+def test_layout_fingerprint_should_depend_on_property_order():
+    """Asserts that `layout_fingerprint` tells apart schemas with other property order"""
+    raw_schema = copy.deepcopy(examples.EXAMPLE_SCHEMA)
+    raw_schema['properties'] = dict(reversed(list(raw_schema['properties'].items())))
+
+    reordered = SchemaBuilder(config=raw_schema).construct()
+    original = SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()
+
+    assert layout_fingerprint(reordered) != layout_fingerprint(original)
+    assert layout_fingerprint(SchemaBuilder(config=examples.EXAMPLE_SCHEMA).construct()) == layout_fingerprint(original)
+
+
+def test_layout_fingerprint_should_depend_on_array_items():
+    """Asserts that `layout_fingerprint` tells apart schemas with other array items"""
+    raw_schema = copy.deepcopy(examples.EXAMPLE_ARRAY_SCHEMA)
+    raw_schema['properties']['tags']['items'] = {"type": "integer"}
+
+    changed = SchemaBuilder(config=raw_schema).construct()
+    original = SchemaBuilder(config=examples.EXAMPLE_ARRAY_SCHEMA).construct()
+
+    assert schema_fingerprint(changed) == schema_fingerprint(original)
+    assert layout_fingerprint(changed) != layout_fingerprint(original)
+
+
+def test_event_fingerprint_should_not_depend_on_key_order():
+    """Asserts that `event_fingerprint` ignores key order"""
+    event = dict(reversed(list(examples.EXAMPLE_EVENT.items())))
+
+    assert event_fingerprint(event) == event_fingerprint(examples.EXAMPLE_EVENT)
+
+
+@pytest.mark.parametrize('changes', [
+    {"age": "32"},
+    {"address": {"street": "St. Blue", "number": 3}},
+    {"address": {"street": "St. Blue", "number": 3, "mailAddress": True, "zip": "1"}},
+    {"extra": None},
+])
+def test_event_fingerprint_should_change_with_structure(changes: dict):
+    """Asserts that `event_fingerprint` changes when names or types change"""
+    event = {**examples.EXAMPLE_EVENT, **changes}
+
+    assert event_fingerprint(event) != event_fingerprint(examples.EXAMPLE_EVENT)
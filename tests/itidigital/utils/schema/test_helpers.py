@@ -1,6 +1,6 @@
 import mock
 
-from itidigital.utils.schema.helpers import load_schema
+from itidigital.utils.schema.helpers import load_schema, parse_schema
 
 
 @mock.patch("builtins.open", create=True)
@@ -15,3 +15,9 @@ def test_load_schema_should_works_as_expected(mock_open):
     )
 
     assert schema == {"foo": "bar"}
+
+
+def test_parse_schema_should_works_as_expected():
+    """Asserts that `parse_schema` accepts both text and bytes"""
+    assert parse_schema('{"foo": "bar"}') == {"foo": "bar"}
+    assert parse_schema(b'{"foo": "bar"}') == {"foo": "bar"}
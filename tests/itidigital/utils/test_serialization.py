@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from itidigital.utils import serialization
+
+from tests.test_data import examples
+
+
+@pytest.fixture(params=[backend.name for backend in serialization.available_backends()])
+def backend(request) -> serialization.JsonBackend:
+    """Fixture for every installed JSON backend"""
+    return serialization.get_backend(request.param)
+
+
+def test_backend_should_decode_str_and_bytes(backend: serialization.JsonBackend):
+    """Asserts that every backend decodes `str`, `bytes` and `memoryview` documents alike"""
+    document = '{"name": "José", "tags": ["a/b"], "age": 32}'
+    expected = {"name": "José", "tags": ["a/b"], "age": 32}
+
+    assert backend.loads(document) == expected
+    assert backend.loads(document.encode('utf-8')) == expected
+    assert backend.loads(memoryview(document.encode('utf-8'))) == expected
+
+
+def test_backend_should_round_trip_events(backend: serialization.JsonBackend):
+    """Asserts that every backend encodes events to documents it decodes back"""
+    assert backend.loads(backend.dumps(examples.EXAMPLE_ARRAY_EVENT)) == examples.EXAMPLE_ARRAY_EVENT
+    assert backend.loads(backend.dumps_bytes(examples.EXAMPLE_EVENT)) == examples.EXAMPLE_EVENT
+    assert isinstance(backend.dumps(examples.EXAMPLE_EVENT), str)
+    assert isinstance(backend.dumps_bytes(examples.EXAMPLE_EVENT), bytes)
+
+
+def test_backend_should_encode_integers_beyond_64_bits(backend: serialization.JsonBackend):
+    """Asserts that every backend encodes integers that the standard library encodes, like `2 ** 70`"""
+    event = {"name": "José", "big": 2 ** 70, "small": -2 ** 64}
+
+    assert json.loads(backend.dumps(event)) == event
+    assert json.loads(backend.dumps_bytes(event)) == event
+
+
+def test_backend_should_raise_value_error_on_invalid_documents(backend: serialization.JsonBackend):
+    """Asserts that every backend reports invalid documents as `ValueError`"""
+    with pytest.raises(ValueError):
+        backend.loads(b'{not json')
+
+
+def test_get_backend_should_prefer_installed_libraries():
+    """Asserts that the first installed backend is picked by default"""
+    assert serialization.get_backend().name == serialization.available_backends()[0].name
+    assert serialization.available_backends()[-1].name == 'json'
+
+
+def test_get_backend_should_reject_unknown_names():
+    """Asserts that unknown backend names are rejected"""
+    with pytest.raises(ValueError):
+        serialization.get_backend('yaml')
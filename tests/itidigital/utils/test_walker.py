@@ -0,0 +1,141 @@
+import mock
+import pytest
+
+from itidigital.utils import walker
+from itidigital.utils.exceptions import MaxDepthExceededError
+from itidigital.data_quality.event.event import Event
+from itidigital.data_quality.event.builder import EventBuilder
+from itidigital.data_quality.event.validator import EventValidator
+from itidigital.data_quality.event.cache import ShapeCachedEventValidator, shape_signature
+from itidigital.utils.schema.builder import SchemaBuilder
+from itidigital.utils.schema.fingerprint import event_fingerprint, layout_fingerprint, schema_fingerprint
+from itidigital.sql.athena.hive.table import column_type
+from itidigital.sql.athena.tools.hive_table_creator import HiveTableCreator
+
+
+def _nested_event(depth: int) -> dict:
+    """Builds an event with one object field per nesting level"""
+    event = {"leaf": "value"}
+
+    for level in range(depth):
+        event = {f"level_{level}": event}
+
+    return event
+
+
+class TestWalk:
+    """Test class for `walk`"""
+
+    @pytest.fixture
+    def tree(self) -> dict:
+        """Fixture for a nested tree example"""
+        return {"a": {"b": {}, "c": {"d": {}}}, "e": {}}
+
+    def test_walk_should_works_as_expected(self, tree: dict) -> None:
+        """Asserts that `walk` visits every node in pre-order, keeping siblings order"""
+        visited = []
+
+        def visit(node):
+            name, children = node
+            visited.append(name)
+            return list(children.items()) or None
+
+        walker.walk(roots=tree.items(), visit=visit)
+
+        assert visited == ['a', 'b', 'c', 'd', 'e']
+
+    def test_walk_should_raise_max_depth_exceeded_error(self, tree: dict) -> None:
+        """Asserts that `walk` raises an exception for trees deeper than `max_depth`"""
+        def visit(node):
+            return list(node[1].items())
+
+        walker.walk(roots=tree.items(), visit=visit, max_depth=3)
+
+        with pytest.raises(MaxDepthExceededError):
+            walker.walk(roots=tree.items(), visit=visit, max_depth=2)
+
+    def test_walk_should_handle_trees_deeper_than_recursion_limit(self) -> None:
+        """Asserts that `walk` visits trees nested deeper than the interpreter recursion limit"""
+        depth = 5000
+        visited = []
+
+        def visit(node):
+            visited.append(node)
+            return [node + 1] if node < depth else None
+
+        walker.walk(roots=[1], visit=visit, max_depth=depth)
+
+        assert len(visited) == depth
+
+
+class TestDeeplyNestedPayloads:
+    """Test class for event and schema trees nested hundreds of levels deep"""
+
+    @pytest.fixture
+    def depth(self) -> int:
+        """Fixture for a nesting depth that used to exceed the recursion limit"""
+        return 800
+
+    def test_deeply_nested_event_should_be_converted_to_hive_fields(self, depth: int) -> None:
+        """Asserts that a deeply nested event goes from raw payload down to hive fields"""
+        event = EventBuilder(config=_nested_event(depth)).construct()
+        schema = SchemaBuilder(config=event.json_schema).construct()
+        creator = HiveTableCreator()
+
+        fields = creator._map_columns(columns=creator.get_columns(schema))
+
+        for level in reversed(range(depth)):
+            assert fields[f"level_{level}"]["type"] == 'struct'
+            fields = fields[f"level_{level}"]["fields"]
+
+        assert fields == {"leaf": {"type": "string", "description": "leaf field of type string"}}
+
+    def test_deeply_nested_schema_should_be_fingerprinted_and_compared(self, depth: int) -> None:
+        """Asserts that deeply nested events and schemas get fingerprints, and events are validated"""
+        raw_event = _nested_event(depth)
+        schema = SchemaBuilder(config=EventBuilder(config=raw_event).construct().json_schema).construct()
+        other_schema = SchemaBuilder(config=EventBuilder(config=raw_event).construct().json_schema).construct()
+        invalid_event = EventBuilder(config=_nested_event(depth - 1)).construct()
+
+        assert event_fingerprint(raw_event) == schema_fingerprint(schema)
+        assert layout_fingerprint(schema) == layout_fingerprint(other_schema)
+        assert schema == other_schema
+        assert EventValidator(schema=schema).is_valid(EventBuilder(config=raw_event).construct())
+        assert not EventValidator(schema=schema).is_valid(invalid_event)
+
+    def test_deeply_nested_event_should_get_shape_signature(self, depth: int) -> None:
+        """Asserts that deeply nested events get flat shape signatures that can be compared"""
+        raw_event = _nested_event(depth)
+        cached_validator = ShapeCachedEventValidator(validator=mock.MagicMock(is_valid=lambda event: True))
+
+        assert shape_signature(raw_event) == shape_signature(_nested_event(depth))
+        assert cached_validator.is_valid(raw_event) and cached_validator.is_valid(_nested_event(depth))
+        assert cached_validator.stats.hits == 1
+
+    def test_deeply_nested_arrays_should_get_items_and_column_types(self, depth: int) -> None:
+        """Asserts that items of deeply nested arrays are inferred and formatted as hive column types"""
+        values = [1]
+
+        for _ in range(depth):
+            values = [values]
+
+        items = Event._get_items(values=values)
+
+        for _ in range(depth):
+            assert items["type"] == 'array'
+            items = items["items"]
+
+        assert items == {"type": "integer"}
+
+        # each level is a struct and an array
+        attr = {"type": "bigint"}
+
+        for _ in range(depth // 2):
+            attr = {"type": "struct", "fields": {"nested": {"type": "array", "items": attr}}}
+
+        assert column_type(attr) == "struct<nested:array<" * (depth // 2) + "bigint" + ">>" * (depth // 2)
+
+    def test_too_deeply_nested_event_should_raise_max_depth_exceeded_error(self) -> None:
+        """Asserts that events nested deeper than the default maximum depth raise an exception"""
+        with pytest.raises(MaxDepthExceededError):
+            EventBuilder(config=_nested_event(walker.DEFAULT_MAX_DEPTH + 1)).construct()
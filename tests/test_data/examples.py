@@ -129,4 +129,90 @@ TABLE_CONFIG = {
         ),
         "stored_as": FileFormat.PARQUET,
         "table_properties": {"foo": "bar", "prop_name": "prop_value"}
-    }
\ No newline at end of file
+    }
+EXAMPLE_ARRAY_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema",
+    "$id": "http://example.com/example.json",
+    "type": "object",
+    "title": "The root schema",
+    "description": "The root schema comprises the entire JSON document.",
+    "required": [
+        "eid",
+        "tags",
+        "contacts",
+        "matrix",
+        "extra"
+    ],
+    "properties": {
+        "eid": {
+            "$id": "#/properties/eid",
+            "type": "string",
+            "title": "The eid schema",
+            "description": "An explanation about the purpose of this instance.",
+            "examples": [
+                "3e628a05-7a4a-4bf3-8770-084c11601a12"
+            ]
+        },
+        "tags": {
+            "$id": "#/properties/tags",
+            "type": "array",
+            "title": "The tags schema",
+            "description": "An explanation about the purpose of this instance.",
+            "items": {
+                "$id": "#/properties/tags/items",
+                "type": "string"
+            }
+        },
+        "contacts": {
+            "$id": "#/properties/contacts",
+            "type": "array",
+            "title": "The contacts schema",
+            "description": "An explanation about the purpose of this instance.",
+            "items": {
+                "$id": "#/properties/contacts/items",
+                "type": "object",
+                "properties": {
+                    "kind": {
+                        "$id": "#/properties/contacts/items/properties/kind",
+                        "type": "string"
+                    },
+                    "value": {
+                        "$id": "#/properties/contacts/items/properties/value",
+                        "type": "string"
+                    }
+                }
+            }
+        },
+        "matrix": {
+            "$id": "#/properties/matrix",
+            "type": "array",
+            "title": "The matrix schema",
+            "description": "An explanation about the purpose of this instance.",
+            "items": {
+                "$id": "#/properties/matrix/items",
+                "type": "array",
+                "items": {
+                    "$id": "#/properties/matrix/items/items",
+                    "type": "integer"
+                }
+            }
+        },
+        "extra": {
+            "$id": "#/properties/extra",
+            "type": "array",
+            "title": "The extra schema",
+            "description": "An explanation about the purpose of this instance."
+        }
+    }
+}
+
+EXAMPLE_ARRAY_EVENT = {
+    "eid": "3e628a05-7a4a-4bf3-8770-084c11601a12",
+    "tags": ["new", "vip"],
+    "contacts": [
+        {"kind": "email", "value": "joseph@example.com"},
+        {"kind": "phone", "value": "555-0100"}
+    ],
+    "matrix": [[1, 2], [3]],
+    "extra": [1, "two", None]
+}